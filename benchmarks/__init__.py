@@ -0,0 +1 @@
+"""Performance benchmarks. Run with `python -m benchmarks.<name>` from the repo root."""
@@ -0,0 +1,94 @@
+"""Requests per second of a /groups-sized payload through each response path.
+
+Runs in process against a synthetic payload shaped like GET /groups, so no
+database is needed:
+
+    python -m benchmarks.api_responses --groups 50 --articles 8 --requests 2000
+
+"default" is the previous path: the route returns a dict that FastAPI runs
+through jsonable_encoder and the stdlib JSON encoder on every request.
+"cached" serves the pre-serialized bytes from ResponseCache, and "cached+gzip"
+the precompressed variant.
+"""
+import argparse
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from services.api.src.infrastructure.api.response_cache import InMemoryCacheBackend, ResponseCache, dumps
+
+
+def _payload(groups: int, articles: int) -> dict:
+    return {
+        "groups": [
+            {
+                "id": f"group-{g}",
+                "created_at": "2025-03-01T08:00:00",
+                "articles": [
+                    {
+                        "id": f"article-{g}-{a}",
+                        "title": f"Titular de la noticia número {a} sobre la historia {g}",
+                        "link": f"https://example.com/{g}/{a}",
+                        "description": "Descripción breve de la noticia con algo de contexto. " * 3,
+                        "published": "2025-03-01T09:30:00",
+                        "source": "El País",
+                        "bias": "left",
+                        "sensationalism_score": 0.42,
+                        "sensationalism_explanation": "Contiene 2 adjetivos valorativos y 3 afirmaciones.",
+                    }
+                    for a in range(articles)
+                ],
+            }
+            for g in range(groups)
+        ],
+        "next_cursor": None,
+    }
+
+
+def _requests_per_second(client: TestClient, headers: dict, count: int) -> float:
+    client.get("/groups", headers=headers)
+    started = time.perf_counter()
+    for _ in range(count):
+        client.get("/groups", headers=headers)
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=50)
+    parser.add_argument("--articles", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = _payload(args.groups, args.articles)
+    cache = ResponseCache(InMemoryCacheBackend(), lambda: "1", version_check_interval=3600)
+
+    default_app = FastAPI()
+    default_app.get("/groups")(lambda: payload)
+    cached_app = FastAPI()
+
+    @cached_app.get("/groups")
+    async def cached_groups(request: Request):
+        async def compute() -> dict:
+            return payload
+
+        return await cache.respond(request, compute)
+
+    body = dumps(payload)
+    print(f"groups={args.groups} articles/group={args.articles} body={len(body) / 1024:.0f} KiB")
+    identity = {"Accept-Encoding": "identity"}
+    runs = [
+        ("default", TestClient(default_app), identity),
+        ("cached", TestClient(cached_app), identity),
+        ("cached+gzip", TestClient(cached_app), {"Accept-Encoding": "gzip"}),
+    ]
+    baseline = None
+    for name, client, headers in runs:
+        rate = _requests_per_second(client, headers, args.requests)
+        baseline = baseline or rate
+        print(f"{name:<12} {rate:8.0f} req/s  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Storage size, decode time and group-assignment recall of quantized embeddings.
+
+Synthetic clustered embeddings stand in for group vectors, so the benchmark runs
+offline. Assignments (best group above the threshold, or none) made with
+decoded vectors are compared against full-precision assignments:
+
+    python -m benchmarks.embedding_quantization --groups 2000 --dimension 1536 --queries 500
+
+``--dimensions`` additionally truncates and re-normalizes vectors, which is what
+the text-embedding-3 ``dimensions`` parameter does. On synthetic data this only
+shows the mechanics; measure recall on real vectors before shortening them.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from libs.domain.entities.news_group import NewsGroup
+from libs.domain.services.embedding_codec import EmbeddingCodec
+from libs.domain.services.group_matcher import GroupMatcher
+from libs.domain.value_objects.topic_hash import TopicHash
+
+
+def _assignments(vectors: np.ndarray, queries: np.ndarray, threshold: float) -> list:
+    matcher = GroupMatcher([
+        NewsGroup.new(topic_hash=TopicHash.from_title(str(i)), embedding=vector)
+        for i, vector in enumerate(vectors)
+    ])
+    assigned = []
+    for query in queries:
+        match = matcher.best_match(query, threshold)
+        assigned.append(matcher.groups.index(match[0]) if match else None)
+    return assigned
+
+
+def _truncate(vectors: np.ndarray, dimensions: int) -> np.ndarray:
+    shortened = vectors[:, :dimensions]
+    return shortened / np.linalg.norm(shortened, axis=1, keepdims=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=2000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--noise", type=float, default=0.5)
+    parser.add_argument("--dimensions", type=int, nargs="*", default=[], help="also test these truncated sizes")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    centers = rng.normal(size=(max(args.groups // 5, 1), args.dimension))
+    groups = centers[rng.integers(0, len(centers), args.groups)] + args.noise * rng.normal(size=(args.groups, args.dimension))
+    queries = centers[rng.integers(0, len(centers), args.queries)] + args.noise * rng.normal(size=(args.queries, args.dimension))
+    groups = groups / np.linalg.norm(groups, axis=1, keepdims=True)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+    reference = _assignments(groups, queries, args.threshold)
+    json_rows = [json.dumps(vector.tolist()) for vector in groups]
+    started = time.perf_counter()
+    for row in json_rows:
+        json.loads(row)
+    json_decode = time.perf_counter() - started
+    json_bytes = sum(len(row) for row in json_rows) / len(json_rows)
+
+    print(f"{'storage':<18}{'bytes/row':>10}{'vs JSON':>9}{'decode ms':>11}{'recall':>9}")
+    print(f"{'json float64':<18}{json_bytes:>10.0f}{1:>9.1f}x{json_decode * 1e3:>10.1f}{1:>9.3f}")
+    for dimensions in [None, *args.dimensions]:
+        source = groups if dimensions is None else _truncate(groups, dimensions)
+        query_set = queries if dimensions is None else _truncate(queries, dimensions)
+        for precision in ("float32", "float16", "int8"):
+            codec = EmbeddingCodec(precision)
+            blobs = [codec.encode(vector) for vector in source]
+            started = time.perf_counter()
+            decoded = np.vstack([EmbeddingCodec.decode(blob) for blob in blobs])
+            decode = time.perf_counter() - started
+            assigned = _assignments(decoded, query_set, args.threshold)
+            recall = sum(a == b for a, b in zip(assigned, reference)) / len(reference)
+            size = sum(len(blob) for blob in blobs) / len(blobs)
+            label = precision if dimensions is None else f"{precision} @{dimensions}"
+            print(f"{label:<18}{size:>10.0f}{json_bytes / size:>9.1f}x{decode * 1e3:>10.1f}{recall:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
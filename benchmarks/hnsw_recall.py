@@ -0,0 +1,79 @@
+"""Recall and latency of HnswIndex against brute-force cosine similarity.
+
+Synthetic clustered embeddings stand in for group titles, so the benchmark runs
+offline:
+
+    python -m benchmarks.hnsw_recall --groups 20000 --dimension 256 --queries 200
+"""
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+
+from libs.domain.entities.news_group import NewsGroup
+from libs.domain.services.group_matcher import GroupMatcher
+from libs.domain.services.hnsw_index import HnswIndex
+from libs.domain.value_objects.topic_hash import TopicHash
+from services.ingest.src.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+
+
+def _clustered(rng: np.random.Generator, count: int, centers: np.ndarray, noise: float) -> np.ndarray:
+    picks = rng.integers(0, len(centers), count)
+    return centers[picks] + noise * rng.normal(size=(count, centers.shape[1]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--ef-search", type=int, default=64)
+    parser.add_argument("--python-checks", type=int, default=5,
+                        help="queries also verified with the pure-Python calculate_similarity loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(max(args.groups // 10, 1), args.dimension))
+    now = datetime.utcnow()
+    groups = [
+        NewsGroup.build(
+            id=NewsGroup.new(topic_hash=TopicHash.from_title(str(i))).id,
+            topic_hash=TopicHash.from_title(str(i)),
+            summary=None,
+            created_at=now,
+            embedding=vector.tolist(),
+        )
+        for i, vector in enumerate(_clustered(rng, args.groups, centers, 0.5))
+    ]
+    queries = _clustered(rng, args.queries, centers, 0.5).tolist()
+
+    started = time.perf_counter()
+    index = HnswIndex(groups, ef_search=args.ef_search)
+    build_seconds = time.perf_counter() - started
+    exact = GroupMatcher(groups)
+
+    # The vectorized matcher is the reference; spot-check it against calculate_similarity
+    similarity = OpenAIEmbeddingService(api_key="offline").calculate_similarity
+    for query in queries[:args.python_checks]:
+        expected = max(groups, key=lambda group: similarity(query, group.embedding))
+        assert exact.best_match(query, threshold=-1.0)[0].id == expected.id
+
+    started = time.perf_counter()
+    exact_ids = [exact.best_match(query, threshold=-1.0)[0].id for query in queries]
+    exact_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    started = time.perf_counter()
+    approx_ids = [index.best_match(query, threshold=-1.0)[0].id for query in queries]
+    approx_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    recall = sum(a == e for a, e in zip(approx_ids, exact_ids)) / len(queries)
+    print(f"groups={args.groups} dimension={args.dimension} queries={args.queries}")
+    print(f"HNSW build: {build_seconds:.1f}s")
+    print(f"Brute force: {exact_ms:.3f} ms/query")
+    print(f"HNSW:        {approx_ms:.3f} ms/query")
+    print(f"Recall@1:    {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Throughput and grouping agreement of LocalEmbeddingService against OpenAI embeddings.
+
+Both services embed the same titles; each set of vectors is then grouped with
+the same greedy rule ingest uses (join the most similar group above a threshold,
+else start a new one) and the two partitions are compared pairwise:
+
+    python -m benchmarks.local_embeddings --model-path models/multilingual-e5-small --input titles.txt
+    python -m benchmarks.local_embeddings --model-path models/... --limit 2000   # titles from DATABASE_URL
+
+Local models are calibrated differently, so the local threshold is a separate
+flag. Needs OPENAI_API_KEY for the reference vectors.
+"""
+import argparse
+import time
+from typing import Optional
+
+import numpy as np
+
+from libs.domain.services.embedding_service import EmbeddingService
+from services.ingest.src.infrastructure.services.local_embedding_service import LocalEmbeddingService
+from services.ingest.src.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+
+
+def _titles_from_database(limit: int) -> list[str]:
+    from sqlmodel import select
+
+    from services.ingest.src.infrastructure.database.db import get_session
+    from services.ingest.src.infrastructure.database.models import ArticleModel
+
+    with get_session() as session:
+        statement = select(ArticleModel.title).order_by(ArticleModel.published_at.desc()).limit(limit)
+        return list(session.exec(statement).all())
+
+
+def _embed(service: EmbeddingService, titles: list[str]) -> tuple[np.ndarray, float]:
+    started = time.perf_counter()
+    vectors = np.asarray(service.generate_embeddings(titles), dtype=np.float32)
+    return vectors, time.perf_counter() - started
+
+
+def greedy_groups(vectors: np.ndarray, threshold: float) -> np.ndarray:
+    """Assigns each vector to the most similar earlier group above the threshold."""
+    normalized = vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+    labels = np.empty(len(vectors), dtype=np.int64)
+    representatives: list[int] = []
+    for i, vector in enumerate(normalized):
+        if representatives:
+            similarities = normalized[representatives] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= threshold:
+                labels[i] = best
+                continue
+        labels[i] = len(representatives)
+        representatives.append(i)
+    return labels
+
+
+def pair_agreement(a: np.ndarray, b: np.ndarray) -> tuple[float, float]:
+    """Returns (Rand index, F1 of same-group pairs) between two partitions."""
+    same_a = a[:, None] == a[None, :]
+    same_b = b[:, None] == b[None, :]
+    upper = np.triu(np.ones_like(same_a, dtype=bool), k=1)
+    rand = float((same_a == same_b)[upper].mean()) if upper.any() else 1.0
+    both = int((same_a & same_b)[upper].sum())
+    predicted, expected = int(same_b[upper].sum()), int(same_a[upper].sum())
+    f1 = 2 * both / (predicted + expected) if predicted + expected else 1.0
+    return rand, f1
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", required=True)
+    parser.add_argument("--runtime", default="auto")
+    parser.add_argument("--input", help="file with one title per line instead of the database")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threshold", type=float, default=0.7, help="grouping threshold for OpenAI vectors")
+    parser.add_argument("--local-threshold", type=float, default=0.85, help="grouping threshold for local vectors")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            titles = [line.strip() for line in f if line.strip()][:args.limit]
+    else:
+        titles = _titles_from_database(args.limit)
+
+    local = LocalEmbeddingService(
+        args.model_path, backend=args.runtime, batch_size=args.batch_size, max_workers=args.workers
+    )
+    started = time.perf_counter()
+    local.generate_embedding(titles[0])
+    load_seconds = time.perf_counter() - started
+    local_vectors, local_seconds = _embed(local, titles)
+    openai_vectors, openai_seconds = _embed(OpenAIEmbeddingService(), titles)
+
+    rand, f1 = pair_agreement(
+        greedy_groups(openai_vectors, args.threshold),
+        greedy_groups(local_vectors, args.local_threshold),
+    )
+    print(f"titles                {len(titles)}")
+    print(f"local model load      {load_seconds:.2f} s")
+    print(f"local throughput      {len(titles) / local_seconds:,.0f} texts/s ({local_vectors.shape[1]} dims)")
+    print(f"openai throughput     {len(titles) / openai_seconds:,.0f} texts/s ({openai_vectors.shape[1]} dims)")
+    print(f"grouping Rand index   {rand:.3f}")
+    print(f"same-group pair F1    {f1:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Calibration of the local sensationalism pre-filter against stored LLM scores.
+
+For every article with an LLM score it reports how many the pre-filter would
+answer locally, how far those local scores are from the LLM, and whether they
+land in the same color band (low / medium / high) shown in the web UI:
+
+    python -m benchmarks.sensationalism_prefilter
+    python -m benchmarks.sensationalism_prefilter --input export.jsonl --sensational-above 0.5
+
+``--input`` takes JSON lines with ``title``, ``description`` and
+``sensationalism_score``; without it, scored articles are read from DATABASE_URL.
+"""
+import argparse
+import json
+import time
+from typing import Iterable, Optional
+
+from services.ingest.src.infrastructure.services.lexicon_news_analyzer import LexiconNewsAnalyzer, score_text
+
+BANDS = ((0.33, "low"), (0.66, "medium"), (1.0, "high"))
+
+
+def _band(score: float) -> str:
+    for upper, name in BANDS:
+        if score <= upper:
+            return name
+    return BANDS[-1][1]
+
+
+def _from_file(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _from_database(limit: Optional[int]) -> list[dict]:
+    from sqlmodel import select
+
+    from services.ingest.src.infrastructure.database.db import get_session
+    from services.ingest.src.infrastructure.database.models import ArticleModel
+
+    statement = select(ArticleModel).where(ArticleModel.sensationalism_score.is_not(None))
+    if limit:
+        statement = statement.limit(limit)
+    with get_session() as session:
+        return [
+            {
+                "title": article.title,
+                "description": article.description,
+                "sensationalism_score": article.sensationalism_score,
+            }
+            for article in session.exec(statement).all()
+            # Local scores are not a reference for calibrating themselves
+            if (article.analysis_metadata or {}).get("analyzer") != "lexicon"
+        ]
+
+
+def calibrate(articles: Iterable[dict], analyzer: LexiconNewsAnalyzer) -> dict:
+    """Compares local estimates with LLM scores; returns the summary metrics."""
+    total = local = same_band = 0
+    absolute_error = 0.0
+    confusion: dict[tuple[str, str], int] = {}
+    started = time.perf_counter()
+    for article in articles:
+        total += 1
+        estimate = score_text(article["title"], article.get("description") or "")
+        if not analyzer.is_confident(estimate):
+            continue
+        local += 1
+        reference = float(article["sensationalism_score"])
+        absolute_error += abs(estimate.score - reference)
+        key = (_band(reference), _band(estimate.score))
+        confusion[key] = confusion.get(key, 0) + 1
+        same_band += key[0] == key[1]
+    elapsed = time.perf_counter() - started
+    return {
+        "articles": total,
+        "local": local,
+        "escalation_rate": (total - local) / total if total else 0.0,
+        "local_mae": absolute_error / local if local else 0.0,
+        "local_band_agreement": same_band / local if local else 0.0,
+        "confusion": confusion,
+        "microseconds_per_article": elapsed / total * 1e6 if total else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="JSON lines file instead of the database")
+    parser.add_argument("--limit", type=int, help="max articles read from the database")
+    parser.add_argument("--neutral-below", type=float, default=0.0)
+    parser.add_argument("--sensational-above", type=float, default=0.6)
+    parser.add_argument("--min-words", type=int, default=12)
+    args = parser.parse_args()
+
+    articles = _from_file(args.input) if args.input else _from_database(args.limit)
+    analyzer = LexiconNewsAnalyzer(
+        fallback=None,
+        neutral_below=args.neutral_below,
+        sensational_above=args.sensational_above,
+        min_words=args.min_words,
+    )
+    report = calibrate(articles, analyzer)
+
+    print(f"articles            {report['articles']}")
+    print(f"answered locally    {report['local']}")
+    print(f"escalation rate     {report['escalation_rate']:.1%}")
+    print(f"local MAE           {report['local_mae']:.3f}")
+    print(f"band agreement      {report['local_band_agreement']:.1%}")
+    print(f"local scoring       {report['microseconds_per_article']:.1f} µs/article")
+    print("LLM band -> local band:")
+    for (reference, local), count in sorted(report["confusion"].items()):
+        print(f"  {reference:>6} -> {local:<6} {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Throughput and quality of the offline re-clustering on a synthetic corpus.
+
+Synthetic clustered embeddings with spread-out publication times stand in for a
+month of article titles, so the benchmark runs offline:
+
+    python -m benchmarks.threshold_clustering --articles 100000 --dimension 256 --max-gap-hours 48
+"""
+import argparse
+import time
+
+import numpy as np
+
+from libs.domain.services.threshold_clustering import cluster_by_threshold, clustering_quality
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--stories", type=int, default=20000)
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--max-gap-hours", type=float, default=48)
+    parser.add_argument("--block-size", type=int, default=512)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(args.stories, args.dimension)).astype(np.float32)
+    picks = rng.integers(0, args.stories, args.articles)
+    vectors = centers[picks] + 0.4 * rng.normal(size=(args.articles, args.dimension)).astype(np.float32)
+    # Each story is covered within a day of its own start time
+    starts = rng.uniform(0, args.days * 86400, args.stories)
+    timestamps = starts[picks] + rng.uniform(0, 86400, args.articles)
+
+    started = time.perf_counter()
+    labels = cluster_by_threshold(
+        vectors,
+        args.threshold,
+        timestamps=timestamps,
+        max_gap=args.max_gap_hours * 3600,
+        block_size=args.block_size,
+    )
+    cluster_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    quality = clustering_quality(vectors, labels.tolist(), args.threshold)
+    quality_seconds = time.perf_counter() - started
+
+    # Fraction of articles whose cluster is exactly their story
+    _, first = np.unique(picks, return_index=True)
+    story_of_label = dict(zip(labels[first].tolist(), picks[first].tolist()))
+    exact = np.mean([story_of_label.get(label) == story for label, story in zip(labels.tolist(), picks.tolist())])
+
+    print(f"articles={args.articles} dimension={args.dimension} stories={args.stories}")
+    print(f"Clustering: {cluster_seconds:.1f}s")
+    print(f"Quality:    {quality_seconds:.1f}s")
+    print(f"Result:     {quality.describe()}")
+    print(f"Articles in their story's cluster: {exact:.3f}")
+
+
+if __name__ == "__main__":
+    main()
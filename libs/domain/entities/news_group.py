@@ -1,11 +1,17 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence, Union
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from libs.domain.value_objects.topic_hash import TopicHash
 from libs.domain.errors.domain_error import InvalidDomainError
 
+# Centroids come back from storage and from add_member as float32 arrays; new
+# groups start from the embedding service's list
+Embedding = Union[list[float], np.ndarray]
+
 
 @dataclass(frozen=True)
 class NewsGroup:
@@ -13,11 +19,16 @@ class NewsGroup:
     topic_hash: TopicHash
     summary: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
-    embedding: Optional[list[float]] = field(default=None, compare=False, hash=False)
+    # Running centroid of the member articles' title embeddings
+    embedding: Optional[Embedding] = field(default=None, compare=False, hash=False)
+    member_count: int = field(default=0, compare=False, hash=False)
+    # Embedding model the centroid was computed with; None for groups stored before it was tracked
+    embedding_model: Optional[str] = field(default=None, compare=False, hash=False)
 
     def __post_init__(self) -> None:
         self._validate_id()
         self._validate_summary()
+        self._validate_member_count()
 
     @classmethod
     def new(
@@ -25,7 +36,8 @@ class NewsGroup:
         topic_hash: TopicHash,
         summary: Optional[str] = None,
         id: Optional[UUID] = None,
-        embedding: Optional[list[float]] = None,
+        embedding: Optional[Embedding] = None,
+        embedding_model: Optional[str] = None,
     ) -> "NewsGroup":
         if id is None:
             id = uuid4()
@@ -35,6 +47,9 @@ class NewsGroup:
             summary=summary,
             created_at=datetime.utcnow(),
             embedding=embedding,
+            # The embedding a group is created with is its first member's
+            member_count=1 if embedding is not None else 0,
+            embedding_model=embedding_model,
         )
 
     @classmethod
@@ -44,7 +59,9 @@ class NewsGroup:
         topic_hash: TopicHash,
         summary: Optional[str],
         created_at: datetime,
-        embedding: Optional[list[float]] = None,
+        embedding: Optional[Embedding] = None,
+        member_count: int = 0,
+        embedding_model: Optional[str] = None,
     ) -> "NewsGroup":
         return cls(
             id=id,
@@ -52,12 +69,39 @@ class NewsGroup:
             summary=summary,
             created_at=created_at,
             embedding=embedding,
+            member_count=member_count,
+            embedding_model=embedding_model,
         )
 
+    @property
+    def embedding_dimension(self) -> Optional[int]:
+        return len(self.embedding) if self.embedding is not None else None
+
+    def add_member(self, embedding: Sequence[float]) -> "NewsGroup":
+        """Returns the group with an article's embedding folded into its centroid.
+
+        The running mean is updated in O(d): ``c + (e - c) / (n + 1)``. The new
+        centroid is a float32 array, the form the index and storage consume.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self.embedding is None:
+            return replace(self, embedding=vector, member_count=1)
+        current = np.asarray(self.embedding, dtype=np.float32)
+        if current.shape != vector.shape:
+            raise InvalidDomainError("Embeddings must have the same dimension")
+        # Groups stored before member counts existed still hold one member's embedding
+        count = max(self.member_count, 1)
+        centroid = current + (vector - current) / (count + 1)
+        return replace(self, embedding=centroid, member_count=count + 1)
+
     def _validate_id(self) -> None:
         if not isinstance(self.id, UUID):
             raise InvalidDomainError("NewsGroup id must be a UUID")
 
+    def _validate_member_count(self) -> None:
+        if self.member_count < 0:
+            raise InvalidDomainError("NewsGroup member count cannot be negative")
+
     def _validate_summary(self) -> None:
         if self.summary and len(self.summary) > 2000:
             raise InvalidDomainError("NewsGroup summary must be less than 2000 characters")
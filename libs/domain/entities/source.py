@@ -12,6 +12,8 @@ class Source:
     name: str
     url: Optional[str]
     bias: Bias
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     def __post_init__(self) -> None:
         self._validate_id()
@@ -36,8 +38,21 @@ class Source:
         name: str,
         url: Optional[str],
         bias: Bias,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
     ) -> "Source":
-        return cls(id=id, name=name, url=url, bias=bias)
+        return cls(id=id, name=name, url=url, bias=bias, etag=etag, last_modified=last_modified)
+
+    def update_feed_validators(self, etag: Optional[str], last_modified: Optional[str]) -> "Source":
+        """Returns a copy carrying the HTTP cache validators of the latest feed fetch."""
+        return self.__class__(
+            id=self.id,
+            name=self.name,
+            url=self.url,
+            bias=self.bias,
+            etag=etag,
+            last_modified=last_modified,
+        )
 
     def _validate_id(self) -> None:
         if not isinstance(self.id, UUID):
@@ -46,4 +61,3 @@ class Source:
     def _validate_name(self) -> None:
         if not self.name or len(self.name) > 200:
             raise InvalidDomainError("Source name must be between 1 and 200 characters")
-
@@ -11,6 +11,16 @@ class ArticleRepository(ABC):
         """Saves or updates an article."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, articles: list[Article], commit: bool = True) -> int:
+        """Inserts many articles in one transaction, skipping links that already exist.
+
+        With ``commit=False`` the insert joins the current transaction and is
+        committed with whatever is saved next. Returns the number of articles
+        actually inserted.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_id(self, article_id: UUID) -> Optional[Article]:
         """Finds an article by its ID."""
@@ -21,6 +31,11 @@ class ArticleRepository(ABC):
         """Finds an article by its link."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_existing_links(self, links: list[str]) -> set[str]:
+        """Returns the subset of the given links that are already stored."""
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_source_id(self, source_id: UUID, limit: int = 20) -> list[Article]:
         """Finds articles by source ID."""
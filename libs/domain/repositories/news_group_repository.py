@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -8,8 +9,31 @@ from libs.domain.value_objects.topic_hash import TopicHash
 
 class NewsGroupRepository(ABC):
     @abstractmethod
-    async def save(self, group: NewsGroup) -> None:
-        """Saves or updates a news group."""
+    async def save(self, group: NewsGroup, commit: bool = True) -> None:
+        """Saves or updates a news group.
+
+        With ``commit=False`` the group is only flushed, so it can be referenced
+        and found in the current transaction but is discarded on rollback.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_centroids(self, groups: list[NewsGroup], commit: bool = True) -> None:
+        """Persists the centroid embedding and member count of existing groups.
+
+        With ``commit=False`` the updates join the current transaction and are
+        committed together with whatever is saved next (e.g. the articles that
+        moved the centroids).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh_stats(self, group_ids: list[UUID], commit: bool = True) -> None:
+        """Recomputes the stored summary (article count, sources, bias mix, recency,
+        mean sensationalism) of the given groups from their articles.
+
+        With ``commit=False`` the rows join the current transaction.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -32,3 +56,16 @@ class NewsGroupRepository(ABC):
         """Finds news groups created in the last N days."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_most_similar(
+        self,
+        embedding: list[float],
+        since: datetime,
+        threshold: float,
+        k: int = 1,
+        model: Optional[str] = None,
+    ) -> list[tuple[NewsGroup, float]]:
+        """Finds up to k groups created since a date whose cosine similarity to the
+        embedding reaches the threshold, most similar first. Only groups of the
+        embedding's dimension, and of ``model`` when given, are considered."""
+        raise NotImplementedError
@@ -7,8 +7,12 @@ from libs.domain.entities.source import Source
 
 class SourceRepository(ABC):
     @abstractmethod
-    async def save(self, source: Source) -> None:
-        """Saves or updates a source."""
+    async def save(self, source: Source, commit: bool = True) -> None:
+        """Saves or updates a source.
+
+        With ``commit=False`` the write joins the current transaction and is
+        committed with whatever is saved next.
+        """
         raise NotImplementedError
 
     @abstractmethod
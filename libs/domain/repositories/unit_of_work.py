@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """Commits or discards the writes staged through the repositories sharing it."""
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commits every staged write as one transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discards every staged write."""
+        raise NotImplementedError
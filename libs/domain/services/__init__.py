@@ -1,5 +1,8 @@
 """Domain services for embeddings and other cross-cutting concerns."""
+from libs.domain.services.embedding_codec import EmbeddingCodec
 from libs.domain.services.embedding_service import EmbeddingService
+from libs.domain.services.group_matcher import GroupIndex, GroupIndexFactory, GroupMatcher
+from libs.domain.services.hnsw_index import HnswIndex
 
-__all__ = ["EmbeddingService"]
+__all__ = ["EmbeddingCodec", "EmbeddingService", "GroupIndex", "GroupIndexFactory", "GroupMatcher", "HnswIndex"]
 
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 
 class NewsAnalyzer(ABC):
     """Interface for analyzing news articles."""
@@ -15,8 +16,26 @@ class NewsAnalyzer(ABC):
 
         Returns:
             A tuple containing:
-            - score (float): The sensationalism index (0.0 - 1.0)
+            - score (float): The sensationalism index (0.0 - 1.0), or None if the
+              article could not be scored this time (e.g. rate limited)
             - explanation (str): Brief explanation
             - metadata (dict): Raw analysis data (counts, etc.)
         """
         pass
+
+    async def analyze_sensationalism_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[float, str, Dict]]:
+        """
+        Analyzes the sensationalism of many articles.
+
+        The default implementation analyzes each article concurrently; analyzers
+        that can score several articles per request should override it.
+
+        Args:
+            items: (title, content) pairs.
+
+        Returns:
+            One (score, explanation, metadata) tuple per item, in input order.
+        """
+        return list(await asyncio.gather(*(
+            self.analyze_sensationalism(title, content) for title, content in items
+        )))
@@ -0,0 +1,55 @@
+"""Compact binary encoding of embeddings with optional quantization."""
+import struct
+from typing import Sequence
+
+import numpy as np
+
+# Header: precision code (uint8), dimension (uint32), scale (float32), little endian
+_HEADER = struct.Struct("<BIf")
+_PRECISIONS = {"float32": 0, "float16": 1, "int8": 2}
+_DTYPES = {0: np.dtype("<f4"), 1: np.dtype("<f2"), 2: np.dtype("i1")}
+
+
+class EmbeddingCodec:
+    """Encodes embeddings as self-describing byte strings.
+
+    ``float16`` halves the size of a float32 vector; ``int8`` quarters it using a
+    per-vector scale (``max(|x|) / 127``). Either is a small fraction of the
+    same vector serialized as JSON. Every blob carries its precision, so any
+    codec instance can decode blobs written with another precision.
+    """
+
+    def __init__(self, precision: str = "float16"):
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Unknown embedding precision: {precision}")
+        self._precision = precision
+
+    @property
+    def precision(self) -> str:
+        return self._precision
+
+    def encode(self, embedding: Sequence[float]) -> bytes:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1:
+            raise ValueError("Embedding must be one-dimensional")
+        code = _PRECISIONS[self._precision]
+        scale = 1.0
+        if self._precision == "int8":
+            peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+            scale = peak / 127.0 if peak > 0.0 else 1.0
+            payload = np.clip(np.rint(vector / scale), -127, 127).astype(_DTYPES[code])
+        else:
+            payload = vector.astype(_DTYPES[code])
+        return _HEADER.pack(code, vector.shape[0], scale) + payload.tobytes()
+
+    @staticmethod
+    def decode(blob: bytes) -> np.ndarray:
+        """Decodes a blob straight into a float32 NumPy vector."""
+        code, dimension, scale = _HEADER.unpack_from(blob)
+        if code not in _DTYPES:
+            raise ValueError(f"Unknown embedding precision code: {code}")
+        payload = np.frombuffer(blob, dtype=_DTYPES[code], count=dimension, offset=_HEADER.size)
+        vector = payload.astype(np.float32)
+        if code == _PRECISIONS["int8"]:
+            vector *= scale
+        return vector
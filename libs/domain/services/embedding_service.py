@@ -19,6 +19,19 @@ class EmbeddingService(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embedding vectors for many texts in as few requests as possible.
+        
+        Args:
+            texts: Texts to generate embeddings for.
+            
+        Returns:
+            One embedding vector per input text, in the same order as the input.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
         """
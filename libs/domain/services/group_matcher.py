@@ -0,0 +1,181 @@
+"""Vectorized cosine-similarity matching of embeddings against news groups."""
+from datetime import datetime
+from typing import Optional, Protocol, Sequence
+
+import numpy as np
+
+from libs.domain.entities.news_group import NewsGroup
+
+
+class GroupIndex(Protocol):
+    """In-memory index of recent groups that ingest matches new articles against."""
+
+    @property
+    def groups(self) -> list[NewsGroup]: ...
+
+    def __len__(self) -> int: ...
+
+    def add(self, group: NewsGroup) -> None: ...
+
+    def update(self, group: NewsGroup) -> None: ...
+
+    def remove_created_before(self, cutoff: datetime) -> int: ...
+
+    def best_match(self, embedding: Sequence[float], threshold: float) -> Optional[tuple[NewsGroup, float]]: ...
+
+    def most_similar(self, embedding: Sequence[float], threshold: float, k: int) -> list[tuple[NewsGroup, float]]: ...
+
+
+class GroupIndexFactory(Protocol):
+    """Builds a GroupIndex that only holds groups of one embedding dimension and model."""
+
+    def __call__(
+        self,
+        groups: Sequence[NewsGroup],
+        dimension: Optional[int] = None,
+        model: Optional[str] = None,
+    ) -> GroupIndex: ...
+
+
+class GroupMatcher:
+    """Holds group embeddings as a pre-normalized float32 matrix.
+
+    Finding the most similar group is a single matrix-vector product plus an
+    argmax instead of a Python loop over every group. Rows live in a buffer that
+    grows geometrically, so adding a group is amortized O(1).
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[NewsGroup] = (),
+        dimension: Optional[int] = None,
+        model: Optional[str] = None,
+    ):
+        """
+        Args:
+            groups: Groups to index; those without embedding are ignored.
+            dimension: Embedding size to accept. Defaults to the first indexed group's.
+            model: Embedding model to accept. Groups computed with another model, or
+                of another dimension, are skipped rather than compared across spaces.
+        """
+        self._dimension = dimension or 0
+        self._model = model
+        self._groups: list[NewsGroup] = []
+        rows: list[Sequence[float]] = []
+        for group in groups:
+            if not self._accepts(group):
+                continue
+            if not self._dimension:
+                self._dimension = len(group.embedding)
+            self._groups.append(group)
+            rows.append(group.embedding)
+
+        if rows:
+            self._buffer = self._normalize(np.asarray(rows, dtype=np.float32))
+        else:
+            self._buffer = np.empty((0, self._dimension), dtype=np.float32)
+        # The live rows; a view of the buffer's first len(groups) rows
+        self._matrix = self._buffer
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @property
+    def groups(self) -> list[NewsGroup]:
+        return list(self._groups)
+
+    def add(self, group: NewsGroup) -> None:
+        """Adds a group to the matrix; groups that don't fit or are already present are ignored."""
+        if not self._accepts(group) or any(existing.id == group.id for existing in self._groups):
+            return
+        row = self._normalize(np.asarray([group.embedding], dtype=np.float32))[0]
+        size = len(self._groups)
+        if not size:
+            self._dimension = len(row)
+        if size == len(self._buffer):
+            grown = np.empty((max(2 * size, 16), self._dimension), dtype=np.float32)
+            grown[:size] = self._matrix
+            self._buffer = grown
+        self._buffer[size] = row
+        self._matrix = self._buffer[:size + 1]
+        self._groups.append(group)
+
+    def update(self, group: NewsGroup) -> None:
+        """Replaces a group's embedding (e.g. a moved centroid), adding the group if unknown."""
+        if not self._accepts(group):
+            return
+        for i, existing in enumerate(self._groups):
+            if existing.id == group.id:
+                row = self._normalize(np.asarray([group.embedding], dtype=np.float32))
+                self._matrix[i] = row[0]
+                self._groups[i] = group
+                return
+        self.add(group)
+
+    def remove_created_before(self, cutoff: datetime) -> int:
+        """Drops groups created before the cutoff and returns how many were removed."""
+        keep = [i for i, group in enumerate(self._groups) if group.created_at >= cutoff]
+        removed = len(self._groups) - len(keep)
+        if removed:
+            self._groups = [self._groups[i] for i in keep]
+            self._buffer = self._matrix = self._matrix[keep]
+        return removed
+
+    def best_match(self, embedding: Sequence[float], threshold: float) -> Optional[tuple[NewsGroup, float]]:
+        """Returns the most similar group and its similarity if it reaches the threshold."""
+        if not self._groups or len(embedding) != self._dimension:
+            return None
+        query = self._normalize(np.asarray([embedding], dtype=np.float32))[0]
+        similarities = self._matrix @ query
+        index = int(np.argmax(similarities))
+        similarity = float(similarities[index])
+        if similarity < threshold:
+            return None
+        return self._groups[index], similarity
+
+    def most_similar(self, embedding: Sequence[float], threshold: float, k: int) -> list[tuple[NewsGroup, float]]:
+        """Returns up to k groups reaching the threshold, most similar first."""
+        if not self._groups or k < 1 or len(embedding) != self._dimension:
+            return []
+        query = self._normalize(np.asarray([embedding], dtype=np.float32))[0]
+        similarities = self._matrix @ query
+        k = min(k, len(self._groups))
+        candidates = np.argpartition(-similarities, k - 1)[:k]
+        ranked = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        return [
+            (self._groups[i], float(similarities[i]))
+            for i in ranked
+            if similarities[i] >= threshold
+        ]
+
+    def score_many(self, embeddings: Sequence[Sequence[float]]) -> tuple[np.ndarray, np.ndarray]:
+        """Scores many embeddings against every group at once.
+
+        Returns two arrays with one entry per input embedding: the index of the
+        best group (into ``groups``, -1 if there are no groups of the embeddings'
+        dimension) and its similarity.
+        """
+        if len(embeddings) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        queries = self._normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+        if not self._groups or queries.shape[1] != self._dimension:
+            return np.full(len(queries), -1, dtype=np.int64), np.zeros(len(queries), dtype=np.float32)
+        similarities = queries @ self._matrix.T
+        indices = np.argmax(similarities, axis=1)
+        return indices, similarities[np.arange(len(queries)), indices]
+
+    def _accepts(self, group: NewsGroup) -> bool:
+        """Whether the group's embedding lives in the same space as the index."""
+        if group.embedding is None:
+            return False
+        if self._dimension and len(group.embedding) != self._dimension:
+            return False
+        # Groups stored before the model was tracked are only checked by dimension
+        return self._model is None or group.embedding_model in (None, self._model)
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero so they never match anything
+        norms[norms == 0.0] = 1.0
+        return matrix / norms
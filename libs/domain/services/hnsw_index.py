@@ -0,0 +1,322 @@
+"""Approximate nearest-neighbour group matching with an HNSW graph built on NumPy."""
+import heapq
+import json
+import math
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from libs.domain.entities.news_group import NewsGroup
+from libs.domain.value_objects.topic_hash import TopicHash
+
+
+class HnswIndex:
+    """Hierarchical Navigable Small World index over news group embeddings.
+
+    Implements the same ``GroupIndex`` protocol as ``GroupMatcher``. Built and
+    searched in pure Python, it is not faster than GroupMatcher's vectorised
+    brute force at the sizes ingest keeps in memory, and building it costs
+    seconds to minutes, so ingest does not use it; benchmarks/hnsw_recall.py
+    compares the two.
+
+    Deletes are tombstones: removed groups are still traversed as graph hops but
+    never returned. The graph is rebuilt once tombstones outnumber live nodes.
+    Like ``GroupMatcher``, groups of another dimension or embedding model are
+    skipped, and queries of another dimension match nothing.
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[NewsGroup] = (),
+        dimension: Optional[int] = None,
+        model: Optional[str] = None,
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 64,
+        seed: int = 42,
+    ):
+        self._m = m
+        self._max_links = [2 * m]  # level 0 is denser; higher levels use m
+        self._ef_construction = ef_construction
+        self._ef_search = ef_search
+        self._level_mult = 1.0 / math.log(m)
+        self._rng = np.random.default_rng(seed)
+        self._model = model
+        self._reset(dimension or 0)
+
+        for group in groups:
+            self.add(group)
+
+    def _reset(self, dimension: int = 0) -> None:
+        self._dimension = dimension
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._groups: list[NewsGroup] = []
+        self._links: list[list[list[int]]] = []  # node -> level -> neighbours
+        self._deleted: set[int] = set()
+        self._positions: dict[UUID, int] = {}
+        self._entry_point: Optional[int] = None
+        self._top_level = -1
+
+    def __len__(self) -> int:
+        return len(self._groups) - len(self._deleted)
+
+    @property
+    def groups(self) -> list[NewsGroup]:
+        return [group for i, group in enumerate(self._groups) if i not in self._deleted]
+
+    def add(self, group: NewsGroup) -> None:
+        """Inserts a group; groups that don't fit or are already present are ignored."""
+        if not self._accepts(group) or group.id in self._positions:
+            return
+        vector = self._normalize(np.asarray(group.embedding, dtype=np.float32))
+        if not self._groups:
+            self._dimension = vector.shape[0]
+            self._vectors = np.empty((16, self._dimension), dtype=np.float32)
+
+        node = len(self._groups)
+        if node == self._vectors.shape[0]:
+            # Grow geometrically so inserts stay amortized O(d)
+            grown = np.empty((2 * node, self._dimension), dtype=np.float32)
+            grown[:node] = self._vectors[:node]
+            self._vectors = grown
+        self._vectors[node] = vector
+        self._groups.append(group)
+        self._positions[group.id] = node
+
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_mult)
+        self._links.append([[] for _ in range(level + 1)])
+
+        if self._entry_point is None:
+            self._entry_point, self._top_level = node, level
+            return
+
+        entry = self._entry_point
+        for layer in range(self._top_level, level, -1):
+            entry = self._search_layer(vector, [entry], 1, layer)[0][1]
+
+        entries = [entry]
+        for layer in range(min(level, self._top_level), -1, -1):
+            candidates = self._search_layer(vector, entries, self._ef_construction, layer)
+            neighbours = [n for _, n in candidates[:self._m]]
+            self._links[node][layer] = list(neighbours)
+            for neighbour in neighbours:
+                self._connect(neighbour, node, layer)
+            entries = [n for _, n in candidates]
+
+        if level > self._top_level:
+            self._entry_point, self._top_level = node, level
+
+    def update(self, group: NewsGroup) -> None:
+        """Replaces a group's embedding (e.g. a moved centroid), adding the group if unknown.
+
+        The vector is swapped in place and the node keeps its links: centroids move
+        by small steps, so the neighbourhood stays a good approximation.
+        """
+        if not self._accepts(group):
+            return
+        node = self._positions.get(group.id)
+        if node is None:
+            self.add(group)
+            return
+        if node in self._deleted:
+            return
+        self._vectors[node] = self._normalize(np.asarray(group.embedding, dtype=np.float32))
+        self._groups[node] = group
+
+    def remove_created_before(self, cutoff: datetime) -> int:
+        """Drops groups created before the cutoff and returns how many were removed."""
+        removed = 0
+        for i, group in enumerate(self._groups):
+            if i not in self._deleted and group.created_at < cutoff:
+                self._deleted.add(i)
+                removed += 1
+        if self._deleted and len(self._deleted) > len(self):
+            self._rebuild()
+        return removed
+
+    def best_match(self, embedding: Sequence[float], threshold: float) -> Optional[tuple[NewsGroup, float]]:
+        """Returns the (approximately) most similar group if it reaches the threshold."""
+        matches = self.most_similar(embedding, threshold, k=1)
+        return matches[0] if matches else None
+
+    def most_similar(self, embedding: Sequence[float], threshold: float, k: int) -> list[tuple[NewsGroup, float]]:
+        """Returns up to k groups reaching the threshold, most similar first."""
+        if self._entry_point is None or k < 1 or not len(self) or len(embedding) != self._dimension:
+            return []
+        query = self._normalize(np.asarray(embedding, dtype=np.float32))
+
+        entry = self._entry_point
+        for layer in range(self._top_level, 0, -1):
+            entry = self._search_layer(query, [entry], 1, layer)[0][1]
+        # Over-fetch so tombstoned nodes don't starve the result
+        ef = max(self._ef_search, k) + len(self._deleted)
+        candidates = self._search_layer(query, [entry], ef, 0)
+
+        matches = []
+        for distance, node in candidates:
+            if node in self._deleted:
+                continue
+            similarity = 1.0 - distance
+            if similarity < threshold:
+                break
+            matches.append((self._groups[node], similarity))
+            if len(matches) == k:
+                break
+        return matches
+
+    def save(self, path: str) -> None:
+        """Writes the index (vectors, graph and group metadata) to a .npz file."""
+        size = len(self._groups)
+        link_counts, flat_links = [], []
+        for node_links in self._links:
+            link_counts.append(len(node_links))
+            for layer_links in node_links:
+                link_counts.append(len(layer_links))
+                flat_links.extend(layer_links)
+        groups = [
+            {
+                "id": str(group.id),
+                "topic_hash": group.topic_hash.value,
+                "summary": group.summary,
+                "created_at": group.created_at.isoformat(),
+                "member_count": group.member_count,
+                "embedding_model": group.embedding_model,
+            }
+            for group in self._groups
+        ]
+        params = {
+            "model": self._model,
+            "m": self._m,
+            "ef_construction": self._ef_construction,
+            "ef_search": self._ef_search,
+            "entry_point": self._entry_point,
+            "top_level": self._top_level,
+            "deleted": sorted(self._deleted),
+            "groups": groups,
+        }
+        # The graph searches unit vectors, but groups keep their raw centroids so
+        # add_member keeps averaging in the same space after a reload
+        embeddings = np.zeros((size, self._dimension), dtype=np.float32)
+        for node, group in enumerate(self._groups):
+            embeddings[node] = np.asarray(group.embedding, dtype=np.float32)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                vectors=self._vectors[:size],
+                embeddings=embeddings,
+                link_counts=np.asarray(link_counts, dtype=np.int32),
+                links=np.asarray(flat_links, dtype=np.int32),
+                params=np.frombuffer(json.dumps(params).encode("utf-8"), dtype=np.uint8),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "HnswIndex":
+        """Restores an index written by ``save``."""
+        with np.load(path) as data:
+            params = json.loads(data["params"].tobytes().decode("utf-8"))
+            vectors = data["vectors"]
+            # Indexes saved before raw embeddings were stored only have the unit vectors
+            embeddings = data["embeddings"] if "embeddings" in data.files else vectors
+            link_counts = data["link_counts"].tolist()
+            flat_links = data["links"].tolist()
+
+        index = cls(
+            model=params.get("model"),
+            m=params["m"],
+            ef_construction=params["ef_construction"],
+            ef_search=params["ef_search"],
+        )
+        index._dimension = vectors.shape[1] if len(vectors) else 0
+        index._vectors = vectors.copy()
+        cursor = offset = 0
+        for _ in range(len(vectors)):
+            levels = link_counts[cursor]
+            cursor += 1
+            node_links = []
+            for _ in range(levels):
+                count = link_counts[cursor]
+                cursor += 1
+                node_links.append(flat_links[offset:offset + count])
+                offset += count
+            index._links.append(node_links)
+        for node, group in enumerate(params["groups"]):
+            restored = NewsGroup.build(
+                id=UUID(group["id"]),
+                topic_hash=TopicHash(value=group["topic_hash"]),
+                summary=group["summary"],
+                created_at=datetime.fromisoformat(group["created_at"]),
+                embedding=embeddings[node].tolist(),
+                member_count=group.get("member_count", 0),
+                embedding_model=group.get("embedding_model"),
+            )
+            index._groups.append(restored)
+            index._positions[restored.id] = node
+        index._deleted = set(params["deleted"])
+        index._entry_point = params["entry_point"]
+        index._top_level = params["top_level"]
+        return index
+
+    def _search_layer(self, query: np.ndarray, entries: list[int], ef: int, layer: int) -> list[tuple[float, int]]:
+        """Best-first search of one layer; returns (distance, node) pairs sorted by distance."""
+        visited = set(entries)
+        distances = 1.0 - self._vectors[entries] @ query
+        candidates = [(float(d), n) for d, n in zip(distances, entries)]
+        heapq.heapify(candidates)
+        # Max-heap (negated distances) holding the ef best results so far
+        results = [(-d, n) for d, n in candidates]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            distance, node = heapq.heappop(candidates)
+            if distance > -results[0][0] and len(results) >= ef:
+                break
+            links = self._links[node]
+            neighbours = [n for n in links[layer] if n not in visited] if layer < len(links) else []
+            if not neighbours:
+                continue
+            visited.update(neighbours)
+            neighbour_distances = 1.0 - self._vectors[neighbours] @ query
+            for d, n in zip(neighbour_distances.tolist(), neighbours):
+                if len(results) < ef or d < -results[0][0]:
+                    heapq.heappush(candidates, (d, n))
+                    heapq.heappush(results, (-d, n))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+
+        return sorted((-d, n) for d, n in results)
+
+    def _connect(self, node: int, neighbour: int, layer: int) -> None:
+        """Adds a link and prunes the node's list to its closest neighbours if needed."""
+        links = self._links[node][layer]
+        links.append(neighbour)
+        max_links = self._max_links[0] if layer == 0 else self._m
+        if len(links) > max_links:
+            similarities = self._vectors[links] @ self._vectors[node]
+            keep = np.argsort(-similarities, kind="stable")[:max_links]
+            self._links[node][layer] = [links[i] for i in keep]
+
+    def _rebuild(self) -> None:
+        """Rebuilds the graph from live groups, dropping tombstones."""
+        live = self.groups
+        self._reset(self._dimension)
+        for group in live:
+            self.add(group)
+
+    def _accepts(self, group: NewsGroup) -> bool:
+        """Whether the group's embedding lives in the same space as the index."""
+        if group.embedding is None:
+            return False
+        if self._dimension and len(group.embedding) != self._dimension:
+            return False
+        # Groups stored before the model was tracked are only checked by dimension
+        return self._model is None or group.embedding_model in (None, self._model)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0.0 else vector
+
@@ -0,0 +1,166 @@
+"""Order-independent clustering of embeddings with a similarity threshold graph."""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def connected_components(size: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Labels the connected components of an undirected graph given as edge arrays.
+
+    Vectorized hook-and-compress: every round hooks the larger root of each edge
+    onto the smaller one, then compresses paths by pointer jumping. Labels are
+    renumbered to 0..k-1 in order of each component's smallest node.
+    """
+    parent = np.arange(size)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    while len(sources):
+        root_a, root_b = parent[sources], parent[targets]
+        pending = root_a != root_b
+        if not pending.any():
+            break
+        sources, targets = sources[pending], targets[pending]
+        low = np.minimum(root_a[pending], root_b[pending])
+        high = np.maximum(root_a[pending], root_b[pending])
+        np.minimum.at(parent, high, low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    _, labels = np.unique(parent, return_inverse=True)
+    return labels
+
+
+def cluster_by_threshold(
+    embeddings: np.ndarray,
+    threshold: float,
+    timestamps: Optional[np.ndarray] = None,
+    max_gap: Optional[float] = None,
+    block_size: int = 512,
+) -> np.ndarray:
+    """Groups embeddings whose cosine similarity reaches the threshold, transitively.
+
+    Similarities are computed one block of rows at a time, so memory stays at
+    ``block_size x n``. With ``timestamps`` (seconds, any order) and ``max_gap``,
+    only pairs published at most ``max_gap`` apart are linked. This bounds
+    chaining across unrelated days and shrinks each block to its time window.
+
+    Returns one cluster label per embedding.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    size = len(vectors)
+    if size == 0:
+        return np.empty(0, dtype=np.int64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    vectors = vectors / norms
+
+    order = np.arange(size)
+    if timestamps is not None and max_gap is not None:
+        order = np.argsort(timestamps, kind="stable")
+        times = np.asarray(timestamps, dtype=np.float64)[order]
+        vectors = vectors[order]
+
+    sources, targets = [], []
+    for start in range(0, size, block_size):
+        stop = min(start + block_size, size)
+        # Only compare against later rows; each pair is seen once
+        end = size
+        if timestamps is not None and max_gap is not None:
+            end = int(np.searchsorted(times, times[stop - 1] + max_gap, side="right"))
+        similarities = vectors[start:stop] @ vectors[start:end].T
+        rows, columns = np.nonzero(similarities >= threshold)
+        columns = columns + start
+        rows = rows + start
+        keep = columns > rows
+        if timestamps is not None and max_gap is not None:
+            keep &= times[columns] - times[rows] <= max_gap
+        sources.append(rows[keep])
+        targets.append(columns[keep])
+
+    labels = connected_components(size, np.concatenate(sources), np.concatenate(targets))
+    result = np.empty(size, dtype=np.int64)
+    result[order] = labels
+    return result
+
+
+def plan_group_ids(current: Sequence[Optional[str]], labels: np.ndarray) -> dict[int, Optional[str]]:
+    """Picks which existing group id each cluster keeps.
+
+    Larger clusters choose first and keep the existing group most of their
+    members already belong to, so stable stories keep their ids. Clusters left
+    without an unclaimed group map to None and need a new group.
+    """
+    members: dict[int, list[Optional[str]]] = {}
+    for group_id, label in zip(current, labels.tolist()):
+        members.setdefault(label, []).append(group_id)
+
+    claimed: set[str] = set()
+    plan: dict[int, Optional[str]] = {}
+    for label in sorted(members, key=lambda label: (-len(members[label]), label)):
+        plan[label] = None
+        for group_id, _ in Counter(g for g in members[label] if g is not None).most_common():
+            if group_id not in claimed:
+                claimed.add(group_id)
+                plan[label] = group_id
+                break
+    return plan
+
+
+@dataclass(frozen=True)
+class ClusteringQuality:
+    """Summary of a grouping of embeddings."""
+
+    articles: int
+    groups: int
+    singletons: int
+    largest: int
+    # Mean cosine similarity of members to their group centroid (multi-member groups)
+    cohesion: float
+    # Pairs of groups whose centroids reach the threshold, i.e. likely duplicates
+    duplicate_pairs: int
+
+    def describe(self) -> str:
+        return (
+            f"{self.articles} articles in {self.groups} groups "
+            f"({self.singletons} singletons, largest {self.largest}), "
+            f"cohesion {self.cohesion:.3f}, {self.duplicate_pairs} near-duplicate group pairs"
+        )
+
+
+def clustering_quality(embeddings: np.ndarray, labels: Sequence, threshold: float) -> ClusteringQuality:
+    """Measures cohesion and duplication of a grouping.
+
+    Labels may be any ids; a None label counts as a group of its own.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if len(vectors) == 0:
+        return ClusteringQuality(0, 0, 0, 0, 0.0, 0)
+    vectors = vectors / np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+    keys = [f"group:{label}" if label is not None else f"article:{i}" for i, label in enumerate(labels)]
+    _, codes, counts = np.unique(np.asarray(keys), return_inverse=True, return_counts=True)
+
+    centroids = np.zeros((len(counts), vectors.shape[1]), dtype=np.float32)
+    np.add.at(centroids, codes, vectors)
+    centroids /= np.clip(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12, None)
+
+    multi = counts[codes] > 1
+    cohesion = float(np.einsum("ij,ij->i", vectors[multi], centroids[codes[multi]]).mean()) if multi.any() else 1.0
+
+    duplicate_pairs = 0
+    for start in range(0, len(centroids), 512):
+        similarities = centroids[start:start + 512] @ centroids.T
+        rows, columns = np.nonzero(similarities >= threshold)
+        duplicate_pairs += int(np.count_nonzero(columns > rows + start))
+
+    return ClusteringQuality(
+        articles=len(vectors),
+        groups=len(counts),
+        singletons=int(np.count_nonzero(counts == 1)),
+        largest=int(counts.max()),
+        cohesion=cohesion,
+        duplicate_pairs=duplicate_pairs,
+    )
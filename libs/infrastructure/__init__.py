@@ -0,0 +1 @@
+"""Infrastructure shared by the api and ingest services."""
@@ -0,0 +1,4 @@
+"""Database helpers shared by the api and ingest services."""
+from libs.infrastructure.database.types import Float32Vector
+
+__all__ = ["Float32Vector"]
@@ -0,0 +1,32 @@
+"""Custom SQLAlchemy column types."""
+from typing import Any, Optional
+
+import numpy as np
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+_FLOAT32_LE = np.dtype("<f4")
+
+
+class Float32Vector(TypeDecorator):
+    """Stores a vector as raw little-endian float32 bytes (``BYTEA`` in Postgres).
+
+    Lists and arrays are accepted on write. Reads return a read-only NumPy view
+    over the fetched buffer, so no JSON parsing or Python float list is involved.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[bytes]:
+        if value is None:
+            return None
+        vector = np.asarray(value, dtype=_FLOAT32_LE)
+        if vector.ndim != 1:
+            raise ValueError("Vector must be one-dimensional")
+        return vector.tobytes()
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=_FLOAT32_LE)
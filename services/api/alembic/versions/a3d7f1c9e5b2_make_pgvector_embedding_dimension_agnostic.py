@@ -0,0 +1,109 @@
+"""Make the pgvector embedding column dimension-agnostic
+
+Revision ID: a3d7f1c9e5b2
+Revises: f6c2a9d4e1b3
+Create Date: 2026-10-17 19:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d7f1c9e5b2'
+down_revision: Union[str, Sequence[str], None] = 'f6c2a9d4e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+# Size the column was created with in c4e8a1f6d2b5 (text-embedding-3-small)
+LEGACY_DIMENSIONS = 1536
+
+
+def _has_vector_column() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return any(column["name"] == "embedding_vector" for column in sa.inspect(bind).get_columns("newsgroup"))
+
+
+def _create_index(dimension: int) -> None:
+    # HNSW needs a fixed size, so each dimension gets a partial index over a typed cast
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS ix_newsgroup_embedding_vector_{dimension} ON newsgroup "
+        f"USING hnsw ((embedding_vector::vector({dimension})) vector_cosine_ops) "
+        f"WHERE embedding_dimension = {dimension}"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deployments without pgvector never got the column
+    if not _has_vector_column():
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_newsgroup_embedding_vector_hnsw")
+    op.execute("ALTER TABLE newsgroup ALTER COLUMN embedding_vector TYPE vector")
+
+    # Float32 centroids of other sizes could not be stored before; copy them over
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, embedding FROM newsgroup "
+                "WHERE embedding IS NOT NULL AND embedding_vector IS NULL AND id > :last_id "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sa.text("UPDATE newsgroup SET embedding_vector = CAST(:embedding AS vector) WHERE id = :id"),
+            [
+                {
+                    "id": row.id,
+                    "embedding": "[" + ",".join(
+                        repr(float(v)) for v in np.frombuffer(bytes(row.embedding), dtype="<f4")
+                    ) + "]",
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    dimensions = connection.execute(
+        sa.text("SELECT DISTINCT embedding_dimension FROM newsgroup WHERE embedding_dimension IS NOT NULL")
+    ).scalars().all()
+    for dimension in sorted(set(dimensions) | {LEGACY_DIMENSIONS}):
+        _create_index(int(dimension))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _has_vector_column():
+        return
+
+    connection = op.get_bind()
+    indexes = connection.execute(
+        sa.text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE tablename = 'newsgroup' AND indexname LIKE 'ix_newsgroup_embedding_vector_%'"
+        )
+    ).scalars().all()
+    for name in indexes:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # Only vectors of the original size fit the typed column again
+    op.execute(
+        f"UPDATE newsgroup SET embedding_vector = NULL "
+        f"WHERE vector_dims(embedding_vector) <> {LEGACY_DIMENSIONS}"
+    )
+    op.execute(f"ALTER TABLE newsgroup ALTER COLUMN embedding_vector TYPE vector({LEGACY_DIMENSIONS})")
+    op.execute(
+        "CREATE INDEX ix_newsgroup_embedding_vector_hnsw ON newsgroup "
+        "USING hnsw (embedding_vector vector_cosine_ops)"
+    )
@@ -0,0 +1,36 @@
+"""Add member count to newsgroup
+
+Revision ID: a8c2e4f7b1d3
+Revises: f3b8d1e6a4c2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2e4f7b1d3'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d1e6a4c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Number of articles folded into the group's centroid embedding
+    op.add_column('newsgroup', sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'))
+    # Existing embeddings are still their first article's, so weight them as one member
+    op.execute(
+        """
+        UPDATE newsgroup SET member_count = 1
+        WHERE embedding IS NOT NULL OR embedding_blob IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('newsgroup', 'member_count')
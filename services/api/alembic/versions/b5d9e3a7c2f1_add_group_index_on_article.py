@@ -0,0 +1,29 @@
+"""Add (group_id, published_at) index on article
+
+Revision ID: b5d9e3a7c2f1
+Revises: a8c2e4f7b1d3
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d9e3a7c2f1'
+down_revision: Union[str, Sequence[str], None] = 'a8c2e4f7b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /groups ranks groups with GROUP BY group_id and then fetches one page of members
+    op.create_index('ix_article_group_id_published_at', 'article', ['group_id', 'published_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_group_id_published_at', table_name='article')
@@ -0,0 +1,31 @@
+"""Add feed cache validators to source
+
+Revision ID: b7d41c2e9f03
+Revises: a222917a1dfd
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c2e9f03'
+down_revision: Union[str, Sequence[str], None] = 'a222917a1dfd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ETag / Last-Modified of the last successful fetch, used for conditional GETs
+    op.add_column('source', sa.Column('etag', sa.VARCHAR(), nullable=True))
+    op.add_column('source', sa.Column('last_modified', sa.VARCHAR(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('source', 'last_modified')
+    op.drop_column('source', 'etag')
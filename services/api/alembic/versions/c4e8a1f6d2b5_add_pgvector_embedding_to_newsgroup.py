@@ -0,0 +1,59 @@
+"""Add pgvector embedding column and HNSW index to newsgroup
+
+Revision ID: c4e8a1f6d2b5
+Revises: b7d41c2e9f03
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f6d2b5'
+down_revision: Union[str, Sequence[str], None] = 'b7d41c2e9f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# text-embedding-3-small
+EMBEDDING_DIMENSIONS = 1536
+
+
+def _pgvector_available() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'")
+    ).first() is not None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Both search paths filter on the recent window
+    op.create_index('ix_newsgroup_created_at', 'newsgroup', ['created_at'])
+
+    # pgvector is optional: deployments without it keep matching groups in Python
+    if not _pgvector_available():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.execute(f"ALTER TABLE newsgroup ADD COLUMN embedding_vector vector({EMBEDDING_DIMENSIONS})")
+    # JSON arrays print as '[x, y, ...]', which is valid pgvector input
+    op.execute(
+        f"UPDATE newsgroup SET embedding_vector = embedding::text::vector({EMBEDDING_DIMENSIONS}) "
+        f"WHERE embedding IS NOT NULL AND json_array_length(embedding) = {EMBEDDING_DIMENSIONS}"
+    )
+    op.execute(
+        "CREATE INDEX ix_newsgroup_embedding_vector_hnsw ON newsgroup "
+        "USING hnsw (embedding_vector vector_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_newsgroup_embedding_vector_hnsw")
+    op.execute("ALTER TABLE newsgroup DROP COLUMN IF EXISTS embedding_vector")
+    op.drop_index('ix_newsgroup_created_at', table_name='newsgroup')
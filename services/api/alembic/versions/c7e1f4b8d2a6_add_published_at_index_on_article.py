@@ -0,0 +1,29 @@
+"""Add (published_at, id) index on article
+
+Revision ID: c7e1f4b8d2a6
+Revises: b5d9e3a7c2f1
+Create Date: 2026-10-17 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1f4b8d2a6'
+down_revision: Union[str, Sequence[str], None] = 'b5d9e3a7c2f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /news reads ORDER BY published_at DESC, id DESC as a backward scan of this index
+    op.create_index('ix_article_published_at_id', 'article', ['published_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_published_at_id', table_name='article')
@@ -0,0 +1,41 @@
+"""Order the (published_at, id) article index with undated articles last
+
+Revision ID: d2f8b4c6a9e1
+Revises: a3d7f1c9e5b2
+Create Date: 2026-10-17 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f8b4c6a9e1'
+down_revision: Union[str, Sequence[str], None] = 'a3d7f1c9e5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /news reads ORDER BY published_at DESC NULLS LAST, id DESC. A backward scan of
+    # the ascending index puts NULLs first, so Postgres gets an index in that exact order;
+    # other databases cannot declare NULL ordering in an index and keep the plain one
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_article_published_at_id', table_name='article')
+    op.create_index(
+        'ix_article_published_at_id',
+        'article',
+        [sa.text('published_at DESC NULLS LAST'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_article_published_at_id', table_name='article')
+    op.create_index('ix_article_published_at_id', 'article', ['published_at', 'id'])
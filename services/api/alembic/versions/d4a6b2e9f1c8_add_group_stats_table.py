@@ -0,0 +1,64 @@
+"""Add group_stats summary table
+
+Revision ID: d4a6b2e9f1c8
+Revises: c7e1f4b8d2a6
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a6b2e9f1c8'
+down_revision: Union[str, Sequence[str], None] = 'c7e1f4b8d2a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Per-group summary kept up to date by ingest, so /groups never aggregates articles
+    op.create_table(
+        'group_stats',
+        sa.Column('group_id', sa.String(), sa.ForeignKey('newsgroup.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('article_count', sa.Integer(), nullable=False),
+        sa.Column('source_count', sa.Integer(), nullable=False),
+        sa.Column('left_count', sa.Integer(), nullable=False),
+        sa.Column('center_count', sa.Integer(), nullable=False),
+        sa.Column('right_count', sa.Integer(), nullable=False),
+        sa.Column('latest_published_at', sa.DateTime(), nullable=False),
+        sa.Column('sensationalism_mean', sa.Float(), nullable=True),
+    )
+    op.create_index(
+        'ix_group_stats_ranking', 'group_stats', ['article_count', 'latest_published_at', 'group_id'],
+    )
+    # Build the rows of every existing group once; ingest maintains them from here on
+    op.execute(
+        """
+        INSERT INTO group_stats (
+            group_id, article_count, source_count, left_count, center_count, right_count,
+            latest_published_at, sensationalism_mean
+        )
+        SELECT a.group_id,
+               count(*),
+               count(DISTINCT a.source_id),
+               sum(CASE WHEN s.bias = 'left' THEN 1 ELSE 0 END),
+               sum(CASE WHEN s.bias = 'center' THEN 1 ELSE 0 END),
+               sum(CASE WHEN s.bias = 'right' THEN 1 ELSE 0 END),
+               coalesce(max(a.published_at), min(g.created_at)),
+               avg(a.sensationalism_score)
+        FROM article a
+        JOIN newsgroup g ON g.id = a.group_id
+        LEFT JOIN source s ON s.id = a.source_id
+        GROUP BY a.group_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_group_stats_ranking', table_name='group_stats')
+    op.drop_table('group_stats')
@@ -0,0 +1,37 @@
+"""Add unique index on article link
+
+Revision ID: d9f2b6a3c1e7
+Revises: c4e8a1f6d2b5
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f2b6a3c1e7'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f6d2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop duplicate links left by earlier racy inserts, keeping the first row per link
+    op.execute(
+        """
+        DELETE FROM article a
+        USING article b
+        WHERE a.link = b.link AND a.id > b.id
+        """
+    )
+    # Backs ON CONFLICT (link) DO NOTHING and batched link lookups
+    op.create_index('ix_article_link', 'article', ['link'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_link', table_name='article')
@@ -0,0 +1,30 @@
+"""Add quantized embedding blob to newsgroup
+
+Revision ID: e5a7c3d9b2f4
+Revises: d9f2b6a3c1e7
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3d9b2f4'
+down_revision: Union[str, Sequence[str], None] = 'd9f2b6a3c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # float16/int8 embeddings written by EmbeddingCodec instead of JSON text
+    op.add_column('newsgroup', sa.Column('embedding_blob', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Groups saved with a codec have no JSON embedding; they stop matching until they age out
+    op.drop_column('newsgroup', 'embedding_blob')
@@ -0,0 +1,35 @@
+"""Add data_version table
+
+Revision ID: e8b3c5d1a7f2
+Revises: d4a6b2e9f1c8
+Create Date: 2026-10-17 18:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c5d1a7f2'
+down_revision: Union[str, Sequence[str], None] = 'd4a6b2e9f1c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Single row whose version ingest bumps after each run; API response caches key on it
+    op.create_table(
+        'data_version',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.execute("INSERT INTO data_version (id, version, updated_at) VALUES (1, 1, CURRENT_TIMESTAMP)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('data_version')
@@ -0,0 +1,67 @@
+"""Store newsgroup embedding as float32 bytes
+
+Revision ID: f3b8d1e6a4c2
+Revises: e5a7c3d9b2f4
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d1e6a4c2'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c3d9b2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _convert(source: str, target: str, to_target) -> None:
+    """Copies every non-null embedding from one column to another in batches."""
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        rows = connection.execute(
+            sa.text(
+                f"SELECT id, {source} AS value FROM newsgroup "
+                f"WHERE {source} IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        connection.execute(
+            sa.text(f"UPDATE newsgroup SET {target} = :value WHERE id = :id"),
+            [{"id": row.id, "value": to_target(row.value)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Raw little-endian float32 instead of JSON text: ~6 KB instead of ~30 KB per
+    # 1536-d row, and reads become a NumPy view instead of a JSON parse
+    op.add_column('newsgroup', sa.Column('embedding_f32', sa.LargeBinary(), nullable=True))
+    _convert(
+        'embedding', 'embedding_f32',
+        lambda value: np.asarray(value if isinstance(value, list) else json.loads(value), dtype='<f4').tobytes(),
+    )
+    op.drop_column('newsgroup', 'embedding')
+    op.alter_column('newsgroup', 'embedding_f32', new_column_name='embedding')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('newsgroup', sa.Column('embedding_json', sa.JSON(), nullable=True))
+    _convert(
+        'embedding', 'embedding_json',
+        lambda value: json.dumps(np.frombuffer(bytes(value), dtype='<f4').astype(float).tolist()),
+    )
+    op.drop_column('newsgroup', 'embedding')
+    op.alter_column('newsgroup', 'embedding_json', new_column_name='embedding')
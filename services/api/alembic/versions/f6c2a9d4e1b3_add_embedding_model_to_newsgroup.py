@@ -0,0 +1,59 @@
+"""Add embedding model and dimension to newsgroup
+
+Revision ID: f6c2a9d4e1b3
+Revises: e8b3c5d1a7f2
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+import struct
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c2a9d4e1b3'
+down_revision: Union[str, Sequence[str], None] = 'e8b3c5d1a7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Groups embedded by another model or size are skipped when matching; the
+    # model of existing groups is unknown and stays NULL
+    op.add_column('newsgroup', sa.Column('embedding_model', sa.String(), nullable=True))
+    op.add_column('newsgroup', sa.Column('embedding_dimension', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE newsgroup SET embedding_dimension = length(embedding) / 4 WHERE embedding IS NOT NULL"
+    )
+    # Quantized blobs carry their dimension in the header (uint8 precision, uint32 dimension)
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, embedding_blob FROM newsgroup "
+                "WHERE embedding_blob IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sa.text("UPDATE newsgroup SET embedding_dimension = :dimension WHERE id = :id"),
+            [
+                {"id": row.id, "dimension": struct.unpack_from("<BI", bytes(row.embedding_blob))[1]}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('newsgroup', 'embedding_dimension')
+    op.drop_column('newsgroup', 'embedding_model')
@@ -0,0 +1,21 @@
+import base64
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: object) -> str:
+    """Encodes the sort key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode("\n".join(str(value) for value in values).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    """Decodes a cursor into its ``size`` sort key values, as strings."""
+    try:
+        values = base64.urlsafe_b64decode(cursor.encode()).decode().split("\n")
+    except ValueError as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+    if len(values) != size:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return values
@@ -1,6 +1,16 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
 from sqlmodel import Session, select
 
-from services.api.src.infrastructure.database.models import ArticleModel, NewsGroupModel, SourceModel
+from services.api.src.application.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from services.api.src.infrastructure.database.models import (
+    ArticleModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
 
 
 class GetGroups:
@@ -9,21 +19,80 @@ class GetGroups:
     def __init__(self, session: Session):
         self._session = session
 
-    async def execute(self, limit: int = 50, min_articles: int = 2) -> list[dict]:
-        """Returns news groups sorted by number of articles, most covered first."""
+    async def execute(
+        self,
+        limit: int = 50,
+        min_articles: int = 2,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> dict:
+        """Returns a page of news groups sorted by number of articles, most covered first.
+
+        Groups are ordered by (article count, latest article date, id), all
+        descending, and ``next_cursor`` resumes after the last group of the page,
+        or is None on the last page. The ranking is read from ``group_stats``,
+        which ingest keeps up to date, so only the page's articles are loaded.
+        With ``since``/``until`` only articles published in [since, until) are
+        counted and returned, which needs a live aggregation over them instead.
+        """
+        window = [ArticleModel.group_id.is_not(None)]
+        if since is not None:
+            window.append(ArticleModel.published_at >= since)
+        if until is not None:
+            window.append(ArticleModel.published_at < until)
+
+        if len(window) == 1:
+            group_id = GroupStatsModel.group_id
+            article_count = GroupStatsModel.article_count
+            latest = GroupStatsModel.latest_published_at
+            ranking = select(group_id, article_count, latest).where(article_count >= min_articles)
+            add_condition = ranking.where
+        else:
+            group_id = ArticleModel.group_id
+            article_count = func.count(ArticleModel.id).label("article_count")
+            latest = func.max(ArticleModel.published_at).label("latest_published_at")
+            ranking = (
+                select(group_id, article_count, latest)
+                .where(*window)
+                .group_by(group_id)
+                .having(article_count >= min_articles)
+            )
+            add_condition = ranking.having
+        if cursor is not None:
+            last_count, last_latest, last_id = decode_cursor(cursor, 3)
+            try:
+                last_count, last_latest = int(last_count), datetime.fromisoformat(last_latest)
+            except ValueError as exc:
+                raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+            ranking = add_condition(or_(
+                article_count < last_count,
+                and_(article_count == last_count, latest < last_latest),
+                and_(article_count == last_count, latest == last_latest, group_id < last_id),
+            ))
+        # One extra row tells whether another page follows
+        page = self._session.exec(
+            ranking.order_by(article_count.desc(), latest.desc(), group_id.desc()).limit(limit + 1)
+        ).all()
+        has_more = len(page) > limit
+        page = page[:limit]
+        if not page:
+            return {"groups": [], "next_cursor": None}
+
+        group_ids = [row.group_id for row in page]
+        created = dict(self._session.exec(
+            select(NewsGroupModel.id, NewsGroupModel.created_at).where(NewsGroupModel.id.in_(group_ids))
+        ).all())
         rows = self._session.exec(
             select(ArticleModel, SourceModel)
             .join(SourceModel, ArticleModel.source_id == SourceModel.id, isouter=True)
-            .where(ArticleModel.group_id.is_not(None))
+            .where(ArticleModel.group_id.in_(group_ids), *window[1:])
+            .order_by(ArticleModel.published_at.desc().nulls_last(), ArticleModel.id)
         ).all()
 
-        # Group articles by group_id
-        groups_dict: dict[str, list[dict]] = {}
+        articles: dict[str, list[dict]] = {gid: [] for gid in group_ids}
         for article, source in rows:
-            gid = article.group_id
-            if gid not in groups_dict:
-                groups_dict[gid] = []
-            groups_dict[gid].append({
+            articles[article.group_id].append({
                 "id": article.id,
                 "title": article.title,
                 "link": article.link,
@@ -35,22 +104,16 @@ class GetGroups:
                 "sensationalism_explanation": article.sensationalism_explanation,
             })
 
-        # Fetch group metadata for the groups that pass the filter
-        qualifying_ids = [gid for gid, arts in groups_dict.items() if len(arts) >= min_articles]
-        newsgroups = self._session.exec(
-            select(NewsGroupModel.id, NewsGroupModel.created_at).where(
-                NewsGroupModel.id.in_(qualifying_ids)
-            )
-        ).all()
-        newsgroup_map = {ng.id: ng for ng in newsgroups}
-
-        output = [
+        groups = [
             {
                 "id": gid,
-                "created_at": newsgroup_map[gid].created_at.isoformat() if gid in newsgroup_map else None,
-                "articles": groups_dict[gid],
+                "created_at": created[gid].isoformat() if created.get(gid) else None,
+                "articles": articles[gid],
             }
-            for gid in qualifying_ids
+            for gid in group_ids
         ]
-        output.sort(key=lambda g: len(g["articles"]), reverse=True)
-        return output[:limit]
+        next_cursor = None
+        if has_more:
+            last = page[-1]
+            next_cursor = encode_cursor(last.article_count, last.latest_published_at.isoformat(), last.group_id)
+        return {"groups": groups, "next_cursor": next_cursor}
@@ -1,36 +1,79 @@
-from libs.domain.repositories.article_repository import ArticleRepository
-from libs.domain.repositories.source_repository import SourceRepository
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select
+
+from services.api.src.application.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from services.api.src.infrastructure.database.models import ArticleModel, SourceModel
 
 
 class GetNews:
     """Use case for getting news articles."""
 
-    def __init__(
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def execute(
         self,
-        article_repository: ArticleRepository,
-        source_repository: SourceRepository,
-    ):
-        self._article_repository = article_repository
-        self._source_repository = source_repository
-
-    async def execute(self, limit: int = 20) -> list[dict]:
-        """Gets recent news from all sources."""
-        sources = await self._source_repository.find_all()
-        all_articles = []
-
-        for source in sources:
-            articles = await self._article_repository.find_by_source_id(source.id, limit=limit)
-            for article in articles:
-                all_articles.append({
-                    "id": str(article.id),
-                    "title": article.title,
-                    "link": article.link,
-                    "description": article.description,
-                    "published": article.published_at.isoformat() if article.published_at else None,
-                    "source": source.name,
-                    "bias": source.bias.value,
-                    "sensationalism_score": article.sensationalism_score,
-                    "sensationalism_explanation": article.sensationalism_explanation,
-                })
-
-        return all_articles
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        source_ids: Optional[list[str]] = None,
+        biases: Optional[list[str]] = None,
+    ) -> dict:
+        """Returns a page of the most recent news across all sources, newest first.
+
+        One joined query ordered by (published_at desc, id desc) serves the page,
+        and ``next_cursor`` resumes after its last article, or is None on the
+        last page. Articles without a publication date follow the dated ones.
+        """
+        statement = (
+            select(ArticleModel, SourceModel)
+            .join(SourceModel, ArticleModel.source_id == SourceModel.id)
+        )
+        if source_ids:
+            statement = statement.where(ArticleModel.source_id.in_(source_ids))
+        if biases:
+            statement = statement.where(SourceModel.bias.in_(biases))
+        if cursor is not None:
+            last_published, last_id = decode_cursor(cursor, 2)
+            if last_published:
+                try:
+                    last_published = datetime.fromisoformat(last_published)
+                except ValueError as exc:
+                    raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+                statement = statement.where(or_(
+                    ArticleModel.published_at < last_published,
+                    and_(ArticleModel.published_at == last_published, ArticleModel.id < last_id),
+                    ArticleModel.published_at.is_(None),
+                ))
+            else:
+                # The previous page ended among the undated articles
+                statement = statement.where(ArticleModel.published_at.is_(None), ArticleModel.id < last_id)
+        # One extra row tells whether another page follows
+        rows = self._session.exec(
+            statement.order_by(ArticleModel.published_at.desc().nulls_last(), ArticleModel.id.desc())
+            .limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        news = [
+            {
+                "id": article.id,
+                "title": article.title,
+                "link": article.link,
+                "description": article.description,
+                "published": article.published_at.isoformat() if article.published_at else None,
+                "source": source.name,
+                "bias": source.bias,
+                "sensationalism_score": article.sensationalism_score,
+                "sensationalism_explanation": article.sensationalism_explanation,
+            }
+            for article, source in rows
+        ]
+        next_cursor = None
+        if has_more:
+            last = rows[-1][0]
+            next_cursor = encode_cursor(last.published_at.isoformat() if last.published_at else "", last.id)
+        return {"news": news, "next_cursor": next_cursor}
@@ -0,0 +1,217 @@
+"""Caching of serialized route responses, invalidated by the ingest data version."""
+import gzip
+import hashlib
+import json
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are not worth a compressed variant
+MIN_COMPRESS_BYTES = 1024
+
+
+def dumps(payload: Any) -> bytes:
+    """Serializes a payload to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with ``dumps`` instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def compress_variants(body: bytes) -> dict[str, bytes]:
+    """Returns the body under each content coding worth serving, identity included."""
+    variants = {"identity": body}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        variants["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=5)
+    return variants
+
+
+class CacheBackend(ABC):
+    """Stores serialized responses by key."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the stored value, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores a value for ``ttl`` seconds."""
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process TTL cache that evicts the least recently used entry when full."""
+
+    def __init__(self, max_entries: int = 512):
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared by every API process through Redis."""
+
+    def __init__(self, url: str, prefix: str = "pluralia:response:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("The Redis response cache needs the redis package") from e
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1))
+
+
+class ResponseCache:
+    """Serves route payloads from a cache keyed by path, query and data version.
+
+    The data version comes from ``version_provider`` (the ``data_version`` row
+    ingest bumps) and is re-read at most every ``version_check_interval``
+    seconds, so a new ingest run invalidates every cached response without any
+    explicit purge. Each response carries an ``ETag``; a matching
+    ``If-None-Match`` gets an empty 304.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        version_provider: Callable[[], str],
+        ttl: float = 300.0,
+        version_check_interval: float = 5.0,
+    ):
+        self._backend = backend
+        self._version_provider = version_provider
+        self._ttl = ttl
+        self._version_check_interval = version_check_interval
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+
+    def current_version(self) -> str:
+        now = time.monotonic()
+        if self._version is None or now - self._version_checked_at >= self._version_check_interval:
+            self._version = self._version_provider()
+            self._version_checked_at = now
+        return self._version
+
+    async def respond(self, request: Request, compute: Callable[[], Awaitable[dict]]) -> Response:
+        """Returns the cached response for the request, computing and storing it on a miss.
+
+        A miss serializes the payload once and compresses it once per content
+        coding; hits only pick the variant the client accepts. Exceptions from
+        ``compute`` propagate and nothing is cached.
+        """
+        version = self.current_version()
+        query = "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+        key = f"{version}|{request.url.path}?{query}"
+
+        cached = self._backend.get(key)
+        if cached is None:
+            body = dumps(await compute())
+            etag = f'"{version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+            variants = compress_variants(body)
+            self._backend.set(key, _pack(etag, variants), self._ttl)
+        else:
+            etag, variants = _unpack(cached)
+
+        encoding = _choose_encoding(request.headers.get("accept-encoding"), variants)
+        # Each coding is a distinct representation, so it gets its own validator
+        variant_etag = etag if encoding == "identity" else f'{etag[:-1]}-{encoding}"'
+        # Clients revalidate every time; an unchanged version costs a 304 and no body
+        headers = {"ETag": variant_etag, "Cache-Control": "public, no-cache", "Vary": "Accept-Encoding"}
+        if _etag_matches(request.headers.get("if-none-match"), variant_etag):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=variants[encoding], media_type="application/json", headers=headers)
+
+
+def _pack(etag: str, variants: dict[str, bytes]) -> bytes:
+    # etag, then (name length, name, body length, body) per variant
+    parts = [struct.pack("!H", len(etag)), etag.encode()]
+    for name, body in variants.items():
+        parts += [struct.pack("!B", len(name)), name.encode(), struct.pack("!I", len(body)), body]
+    return b"".join(parts)
+
+
+def _unpack(data: bytes) -> tuple[str, dict[str, bytes]]:
+    view = memoryview(data)
+    (size,) = struct.unpack_from("!H", view, 0)
+    etag = bytes(view[2:2 + size]).decode()
+    offset = 2 + size
+    variants = {}
+    while offset < len(view):
+        (name_size,) = struct.unpack_from("!B", view, offset)
+        name = bytes(view[offset + 1:offset + 1 + name_size]).decode()
+        offset += 1 + name_size
+        (body_size,) = struct.unpack_from("!I", view, offset)
+        variants[name] = bytes(view[offset + 4:offset + 4 + body_size])
+        offset += 4 + body_size
+    return etag, variants
+
+
+def _choose_encoding(accept_encoding: Optional[str], variants: dict[str, bytes]) -> str:
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    for encoding in ("br", "gzip"):
+        if encoding in variants and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # Weak validators compare equal for a GET; "*" matches any stored representation
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
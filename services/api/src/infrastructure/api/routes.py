@@ -1,15 +1,51 @@
-from fastapi import APIRouter, Depends
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from sqlmodel import Session
 
+from services.api.src.application.cursor import InvalidCursorError
 from services.api.src.application.get_groups import GetGroups
 from services.api.src.application.get_news import GetNews
+from services.api.src.infrastructure.api.response_cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+)
 from services.api.src.infrastructure.database.db import get_session
+from services.api.src.infrastructure.database.models import DataVersionModel
 from services.api.src.infrastructure.repositories.sqlmodel_article_repository import SqlModelArticleRepository
 from services.api.src.infrastructure.repositories.sqlmodel_source_repository import SqlModelSourceRepository
 
 router = APIRouter()
 
 
+def read_data_version() -> str:
+    """Returns the version ingest bumps after each run, or "0" before the first one."""
+    with get_session() as session:
+        row = session.get(DataVersionModel, 1)
+        return str(row.version) if row else "0"
+
+
+def build_response_cache() -> ResponseCache:
+    cache_url = os.getenv("RESPONSE_CACHE_URL")
+    backend = (
+        RedisCacheBackend(cache_url)
+        if cache_url
+        else InMemoryCacheBackend(max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")))
+    )
+    return ResponseCache(
+        backend,
+        version_provider=read_data_version,
+        ttl=float(os.getenv("RESPONSE_CACHE_TTL", "300")),
+        version_check_interval=float(os.getenv("DATA_VERSION_CHECK_SECONDS", "5")),
+    )
+
+
+response_cache = build_response_cache()
+
+
 def get_article_repository() -> SqlModelArticleRepository:
     with get_session() as session:
         return SqlModelArticleRepository(session)
@@ -21,24 +57,49 @@ def get_source_repository() -> SqlModelSourceRepository:
 
 
 @router.get("/groups")
-async def get_groups(limit: int = 50, min_articles: int = 2):
-    """Returns news groups with their articles, sorted by coverage (most sources first)."""
-    with get_session() as session:
-        use_case = GetGroups(session=session)
-        groups = await use_case.execute(limit=limit, min_articles=min_articles)
-        return {"groups": groups}
+async def get_groups(
+    request: Request,
+    limit: int = 50,
+    min_articles: int = 2,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Response:
+    """Returns news groups with their articles, sorted by coverage (most sources first).
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to get the next page.
+    """
+    async def compute() -> dict:
+        with get_session() as session:
+            use_case = GetGroups(session=session)
+            try:
+                return await use_case.execute(
+                    limit=limit, min_articles=min_articles, cursor=cursor, since=since, until=until,
+                )
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return await response_cache.respond(request, compute)
 
 
 @router.get("/news")
-async def get_news(limit: int = 20):
-    """Returns recent news from multiple sources."""
-    with get_session() as session:
-        article_repository = SqlModelArticleRepository(session)
-        source_repository = SqlModelSourceRepository(session)
-        use_case = GetNews(
-            article_repository=article_repository,
-            source_repository=source_repository,
-        )
-        news = await use_case.execute(limit=limit)
-        return {"news": news}
+async def get_news(
+    request: Request,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    source_id: Optional[list[str]] = Query(None),
+    bias: Optional[list[str]] = Query(None),
+) -> Response:
+    """Returns the most recent news across sources, newest first.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to get the next page.
+    """
+    async def compute() -> dict:
+        with get_session() as session:
+            use_case = GetNews(session=session)
+            try:
+                return await use_case.execute(limit=limit, cursor=cursor, source_ids=source_id, biases=bias)
+            except InvalidCursorError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    return await response_cache.respond(request, compute)
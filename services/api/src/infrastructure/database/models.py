@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import String, ForeignKey, JSON
+from sqlalchemy import String, ForeignKey, Index, Integer, JSON, LargeBinary
 from typing import Optional
 from datetime import datetime
 
+from libs.infrastructure.database.types import Float32Vector
+
 
 class SourceModel(SQLModel, table=True):
     __tablename__ = "source"
@@ -11,6 +13,8 @@ class SourceModel(SQLModel, table=True):
     name: str
     url: Optional[str] = None
     bias: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class NewsGroupModel(SQLModel, table=True):
@@ -20,19 +24,61 @@ class NewsGroupModel(SQLModel, table=True):
     topic_hash: str
     summary: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    embedding: Optional[list[float]] = Field(default=None, sa_column=Column(JSON))
+    # Running centroid of the member articles' title embeddings
+    embedding: Optional[list[float]] = Field(default=None, sa_column=Column(Float32Vector))
+    member_count: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    # float16/int8 copy written by EmbeddingCodec; `embedding` stays the source of truth
+    embedding_blob: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))
+    # Model and size the centroid was computed with; groups of another embedding space never match
+    embedding_model: Optional[str] = None
+    embedding_dimension: Optional[int] = None
 
 
 class ArticleModel(SQLModel, table=True):
     __tablename__ = "article"
+    __table_args__ = (
+        # Backs per-group counts and article lookups, optionally within a time window
+        Index("ix_article_group_id_published_at", "group_id", "published_at"),
+        # Backs the newest-first /news timeline and its keyset pagination; on Postgres it is
+        # declared (published_at DESC NULLS LAST, id DESC) to match that ordering
+        Index("ix_article_published_at_id", "published_at", "id"),
+    )
 
     id: str = Field(sa_column=Column(String, primary_key=True))
     group_id: Optional[str] = Field(default=None, sa_column=Column(String, ForeignKey("newsgroup.id")))
     source_id: Optional[str] = Field(default=None, sa_column=Column(String, ForeignKey("source.id")))
     title: str
     description: Optional[str] = None
-    link: str
+    link: str = Field(sa_column=Column(String, nullable=False, unique=True))
     published_at: Optional[datetime] = None
     sensationalism_score: Optional[float] = None
     sensationalism_explanation: Optional[str] = None
     analysis_metadata: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+
+
+# Per-group summary kept up to date by ingest, so /groups never aggregates articles
+class GroupStatsModel(SQLModel, table=True):
+    __tablename__ = "group_stats"
+    __table_args__ = (
+        # Backs the coverage ranking: article count, then most recent activity
+        Index("ix_group_stats_ranking", "article_count", "latest_published_at", "group_id"),
+    )
+
+    group_id: str = Field(sa_column=Column(String, ForeignKey("newsgroup.id", ondelete="CASCADE"), primary_key=True))
+    article_count: int
+    source_count: int
+    left_count: int
+    center_count: int
+    right_count: int
+    # Latest article date, or the group's creation time if none is dated
+    latest_published_at: datetime
+    sensationalism_mean: Optional[float] = None
+
+
+# Single row whose version ingest bumps after each run; API response caches key on it
+class DataVersionModel(SQLModel, table=True):
+    __tablename__ = "data_version"
+
+    id: int = Field(default=1, sa_column=Column(Integer, primary_key=True))
+    version: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -12,10 +12,13 @@ class SqlModelSourceRepository(SourceRepository):
     def __init__(self, session: Session):
         self._session = session
 
-    async def save(self, source: Source) -> None:
+    async def save(self, source: Source, commit: bool = True) -> None:
         source_model = self._to_model(source)
         self._session.merge(source_model)
-        self._session.commit()
+        if commit:
+            self._session.commit()
+        else:
+            self._session.flush()
         self._session.refresh(source_model)
 
     async def find_by_id(self, source_id: UUID) -> Optional[Source]:
@@ -36,6 +39,8 @@ class SqlModelSourceRepository(SourceRepository):
             name=source.name,
             url=source.url,
             bias=source.bias.value,
+            etag=source.etag,
+            last_modified=source.last_modified,
         )
 
     def _to_entity(self, model: SourceModel) -> Source:
@@ -59,5 +64,7 @@ class SqlModelSourceRepository(SourceRepository):
             name=model.name,
             url=model.url,
             bias=bias,
+            etag=model.etag,
+            last_modified=model.last_modified,
         )
 
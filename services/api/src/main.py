@@ -3,10 +3,11 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from services.api.src.infrastructure.api.response_cache import FastJSONResponse
 from services.api.src.infrastructure.api.routes import router
 from services.api.src.infrastructure.database.db import init_db
 
-app = FastAPI(title="Pluralia API")
+app = FastAPI(title="Pluralia API", default_response_class=FastJSONResponse)
 
 cors_origins = os.getenv("CORS_ORIGINS", "*").split(",")
 app.add_middleware(
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
@@ -7,7 +10,9 @@ from libs.domain.entities.source import Source
 from libs.domain.repositories.article_repository import ArticleRepository
 from libs.domain.repositories.news_group_repository import NewsGroupRepository
 from libs.domain.repositories.source_repository import SourceRepository
+from libs.domain.repositories.unit_of_work import UnitOfWork
 from libs.domain.services.embedding_service import EmbeddingService
+from libs.domain.services.group_matcher import GroupIndex, GroupIndexFactory, GroupMatcher
 from libs.domain.value_objects.bias import Bias
 from libs.domain.value_objects.topic_hash import TopicHash
 from dataclasses import replace
@@ -22,18 +27,35 @@ class IngestNews:
         source_repository: SourceRepository,
         article_repository: ArticleRepository,
         news_group_repository: NewsGroupRepository,
+        unit_of_work: UnitOfWork,
         rss_parser: RSSParser,
         embedding_service: EmbeddingService,
         news_analyzer: Optional[NewsAnalyzer] = None,
         similarity_threshold: float = 0.7,
+        group_window_days: int = 1,
+        search_groups_in_repository: bool = False,
+        group_index_factory: GroupIndexFactory = GroupMatcher,
+        embedding_model: Optional[str] = None,
     ):
         self._source_repository = source_repository
         self._article_repository = article_repository
         self._news_group_repository = news_group_repository
+        # Shared by every feed; see _transaction
+        self._unit_of_work = unit_of_work
         self._rss_parser = rss_parser
         self._embedding_service = embedding_service
         self._news_analyzer = news_analyzer
         self._similarity_threshold = similarity_threshold
+        self._group_window = timedelta(days=group_window_days)
+        # Recent groups are loaded once per run and then maintained in memory
+        self._group_index: Optional[GroupIndex] = None
+        self._write_lock = asyncio.Lock()
+        # Delegate candidate selection to the repository (e.g. pgvector ANN) instead
+        self._search_groups_in_repository = search_groups_in_repository
+        # Builds the in-memory index of recent groups; GroupMatcher is exact
+        self._group_index_factory = group_index_factory
+        # Stored with new groups; groups embedded by another model are never matched
+        self._embedding_model = embedding_model
 
     async def execute(
         self,
@@ -43,73 +65,170 @@ class IngestNews:
         limit: int = 10,
     ) -> None:
         """Ingests news from a source RSS feed."""
-        source = await self._ensure_source_exists(source_name, source_url, bias)
-
-        entries = self._rss_parser.parse_feed(source_url)
-
-        for entry in entries[:limit]:
+        async with self._transaction():
+            source = await self._ensure_source_exists(source_name, source_url, bias)
+
+        feed = await self._rss_parser.fetch_feed(
+            source_url,
+            etag=source.etag,
+            last_modified=source.last_modified,
+        )
+        if feed.not_modified:
+            return
+
+        articles: dict[str, Article] = {}
+        for entry in feed.entries[:limit]:
             article = self._rss_parser.entry_to_article(entry, source.id)
-
-            existing_article = await self._article_repository.find_by_link(article.link)
-            if existing_article:
-                continue
-
-            # Generate embedding for the article title
-            article_embedding = self._embedding_service.generate_embedding(article.title)
-
-            # Analyze sensationalism if analyzer is available
-            if self._news_analyzer:
-                score, explanation, metadata = await self._news_analyzer.analyze_sensationalism(
-                    article.title,
-                    article.description or ""
+            articles.setdefault(article.link, article)
+
+        # Drop already-known links with one query before any embedding or LLM work
+        existing_links = await self._article_repository.find_existing_links(list(articles))
+        new_articles = [article for link, article in articles.items() if link not in existing_links]
+
+        if new_articles:
+            # Embed every new title in one batched call (off the event loop) while the
+            # sensationalism analyses for the same articles run concurrently
+            embeddings, new_articles = await asyncio.gather(
+                asyncio.to_thread(
+                    self._embedding_service.generate_embeddings,
+                    [article.title for article in new_articles],
+                ),
+                self._analyze_all(new_articles),
+            )
+        else:
+            embeddings = []
+
+        try:
+            # New groups, centroid moves, articles, stats and validators commit together
+            async with self._transaction():
+                grouped_articles: list[Article] = []
+                for article, article_embedding in zip(new_articles, embeddings):
+                    # Try to find a similar group using embeddings
+                    group = await self._find_or_create_group_by_similarity(article.title, article_embedding)
+
+                    grouped_articles.append(article.assign_to_group(group.id))
+
+                await self._article_repository.save_many(grouped_articles, commit=False)
+                # Keep the /groups summary rows of every group the feed touched in step
+                await self._news_group_repository.refresh_stats(
+                    list({article.group_id for article in grouped_articles}), commit=False
                 )
-                article = replace(
-                    article,
-                    sensationalism_score=score,
-                    sensationalism_explanation=explanation,
-                    analysis_metadata=metadata
+                await self._source_repository.save(
+                    source.update_feed_validators(etag=feed.etag, last_modified=feed.last_modified),
+                    commit=False,
                 )
-
-            # Try to find a similar group using embeddings
-            group = await self._find_or_create_group_by_similarity(article.title, article_embedding)
-
-            article_with_group = article.assign_to_group(group.id)
-            await self._article_repository.save(article_with_group)
+        except BaseException:
+            # The index may hold groups and centroid moves that were rolled back;
+            # reload it from the database on next use
+            self._group_index = None
+            raise
+
+    @asynccontextmanager
+    async def _transaction(self):
+        """Commits the writes staged in the block, or rolls them back if it raises.
+
+        Feeds run concurrently but share one unit of work, so the block holds the
+        write lock until its commit or rollback: no feed can commit or discard
+        another feed's half-staged writes, whatever the block awaits.
+        """
+        async with self._write_lock:
+            try:
+                yield
+                await self._unit_of_work.commit()
+            except BaseException:
+                await self._unit_of_work.rollback()
+                raise
+
+    async def _analyze_all(self, articles: list[Article]) -> list[Article]:
+        """Analyzes sensationalism for all articles in one batch, if an analyzer is available.
+
+        The analyzer decides how to split the batch and bounds its own concurrency and rate.
+        """
+        if not self._news_analyzer:
+            return articles
+
+        results = await self._news_analyzer.analyze_sensationalism_batch(
+            [(article.title, article.description or "") for article in articles]
+        )
+        return [
+            replace(
+                article,
+                sensationalism_score=score,
+                sensationalism_explanation=explanation,
+                analysis_metadata=metadata
+            )
+            for article, (score, explanation, metadata) in zip(articles, results)
+        ]
 
     async def _ensure_source_exists(self, name: str, url: Optional[str], bias: Bias) -> Source:
         """Ensures a source exists, creating it if necessary."""
         source = await self._source_repository.find_by_name(name)
         if not source:
             source = Source.new(name=name, url=url, bias=bias)
-            await self._source_repository.save(source)
+            await self._source_repository.save(source, commit=False)
             source = await self._source_repository.find_by_name(name)
         return source
 
     async def _find_or_create_group_by_similarity(self, title: str, embedding: list[float]) -> NewsGroup:
-        """Finds a similar group by embedding similarity, or creates a new one."""
-        # Get groups from the last day only to limit DB transfer
-        existing_groups = await self._news_group_repository.find_recent(days=1)
-
-        # Find the most similar group
-        best_match = None
-        best_similarity = 0.0
-
-        for group in existing_groups:
-            if group.embedding is not None:
-                similarity = self._embedding_service.calculate_similarity(embedding, group.embedding)
-                if similarity > best_similarity and similarity >= self._similarity_threshold:
-                    best_similarity = similarity
-                    best_match = group
-
-        # If we found a similar group, return it
-        if best_match:
-            return best_match
+        """Finds a similar group by embedding similarity, or creates a new one.
+
+        A matched group's centroid is moved towards the new member, and a new group
+        is flushed. The caller holds the write lock, so feeds can't create the same
+        story twice, and both are only committed with the feed's articles.
+        """
+        match = await self._find_similar_group(embedding)
+
+        # If we found a similar group, move its centroid towards the new member
+        if match:
+            group = match.add_member(embedding)
+            await self._news_group_repository.update_centroids([group], commit=False)
+            if self._group_index is not None:
+                self._group_index.update(group)
+            return group
 
         # Otherwise, create a new group with the embedding
         topic_hash = TopicHash.from_title(title)
-        new_group = NewsGroup.new(topic_hash=topic_hash, embedding=embedding)
-        await self._news_group_repository.save(new_group)
+        new_group = NewsGroup.new(
+            topic_hash=topic_hash, embedding=embedding, embedding_model=self._embedding_model
+        )
+        await self._news_group_repository.save(new_group, commit=False)
 
         # Reload to get the persisted group
         saved_group = await self._news_group_repository.find_by_topic_hash(topic_hash)
-        return saved_group if saved_group else new_group
+        group = saved_group if saved_group else new_group
+        if self._group_index is not None:
+            self._group_index.add(group)
+        return group
+
+    async def _find_similar_group(self, embedding: list[float]) -> Optional[NewsGroup]:
+        """Returns the most similar recent group reaching the threshold, if any."""
+        if self._search_groups_in_repository:
+            matches = await self._news_group_repository.find_most_similar(
+                embedding,
+                since=datetime.utcnow() - self._group_window,
+                threshold=self._similarity_threshold,
+                k=1,
+                model=self._embedding_model,
+            )
+            return matches[0][0] if matches else None
+
+        # Find the most similar group with a single matrix-vector product
+        group_index = await self._recent_group_index(len(embedding))
+        match = group_index.best_match(embedding, self._similarity_threshold)
+        return match[0] if match else None
+
+    async def _recent_group_index(self, dimension: int) -> GroupIndex:
+        """Returns the in-memory index of recent groups, loading it on first use.
+
+        Only groups in the current embedding space (``dimension`` and model) are
+        indexed, so switching models starts new groups instead of failing.
+        """
+        if self._group_index is None:
+            # Get groups from the recent window only to limit DB transfer
+            existing_groups = await self._news_group_repository.find_recent(days=self._group_window.days)
+            self._group_index = self._group_index_factory(
+                existing_groups, dimension=dimension, model=self._embedding_model
+            )
+        else:
+            self._group_index.remove_created_before(datetime.utcnow() - self._group_window)
+        return self._group_index
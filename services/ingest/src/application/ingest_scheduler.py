@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+from libs.domain.value_objects.bias import Bias
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedJob:
+    """A single feed to be ingested in a scheduler run."""
+
+    name: str
+    url: str
+    bias: Bias
+    limit: int = 10
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc.lower()
+
+
+@dataclass(frozen=True)
+class FeedRunResult:
+    """Outcome and timing of one feed in a scheduler run."""
+
+    name: str
+    host: str
+    status: str
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+class IngestScheduler:
+    """Runs feed ingestion concurrently with global and per-host limits.
+
+    Each feed runs under its own timeout and failures are isolated: an error or
+    timeout in one feed is recorded in its result and never cancels the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        per_host_concurrency: int = 1,
+        feed_timeout: float = 120.0,
+    ):
+        if max_concurrency < 1 or per_host_concurrency < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._per_host_concurrency = per_host_concurrency
+        self._feed_timeout = feed_timeout
+
+    async def run(
+        self,
+        jobs: list[FeedJob],
+        ingest: Callable[[FeedJob], Awaitable[None]],
+    ) -> list[FeedRunResult]:
+        """Ingests all jobs and returns one result per job, in input order."""
+        global_limit = asyncio.Semaphore(self._max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        for job in jobs:
+            if job.host not in host_limits:
+                host_limits[job.host] = asyncio.Semaphore(self._per_host_concurrency)
+
+        async def run_one(job: FeedJob) -> FeedRunResult:
+            async with host_limits[job.host], global_limit:
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(ingest(job), timeout=self._feed_timeout)
+                    status, error = "ok", None
+                except asyncio.TimeoutError:
+                    status, error = "timeout", f"Timed out after {self._feed_timeout:.0f}s"
+                except Exception as e:
+                    logger.exception(f"Error ingesting {job.name}")
+                    status, error = "error", str(e)
+                duration = time.perf_counter() - started
+                return FeedRunResult(
+                    name=job.name, host=job.host, status=status, duration=duration, error=error
+                )
+
+        return list(await asyncio.gather(*(run_one(job) for job in jobs)))
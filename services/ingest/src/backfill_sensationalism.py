@@ -0,0 +1,271 @@
+"""Backfill sensationalism scores for historical articles through the OpenAI Batch API.
+
+Articles ingested before sensationalism analysis existed have no score. Instead
+of sending them through the synchronous chat path, this command writes them to a
+JSONL request file, lets the Batch API score them asynchronously (cheaper and
+with a separate, much larger quota) and bulk-updates the results afterwards.
+
+Usage:
+    python -m services.ingest.src.backfill_sensationalism prepare requests.jsonl
+    python -m services.ingest.src.backfill_sensationalism submit requests.jsonl [requests.1.jsonl ...]
+    python -m services.ingest.src.backfill_sensationalism collect <batch_id> results.jsonl
+    python -m services.ingest.src.backfill_sensationalism apply results.jsonl
+
+A Batch API input file holds at most 50,000 requests, so ``prepare`` splits
+large backfills into ``requests.jsonl``, ``requests.1.jsonl``, ... and ``submit``
+creates one batch per file.
+
+``prepare`` and ``apply`` only touch the database and local files, so they can
+be run (and tested) against a locally produced results file.
+"""
+import argparse
+import json
+import os
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import bindparam, update
+from sqlmodel import Session, select
+
+from services.ingest.src.infrastructure.database.data_version import bump_data_version
+from services.ingest.src.infrastructure.database.group_stats import refresh_group_stats
+from services.ingest.src.infrastructure.database.models import ArticleModel
+from services.ingest.src.infrastructure.services.llm_client import (
+    build_sensationalism_messages,
+    parse_sensationalism_result,
+)
+
+PAGE_SIZE = 1000
+DEFAULT_MODEL = "gpt-4o-mini"
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+# Batch API limits per input file; the size limit is 200 MB, kept with a margin
+MAX_REQUESTS_PER_FILE = 50_000
+MAX_BYTES_PER_FILE = 190 * 1024 * 1024
+
+
+def iter_unscored_articles(session: Session, page_size: int = PAGE_SIZE) -> Iterator[list[ArticleModel]]:
+    """Yields pages of articles without a sensationalism score, ordered by id.
+
+    Pages are fetched by keyset (``id > last id``) so each query stays cheap
+    however far into the table the backfill is.
+    """
+    last_id: Optional[str] = None
+    while True:
+        statement = select(ArticleModel).where(ArticleModel.sensationalism_score.is_(None))
+        if last_id is not None:
+            statement = statement.where(ArticleModel.id > last_id)
+        page = session.exec(statement.order_by(ArticleModel.id).limit(page_size)).all()
+        if not page:
+            return
+        yield page
+        last_id = page[-1].id
+
+
+def build_batch_request(article: ArticleModel, model: str = DEFAULT_MODEL) -> dict:
+    """Builds one Batch API request line; the article id is the custom_id."""
+    return {
+        "custom_id": article.id,
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_URL,
+        "body": {
+            "model": model,
+            "messages": build_sensationalism_messages(article.title, article.description or ""),
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+        },
+    }
+
+
+def batch_file_path(path: str, part: int) -> str:
+    """Returns the path of a request file part; the first part is ``path`` itself."""
+    if part == 0:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{part}{ext}"
+
+
+def write_batch_requests(
+    session: Session,
+    path: str,
+    model: str = DEFAULT_MODEL,
+    page_size: int = PAGE_SIZE,
+    max_requests_per_file: int = MAX_REQUESTS_PER_FILE,
+    max_bytes_per_file: int = MAX_BYTES_PER_FILE,
+) -> tuple[int, list[str]]:
+    """Writes a request line per unscored article, split into files the Batch API accepts.
+
+    Returns how many requests were written and the files, in order.
+    """
+    written = 0
+    paths: list[str] = []
+    f = None
+    requests_in_file = bytes_in_file = 0
+    try:
+        for page in iter_unscored_articles(session, page_size):
+            for article in page:
+                line = (json.dumps(build_batch_request(article, model), ensure_ascii=False) + "\n").encode("utf-8")
+                if (
+                    f is None
+                    or requests_in_file >= max_requests_per_file
+                    or bytes_in_file + len(line) > max_bytes_per_file
+                ):
+                    if f is not None:
+                        f.close()
+                    paths.append(batch_file_path(path, len(paths)))
+                    f = open(paths[-1], "wb")
+                    requests_in_file = bytes_in_file = 0
+                f.write(line)
+                requests_in_file += 1
+                bytes_in_file += len(line)
+                written += 1
+    finally:
+        if f is not None:
+            f.close()
+    return written, paths
+
+
+def parse_batch_results(lines: Iterable[str]) -> tuple[list[dict], int]:
+    """Parses Batch API output lines into update rows.
+
+    Returns the rows for successful, valid results plus the number of lines that
+    were skipped (API errors, non-200 responses or unusable content).
+    """
+    rows: list[dict] = []
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            article_id = record["custom_id"]
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                skipped += 1
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            result = parse_sensationalism_result(json.loads(content))
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+            result = None
+        if result is None:
+            skipped += 1
+            continue
+        score, explanation, metadata = result
+        rows.append({
+            "article_id": article_id,
+            "score": score,
+            "explanation": explanation,
+            "metadata": metadata,
+        })
+    return rows, skipped
+
+
+def apply_batch_results(session: Session, path: str, chunk_size: int = PAGE_SIZE) -> tuple[int, int]:
+    """Bulk-updates scores from a Batch API output file.
+
+    Only articles that are still unscored are updated, so applying the same file
+    twice (or after a synchronous run scored some articles) is harmless. The
+    stats of the touched groups are refreshed and the data version bumped in the
+    same transaction, so rankings and cached API responses see the new scores.
+    Returns (updated, skipped).
+    """
+    with open(path, encoding="utf-8") as f:
+        rows, skipped = parse_batch_results(f)
+
+    table = ArticleModel.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("article_id"))
+        .where(table.c.sensationalism_score.is_(None))
+        .values(
+            sensationalism_score=bindparam("score"),
+            sensationalism_explanation=bindparam("explanation"),
+            analysis_metadata=bindparam("metadata"),
+        )
+    )
+    updated = 0
+    group_ids: set[str] = set()
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        group_ids.update(session.execute(
+            select(table.c.group_id)
+            .where(table.c.id.in_([row["article_id"] for row in chunk]))
+            .where(table.c.sensationalism_score.is_(None))
+            .where(table.c.group_id.is_not(None))
+            .distinct()
+        ).scalars())
+        # One executemany round trip per chunk instead of a statement per article
+        result = session.execute(statement, chunk)
+        updated += result.rowcount
+    if not updated:
+        session.commit()
+        return updated, skipped
+    refresh_group_stats(session, group_ids)
+    # Commits the score updates and the refreshed stats together
+    bump_data_version(session)
+    return updated, skipped
+
+
+def submit_batch(path: str) -> str:
+    """Uploads a request file and creates a batch; returns the batch id."""
+    from openai import OpenAI
+
+    client = OpenAI()
+    with open(path, "rb") as f:
+        uploaded = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=uploaded.id,
+        endpoint=CHAT_COMPLETIONS_URL,
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def collect_batch(batch_id: str, path: str) -> str:
+    """Downloads the output of a completed batch; returns the batch status."""
+    from openai import OpenAI
+
+    client = OpenAI()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status == "completed" and batch.output_file_id:
+        with open(path, "wb") as f:
+            f.write(client.files.content(batch.output_file_id).content)
+    return batch.status
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    prepare = commands.add_parser("prepare", help="write Batch API requests for unscored articles")
+    prepare.add_argument("path")
+    prepare.add_argument("--model", default=DEFAULT_MODEL)
+    prepare.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    submit = commands.add_parser("submit", help="upload request files and create a batch per file")
+    submit.add_argument("paths", nargs="+")
+    collect = commands.add_parser("collect", help="download the results of a completed batch")
+    collect.add_argument("batch_id")
+    collect.add_argument("path")
+    apply = commands.add_parser("apply", help="store scores from a Batch API results file")
+    apply.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "submit":
+        for path in args.paths:
+            print(f"Created batch {submit_batch(path)} for {path}")
+        return
+    if args.command == "collect":
+        status = collect_batch(args.batch_id, args.path)
+        print(f"Batch {args.batch_id} is {status}" + (f"; results written to {args.path}" if status == "completed" else ""))
+        return
+
+    from services.ingest.src.infrastructure.database.db import get_session
+
+    with get_session() as session:
+        if args.command == "prepare":
+            written, paths = write_batch_requests(session, args.path, model=args.model, page_size=args.page_size)
+            print(f"Written {written} requests to {', '.join(paths) or 'no file'}")
+        else:
+            updated, skipped = apply_batch_results(session, args.path)
+            print(f"Updated {updated} articles, skipped {skipped} results")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from pathlib import Path
 from sqlmodel import select
 from services.ingest.src.infrastructure.database.db import get_session
 from services.ingest.src.infrastructure.database.models import (
-    ArticleModel, NewsGroupModel, SourceModel,
+    ArticleModel, GroupStatsModel, NewsGroupModel, SourceModel,
 )
 
 NEWS_LIMIT = 100
@@ -17,7 +17,7 @@ def generate_news(session) -> dict:
     rows = session.exec(
         select(ArticleModel, SourceModel)
         .join(SourceModel, ArticleModel.source_id == SourceModel.id, isouter=True)
-        .order_by(ArticleModel.published_at.desc())
+        .order_by(ArticleModel.published_at.desc().nulls_last())
         .limit(NEWS_LIMIT)
     ).all()
     news = []
@@ -37,18 +37,31 @@ def generate_news(session) -> dict:
 
 
 def generate_groups(session) -> dict:
+    # Rank from the summary table ingest maintains, then load only the top groups' articles
+    ranking = session.exec(
+        select(GroupStatsModel.group_id)
+        .where(GroupStatsModel.article_count >= MIN_ARTICLES)
+        .order_by(
+            GroupStatsModel.article_count.desc(),
+            GroupStatsModel.latest_published_at.desc(),
+            GroupStatsModel.group_id.desc(),
+        )
+        .limit(GROUPS_LIMIT)
+    ).all()
+    group_ids = list(ranking)
+    if not group_ids:
+        return {"groups": []}
+
     rows = session.exec(
         select(ArticleModel, SourceModel)
         .join(SourceModel, ArticleModel.source_id == SourceModel.id, isouter=True)
-        .where(ArticleModel.group_id.is_not(None))
+        .where(ArticleModel.group_id.in_(group_ids))
+        .order_by(ArticleModel.published_at.desc().nulls_last(), ArticleModel.id)
     ).all()
 
-    groups_dict: dict[str, list[dict]] = {}
+    groups_dict: dict[str, list[dict]] = {gid: [] for gid in group_ids}
     for article, source in rows:
-        gid = article.group_id
-        if gid not in groups_dict:
-            groups_dict[gid] = []
-        groups_dict[gid].append({
+        groups_dict[article.group_id].append({
             "id": article.id,
             "title": article.title,
             "link": article.link,
@@ -60,10 +73,9 @@ def generate_groups(session) -> dict:
             "sensationalism_explanation": article.sensationalism_explanation,
         })
 
-    qualifying_ids = [gid for gid, arts in groups_dict.items() if len(arts) >= MIN_ARTICLES]
     newsgroups = session.exec(
         select(NewsGroupModel.id, NewsGroupModel.created_at)
-        .where(NewsGroupModel.id.in_(qualifying_ids))
+        .where(NewsGroupModel.id.in_(group_ids))
     ).all()
     newsgroup_map = {ng.id: ng for ng in newsgroups}
 
@@ -73,10 +85,9 @@ def generate_groups(session) -> dict:
             "created_at": newsgroup_map[gid].created_at.isoformat() if gid in newsgroup_map else None,
             "articles": groups_dict[gid],
         }
-        for gid in qualifying_ids
+        for gid in group_ids
     ]
-    output.sort(key=lambda g: len(g["articles"]), reverse=True)
-    return {"groups": output[:GROUPS_LIMIT]}
+    return {"groups": output}
 
 
 def main():
@@ -0,0 +1,24 @@
+"""The data version token that lets the API drop cached responses after ingest."""
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session
+
+from services.ingest.src.infrastructure.database.models import DataVersionModel
+
+
+def bump_data_version(session: Session) -> int:
+    """Increments the data version and commits; returns the new version."""
+    table = DataVersionModel.__table__
+    result = session.execute(
+        update(table)
+        .where(table.c.id == 1)
+        .values(version=table.c.version + 1, updated_at=datetime.utcnow())
+        .returning(table.c.version)
+    ).first()
+    if result is None:
+        session.add(DataVersionModel(id=1, version=1))
+        session.commit()
+        return 1
+    session.commit()
+    return result.version
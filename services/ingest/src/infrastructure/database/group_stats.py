@@ -0,0 +1,74 @@
+"""Incremental maintenance of the ``group_stats`` summary table."""
+from typing import Iterable
+
+from sqlalchemy import case, delete, exists, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+
+from services.ingest.src.infrastructure.database.models import (
+    ArticleModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
+
+CHUNK_SIZE = 1000
+
+STAT_COLUMNS = [
+    "group_id",
+    "article_count",
+    "source_count",
+    "left_count",
+    "center_count",
+    "right_count",
+    "latest_published_at",
+    "sensationalism_mean",
+]
+
+
+def refresh_group_stats(session: Session, group_ids: Iterable[str]) -> None:
+    """Recomputes the ``group_stats`` rows of the given groups from their articles.
+
+    Each chunk of groups is one INSERT ... SELECT ... ON CONFLICT DO UPDATE, so
+    the cost follows the number of touched groups, not the article table. Groups
+    left without articles lose their row. The caller commits.
+    """
+    ids = sorted({str(group_id) for group_id in group_ids if group_id is not None})
+    article = ArticleModel.__table__
+    source = SourceModel.__table__
+    group = NewsGroupModel.__table__
+    stats = GroupStatsModel.__table__
+    dialect = sqlite if session.get_bind().dialect.name == "sqlite" else postgresql
+
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+        summary = (
+            select(
+                article.c.group_id,
+                func.count(),
+                func.count(func.distinct(article.c.source_id)),
+                func.sum(case((source.c.bias == "left", 1), else_=0)),
+                func.sum(case((source.c.bias == "center", 1), else_=0)),
+                func.sum(case((source.c.bias == "right", 1), else_=0)),
+                func.coalesce(func.max(article.c.published_at), func.min(group.c.created_at)),
+                func.avg(article.c.sensationalism_score),
+            )
+            .select_from(
+                article.join(group, article.c.group_id == group.c.id)
+                .outerjoin(source, article.c.source_id == source.c.id)
+            )
+            .where(article.c.group_id.in_(chunk))
+            .group_by(article.c.group_id)
+        )
+        upsert = dialect.insert(stats).from_select(STAT_COLUMNS, summary)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["group_id"],
+            set_={column: upsert.excluded[column] for column in STAT_COLUMNS[1:]},
+        )
+        session.execute(upsert)
+        session.execute(
+            delete(stats).where(
+                stats.c.group_id.in_(chunk),
+                ~exists().where(article.c.group_id == stats.c.group_id),
+            )
+        )
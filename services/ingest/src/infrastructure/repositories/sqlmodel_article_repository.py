@@ -1,5 +1,6 @@
 from typing import Optional
 from uuid import UUID, uuid5, NAMESPACE_DNS
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
 
 from libs.domain.entities.article import Article
@@ -17,6 +18,22 @@ class SqlModelArticleRepository(ArticleRepository):
         self._session.commit()
         self._session.refresh(article_model)
 
+    async def save_many(self, articles: list[Article], commit: bool = True) -> int:
+        if not articles:
+            return 0
+        rows = [self._to_model(article).model_dump() for article in articles]
+        # One multi-row INSERT and a single commit instead of a round trip per article
+        dialect = sqlite if self._session.get_bind().dialect.name == "sqlite" else postgresql
+        statement = (
+            dialect.insert(ArticleModel.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["link"])
+        )
+        result = self._session.execute(statement)
+        if commit:
+            self._session.commit()
+        return result.rowcount
+
     async def find_by_id(self, article_id: UUID) -> Optional[Article]:
         result = self._session.exec(select(ArticleModel).where(ArticleModel.id == str(article_id))).first()
         return self._to_entity(result) if result else None
@@ -25,6 +42,12 @@ class SqlModelArticleRepository(ArticleRepository):
         result = self._session.exec(select(ArticleModel).where(ArticleModel.link == link)).first()
         return self._to_entity(result) if result else None
 
+    async def find_existing_links(self, links: list[str]) -> set[str]:
+        if not links:
+            return set()
+        results = self._session.exec(select(ArticleModel.link).where(ArticleModel.link.in_(links))).all()
+        return set(results)
+
     async def find_by_source_id(self, source_id: UUID, limit: int = 20) -> list[Article]:
         results = self._session.exec(
             select(ArticleModel).where(ArticleModel.source_id == str(source_id)).limit(limit)
@@ -1,19 +1,44 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID, uuid5, NAMESPACE_DNS
+from sqlalchemy import bindparam, text, update
 from sqlmodel import Session, select
 
-from libs.domain.entities.news_group import NewsGroup
+from libs.domain.entities.news_group import Embedding, NewsGroup
+from libs.domain.services.embedding_codec import EmbeddingCodec
 from libs.domain.repositories.news_group_repository import NewsGroupRepository
+from libs.domain.services.group_matcher import GroupMatcher
 from libs.domain.value_objects.topic_hash import TopicHash
+from services.ingest.src.infrastructure.database.group_stats import refresh_group_stats
 from services.ingest.src.infrastructure.database.models import NewsGroupModel
 
 
 class SqlModelNewsGroupRepository(NewsGroupRepository):
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        use_pgvector: bool = False,
+        embedding_codec: Optional[EmbeddingCodec] = None,
+    ):
+        """
+        Args:
+            session: Database session.
+            use_pgvector: Keep the pgvector ``embedding_vector`` column in sync and run
+                similarity search inside Postgres. Requires the pgvector migration.
+            embedding_codec: Also store a quantized copy of each centroid in
+                ``embedding_blob``. The float32 ``embedding`` stays the source of
+                truth, so running-mean updates never build on quantization error.
+        """
         self._session = session
+        self._use_pgvector = use_pgvector
+        self._embedding_codec = embedding_codec
+        # Embedding sizes whose partial HNSW index is known to exist, and those searched without one
+        self._indexed_dimensions: set[int] = set()
+        self._missing_dimensions: set[int] = set()
+        # Whether pgvector can keep scanning HNSW until enough rows pass the filters (0.8+)
+        self._iterative_scan: Optional[bool] = None
 
-    async def save(self, group: NewsGroup) -> None:
+    async def save(self, group: NewsGroup, commit: bool = True) -> None:
         # Check if exists first by topic_hash (unique field)
         existing = await self.find_by_topic_hash(group.topic_hash)
         if existing:
@@ -23,9 +48,61 @@ class SqlModelNewsGroupRepository(NewsGroupRepository):
         # Add new group
         group_model = self._to_model(group)
         self._session.add(group_model)
-        self._session.commit()
+        if self._use_pgvector and group.embedding is not None:
+            self._session.flush()
+            self._session.execute(
+                text("UPDATE newsgroup SET embedding_vector = CAST(:embedding AS vector) WHERE id = :id"),
+                {"embedding": self._to_vector_literal(group.embedding), "id": group_model.id},
+            )
+        if commit:
+            self._session.commit()
+        else:
+            self._session.flush()
         self._session.refresh(group_model)
 
+    async def update_centroids(self, groups: list[NewsGroup], commit: bool = True) -> None:
+        groups = [group for group in groups if group.embedding is not None]
+        if not groups:
+            return
+        rows = []
+        for group in groups:
+            model = self._to_model(group)
+            rows.append({
+                "group_id": model.id,
+                "centroid": model.embedding,
+                "centroid_blob": model.embedding_blob,
+                "count": model.member_count,
+            })
+        table = NewsGroupModel.__table__
+        # One executemany round trip for every group touched by the feed
+        self._session.execute(
+            update(table)
+            .where(table.c.id == bindparam("group_id"))
+            .values(
+                embedding=bindparam("centroid"),
+                embedding_blob=bindparam("centroid_blob"),
+                member_count=bindparam("count"),
+            ),
+            rows,
+        )
+        if self._use_pgvector:
+            self._session.execute(
+                text("UPDATE newsgroup SET embedding_vector = CAST(:embedding AS vector) WHERE id = :id"),
+                [
+                    {"embedding": self._to_vector_literal(group.embedding), "id": str(group.id)}
+                    for group in groups
+                ],
+            )
+        if commit:
+            self._session.commit()
+
+    async def refresh_stats(self, group_ids: list[UUID], commit: bool = True) -> None:
+        if not group_ids:
+            return
+        refresh_group_stats(self._session, [str(group_id) for group_id in group_ids])
+        if commit:
+            self._session.commit()
+
     async def find_by_id(self, group_id: UUID) -> Optional[NewsGroup]:
         result = self._session.exec(select(NewsGroupModel).where(NewsGroupModel.id == str(group_id))).first()
         return self._to_entity(result) if result else None
@@ -49,13 +126,125 @@ class SqlModelNewsGroupRepository(NewsGroupRepository):
         ).all()
         return [self._to_entity(model) for model in results]
 
+    async def find_most_similar(
+        self,
+        embedding: list[float],
+        since: datetime,
+        threshold: float,
+        k: int = 1,
+        model: Optional[str] = None,
+    ) -> list[tuple[NewsGroup, float]]:
+        """Finds the k most similar groups created since a date."""
+        if not self._use_pgvector:
+            results = self._session.exec(
+                select(NewsGroupModel).where(NewsGroupModel.created_at >= since)
+            ).all()
+            matcher = GroupMatcher(
+                [self._to_entity(group_model) for group_model in results], dimension=len(embedding), model=model
+            )
+            return matcher.most_similar(embedding, threshold, k)
+
+        dimension = len(embedding)
+        params = {"embedding": self._to_vector_literal(embedding), "since": since, "k": k}
+        filters = (
+            f"created_at >= :since AND embedding_dimension = {dimension} AND embedding_vector IS NOT NULL"
+        )
+        if model is not None:
+            # Groups stored before the model was tracked are only filtered by size
+            filters += " AND (embedding_model IS NULL OR embedding_model = :model)"
+            params["model"] = model
+        # `<=>` is cosine distance; the typed cast and the literal size match the
+        # partial HNSW index of this dimension
+        distance = f"embedding_vector::vector({dimension}) <=> CAST(:embedding AS vector({dimension}))"
+        if self._has_vector_index(dimension) and self._supports_iterative_scan():
+            # A plain HNSW scan yields only ef_search candidates and the window filter
+            # runs after it, so recent groups would drop out as history grows. An
+            # iterative scan keeps walking the graph until k rows pass the filters
+            self._session.execute(text("SET LOCAL hnsw.iterative_scan = strict_order"))
+            candidates = f"newsgroup WHERE {filters}"
+        else:
+            # Otherwise the window is filtered first (OFFSET 0 keeps the planner from
+            # flattening the subquery into an index scan) and ranked exactly
+            candidates = f"(SELECT id, embedding_vector FROM newsgroup WHERE {filters} OFFSET 0) AS recent"
+        rows = self._session.execute(
+            text(f"SELECT id, 1 - ({distance}) AS similarity FROM {candidates} ORDER BY {distance} LIMIT :k"),
+            params,
+        ).all()
+        similarities = {row.id: float(row.similarity) for row in rows if row.similarity >= threshold}
+        if not similarities:
+            return []
+
+        models = self._session.exec(
+            select(NewsGroupModel).where(NewsGroupModel.id.in_(list(similarities)))
+        ).all()
+        matches = [(self._to_entity(model), similarities[model.id]) for model in models]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def create_missing_vector_indexes(self) -> list[int]:
+        """Creates the HNSW index of every embedding size searched without one; returns those sizes.
+
+        The migration indexes the sizes already stored; a newly configured size is
+        searched exactly until this runs. It uses its own autocommit connection and
+        CREATE INDEX CONCURRENTLY, which waits for open transactions, so call it
+        after ingest has committed, never from inside a feed's transaction.
+        """
+        created = []
+        with self._session.get_bind().connect() as connection:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            for dimension in sorted(self._missing_dimensions):
+                # pgvector only indexes fixed-size vectors, so each size gets its own partial index
+                connection.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_newsgroup_embedding_vector_{dimension} "
+                    f"ON newsgroup USING hnsw ((embedding_vector::vector({dimension})) vector_cosine_ops) "
+                    f"WHERE embedding_dimension = {dimension}"
+                ))
+                self._indexed_dimensions.add(dimension)
+                created.append(dimension)
+        self._missing_dimensions.clear()
+        return created
+
+    def _has_vector_index(self, dimension: int) -> bool:
+        """Whether the partial HNSW index of an embedding size exists; missing ones are noted."""
+        if dimension in self._indexed_dimensions:
+            return True
+        exists = self._session.execute(
+            text("SELECT 1 FROM pg_indexes WHERE tablename = 'newsgroup' AND indexname = :name"),
+            {"name": f"ix_newsgroup_embedding_vector_{dimension}"},
+        ).first() is not None
+        if exists:
+            self._indexed_dimensions.add(dimension)
+        else:
+            self._missing_dimensions.add(dimension)
+        return exists
+
+    def _supports_iterative_scan(self) -> bool:
+        if self._iterative_scan is None:
+            version = self._session.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            ).scalar()
+            major_minor = tuple(int(part) for part in (version or "0.0").split(".")[:2])
+            self._iterative_scan = major_minor >= (0, 8)
+        return self._iterative_scan
+
+    @staticmethod
+    def _to_vector_literal(embedding: Embedding) -> str:
+        return "[" + ",".join(repr(float(value)) for value in embedding) + "]"
+
     def _to_model(self, group: NewsGroup) -> NewsGroupModel:
+        embedding, embedding_blob = group.embedding, None
+        if self._embedding_codec is not None and group.embedding is not None:
+            embedding_blob = self._embedding_codec.encode(group.embedding)
         return NewsGroupModel(
             id=str(group.id),
             topic_hash=group.topic_hash.value,
             summary=group.summary,
             created_at=group.created_at,
-            embedding=group.embedding,
+            embedding=embedding,
+            embedding_blob=embedding_blob,
+            member_count=group.member_count,
+            embedding_model=group.embedding_model,
+            embedding_dimension=group.embedding_dimension,
         )
 
     def _to_entity(self, model: NewsGroupModel) -> NewsGroup:
@@ -71,11 +260,19 @@ class SqlModelNewsGroupRepository(NewsGroupRepository):
             except (ValueError, AttributeError):
                 model_id = uuid5(NAMESPACE_DNS, f"newsgroup-{model.id}")
         
+        # The float32 centroid is authoritative; groups written while only the
+        # quantized copy was kept fall back to it (decoded straight to float32)
+        embedding = model.embedding
+        if embedding is None and model.embedding_blob:
+            embedding = EmbeddingCodec.decode(model.embedding_blob)
+
         return NewsGroup.build(
             id=model_id,
             topic_hash=TopicHash(value=model.topic_hash),
             summary=model.summary,
             created_at=model.created_at,
-            embedding=model.embedding,
+            embedding=embedding,
+            member_count=model.member_count or 0,
+            embedding_model=model.embedding_model,
         )
 
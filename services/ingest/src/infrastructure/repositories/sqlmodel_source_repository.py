@@ -12,17 +12,27 @@ class SqlModelSourceRepository(SourceRepository):
     def __init__(self, session: Session):
         self._session = session
 
-    async def save(self, source: Source) -> None:
+    async def save(self, source: Source, commit: bool = True) -> None:
         # Check if exists first by name (unique field)
-        existing = await self.find_by_name(source.name)
+        existing = self._session.exec(select(SourceModel).where(SourceModel.name == source.name)).first()
         if existing:
-            # Source already exists, no need to save again
+            # Source already exists, only the feed cache validators can change
+            existing.etag = source.etag
+            existing.last_modified = source.last_modified
+            self._session.add(existing)
+            if commit:
+                self._session.commit()
+            else:
+                self._session.flush()
             return
         
         # Add new source
         source_model = self._to_model(source)
         self._session.add(source_model)
-        self._session.commit()
+        if commit:
+            self._session.commit()
+        else:
+            self._session.flush()
         self._session.refresh(source_model)
 
     async def find_by_id(self, source_id: UUID) -> Optional[Source]:
@@ -52,6 +62,8 @@ class SqlModelSourceRepository(SourceRepository):
             name=source.name,
             url=source.url,
             bias=source.bias.value,
+            etag=source.etag,
+            last_modified=source.last_modified,
         )
 
     def _to_entity(self, model: SourceModel) -> Source:
@@ -76,5 +88,7 @@ class SqlModelSourceRepository(SourceRepository):
             name=model.name,
             url=model.url,
             bias=bias,
+            etag=model.etag,
+            last_modified=model.last_modified,
         )
 
@@ -0,0 +1,14 @@
+from sqlmodel import Session
+
+from libs.domain.repositories.unit_of_work import UnitOfWork
+
+
+class SqlModelUnitOfWork(UnitOfWork):
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def commit(self) -> None:
+        self._session.commit()
+
+    async def rollback(self) -> None:
+        self._session.rollback()
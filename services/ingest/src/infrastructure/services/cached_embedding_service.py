@@ -0,0 +1,67 @@
+"""Embedding service decorator that serves repeated texts from a persistent cache."""
+import hashlib
+import re
+
+from libs.domain.services.embedding_service import EmbeddingService
+from services.ingest.src.infrastructure.services.sqlite_embedding_cache import (
+    EmbeddingCacheStats,
+    SqliteEmbeddingCache,
+)
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """Wraps another EmbeddingService and only calls it for texts not seen before.
+
+    Entries are keyed by the model name and a hash of the normalized text, so the
+    same title coming from several feeds or reruns is embedded once.
+    """
+
+    def __init__(self, inner: EmbeddingService, cache: SqliteEmbeddingCache, model: str):
+        """
+        Initialize the cached embedding service.
+        
+        Args:
+            inner: Embedding service used on cache misses.
+            cache: Persistent store for computed vectors.
+            model: Name of the embedding model, part of the cache key.
+        """
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+
+    @property
+    def model(self) -> str:
+        """Name of the wrapped embedding model."""
+        return self._model
+
+    def generate_embedding(self, text: str) -> list[float]:
+        return self.generate_embeddings([text])[0]
+
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        hashes = [self._text_hash(text) for text in texts]
+        found = self._cache.get_many(self._model, hashes)
+
+        # Embed each missing text once, even if it repeats within the batch
+        missing: dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in found and text_hash not in missing:
+                missing[text_hash] = text
+
+        if missing:
+            vectors = self._inner.generate_embeddings(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._cache.put_many(self._model, computed)
+            found.update(computed)
+
+        return [found[text_hash] for text_hash in hashes]
+
+    def calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
+        return self._inner.calculate_similarity(embedding1, embedding2)
+
+    def stats(self) -> EmbeddingCacheStats:
+        return self._cache.stats()
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        normalized = re.sub(r"\s+", " ", text).strip()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
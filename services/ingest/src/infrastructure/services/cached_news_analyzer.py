@@ -0,0 +1,68 @@
+"""News analyzer decorator that serves repeated articles from a persistent cache."""
+import hashlib
+import re
+from typing import Dict, List, Tuple
+
+from libs.domain.services.analysis_service import NewsAnalyzer
+from services.ingest.src.infrastructure.services.sqlite_analysis_cache import (
+    AnalysisCacheStats,
+    SqliteAnalysisCache,
+)
+
+
+class CachedNewsAnalyzer(NewsAnalyzer):
+    """Wraps another NewsAnalyzer and only calls it for articles not analyzed before.
+
+    Entries are keyed by model, prompt version and a hash of the normalized title
+    and description, so wire stories syndicated across sources are scored once
+    and changing the prompt invalidates old scores.
+    """
+
+    def __init__(self, inner: NewsAnalyzer, cache: SqliteAnalysisCache, model: str, prompt_version: str):
+        """
+        Initialize the cached news analyzer.
+
+        Args:
+            inner: Analyzer used on cache misses.
+            cache: Persistent store for analysis results.
+            model: Name of the LLM, part of the cache key.
+            prompt_version: Version of the analysis prompt, part of the cache key.
+        """
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+        self._prompt_version = prompt_version
+
+    async def analyze_sensationalism(self, title: str, content: str) -> Tuple[float, str, Dict]:
+        return (await self.analyze_sensationalism_batch([(title, content)]))[0]
+
+    async def analyze_sensationalism_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[float, str, Dict]]:
+        hashes = [self._content_hash(title, content) for title, content in items]
+        found = self._cache.get_many(self._model, self._prompt_version, hashes)
+
+        # Analyze each missing article once, even if it repeats within the batch
+        missing: dict[str, Tuple[str, str]] = {}
+        for item, content_hash in zip(items, hashes):
+            if content_hash not in found and content_hash not in missing:
+                missing[content_hash] = item
+
+        if missing:
+            results = await self._inner.analyze_sensationalism_batch(list(missing.values()))
+            computed = dict(zip(missing.keys(), results))
+            # Failed analyses come back without metadata; retry them next run instead of caching
+            self._cache.put_many(
+                self._model,
+                self._prompt_version,
+                {content_hash: result for content_hash, result in computed.items() if result[2]},
+            )
+            found.update(computed)
+
+        return [found[content_hash] for content_hash in hashes]
+
+    def stats(self) -> AnalysisCacheStats:
+        return self._cache.stats()
+
+    @staticmethod
+    def _content_hash(title: str, content: str) -> str:
+        normalized = "\n".join(re.sub(r"\s+", " ", text).strip() for text in (title, content))
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,165 @@
+"""Local sensationalism pre-filter that only escalates uncertain articles to another analyzer."""
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from libs.domain.services.analysis_service import NewsAnalyzer
+
+# Evaluative/emotional adjectives (type B in SENSATIONALISM_PROMPT), masculine singular.
+# Gender and number variants are generated by ``_inflect``.
+SUBJECTIVE_ADJECTIVES = (
+    "absurdo", "alarmante", "aterrador", "atroz", "bochornoso", "brutal", "burdo", "catastrófico",
+    "chocante", "cruel", "delirante", "demoledor", "desastroso", "descarado", "descomunal",
+    "desolador", "despiadado", "desproporcionado", "devastador", "dramático", "enorme",
+    "escalofriante", "escandaloso", "espantoso", "espectacular", "estremecedor", "estrepitoso",
+    "feroz", "flagrante", "grotesco", "horrible", "humillante", "impactante",
+    "impresentable", "incalificable", "increíble", "indignante", "inaceptable", "inadmisible",
+    "inaudito", "incendiario", "infame", "insólito", "insoportable", "insultante", "intolerable",
+    "lamentable", "lúgubre", "macabro", "monstruoso", "nefasto", "obsceno", "patético",
+    "polémico", "preocupante", "ridículo", "salvaje", "sangriento", "sonrojante",
+    "sorprendente", "terrible", "terrorífico", "tóxico", "trágico", "tremendo", "vergonzoso",
+    "vil", "colosal", "dantesco", "demencial", "deplorable",
+    "desmesurado", "esperpéntico", "fatídico", "funesto", "gravísimo", "histérico",
+    "hiriente", "irresponsable", "miserable", "nauseabundo", "penoso", "rotundo",
+    "surrealista", "temerario", "tenebroso", "trepidante", "vergonzante", "virulento",
+)
+
+# Verbs and markers that introduce a verifiable statement
+ATTRIBUTION_MARKERS = frozenset({
+    "según", "afirma", "afirmó", "asegura", "aseguró", "declara", "declaró", "anuncia", "anunció",
+    "informa", "informó", "confirma", "confirmó", "explica", "explicó", "detalla", "detalló",
+    "indica", "indicó", "señala", "señaló", "aprueba", "aprobó", "registra", "registró",
+    "publica", "publicó", "recoge", "recogió", "cifra", "cifró",
+})
+
+_WORD = re.compile(r"[a-záéíóúüñ]+", re.IGNORECASE)
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*\s*%?")
+_QUOTE = re.compile(r"[\"“«][^\"”»]{3,}[\"”»]")
+_SENTENCE = re.compile(r"[^.!?;:]+[.!?;:]?")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def _strip_accents(word: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", word) if unicodedata.category(c) != "Mn")
+
+
+def _inflect(adjective: str) -> set[str]:
+    if adjective.endswith("o"):
+        stem = adjective[:-1]
+        forms = {adjective, stem + "a", stem + "os", stem + "as"}
+    elif adjective.endswith("e"):
+        forms = {adjective, adjective + "s"}
+    elif adjective.endswith("z"):
+        forms = {adjective, adjective[:-1] + "ces"}
+    else:
+        forms = {adjective, adjective + "es", adjective + "a", adjective + "as"}
+    # Compared without accents so feeds that drop them still match
+    return {_strip_accents(form) for form in forms}
+
+
+_LEXICON = frozenset(form for adjective in SUBJECTIVE_ADJECTIVES for form in _inflect(adjective))
+_MARKERS = frozenset(_strip_accents(marker) for marker in ATTRIBUTION_MARKERS)
+
+
+@dataclass(frozen=True)
+class LexiconScore:
+    """Local estimate of the sensationalism index for one article."""
+
+    score: float
+    adjectives: List[str]
+    facts: int
+    words: int
+
+
+def score_text(title: str, content: str) -> LexiconScore:
+    """Estimates IS = A_sub / (A_sub + H) with a subjective-adjective lexicon and assertion heuristics.
+
+    H counts sentences plus extra facts inside them: figures, direct quotes and
+    attribution verbs. A_sub counts lexicon hits.
+    """
+    text = _TAG.sub(" ", f"{title}. {content}")
+    words = [_strip_accents(word.lower()) for word in _WORD.findall(text)]
+    adjectives = [word for word in words if word in _LEXICON]
+    sentences = sum(1 for sentence in _SENTENCE.findall(text) if _WORD.search(sentence))
+    facts = (
+        sentences
+        + len(_NUMBER.findall(text))
+        + len(_QUOTE.findall(text))
+        + sum(1 for word in words if word in _MARKERS)
+    )
+    total = len(adjectives) + facts
+    return LexiconScore(
+        score=len(adjectives) / total if total else 0.0,
+        adjectives=adjectives,
+        facts=facts,
+        words=len(words),
+    )
+
+
+class LexiconNewsAnalyzer(NewsAnalyzer):
+    """Scores articles locally and escalates only uncertain ones to ``fallback``.
+
+    Articles whose local score is at most ``neutral_below`` (with enough text to
+    judge) or at least ``sensational_above`` are answered locally; everything in
+    between, and very short texts, go to the fallback analyzer.
+    """
+
+    def __init__(
+        self,
+        fallback: NewsAnalyzer,
+        neutral_below: float = 0.0,
+        sensational_above: float = 0.6,
+        min_words: int = 12,
+    ):
+        self._fallback = fallback
+        self._neutral_below = neutral_below
+        self._sensational_above = sensational_above
+        self._min_words = min_words
+        self.local_count = 0
+        self.escalated_count = 0
+
+    @property
+    def escalation_rate(self) -> float:
+        total = self.local_count + self.escalated_count
+        return self.escalated_count / total if total else 0.0
+
+    def is_confident(self, estimate: LexiconScore) -> bool:
+        if estimate.score >= self._sensational_above:
+            return True
+        return estimate.score <= self._neutral_below and estimate.words >= self._min_words
+
+    async def analyze_sensationalism(self, title: str, content: str) -> Tuple[float, str, Dict]:
+        return (await self.analyze_sensationalism_batch([(title, content)]))[0]
+
+    async def analyze_sensationalism_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[float, str, Dict]]:
+        results: List[Tuple[float, str, Dict]] = [None] * len(items)
+        escalated: List[int] = []
+        for i, (title, content) in enumerate(items):
+            estimate = score_text(title, content)
+            if self.is_confident(estimate):
+                results[i] = self._to_result(estimate)
+            else:
+                escalated.append(i)
+
+        if escalated:
+            fallback_results = await self._fallback.analyze_sensationalism_batch([items[i] for i in escalated])
+            for i, result in zip(escalated, fallback_results):
+                results[i] = result
+
+        self.local_count += len(items) - len(escalated)
+        self.escalated_count += len(escalated)
+        return results
+
+    @staticmethod
+    def _to_result(estimate: LexiconScore) -> Tuple[float, str, Dict]:
+        explanation = (
+            f"Estimación local: {len(estimate.adjectives)} adjetivos valorativos "
+            f"frente a {estimate.facts} unidades de aserción."
+        )
+        metadata = {
+            "hechos_count": estimate.facts,
+            "adjetivos_subjetivos": estimate.adjectives,
+            "analyzer": "lexicon",
+        }
+        return round(estimate.score, 4), explanation, metadata
@@ -1,9 +1,13 @@
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Tuple, Dict, Any
+import random
+from typing import Tuple, Dict, Any, List, Optional
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
 from libs.domain.services.analysis_service import NewsAnalyzer
+from services.ingest.src.infrastructure.services.rate_limiter import TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -33,23 +37,105 @@ Formato de Salida (JSON estricto):
 }}
 """
 
+BATCH_SENSATIONALISM_PROMPT = """
+Rol: Eres un lingüista experto en análisis político y detección de sesgos.
+
+Objetivo: Calcular el "Índice de Sensacionalismo" (IS) de CADA noticia de la lista, basado en la densidad de adjetivación subjetiva por unidad de información.
+
+Instrucciones (aplícalas a cada noticia por separado):
+1. Segmentación de Hechos (Denominador): Identifica "Unidades de Aserción" (hechos verificables, datos, citas directas). Cuenta total = H.
+2. Extracción de Adjetivos (Numerador):
+   - Tipo A (Funcionales): Descriptivos, técnicos (ej: "pública", "anual"). Valor = 0.
+   - Tipo B (Valorativos/Emocionales): Juicios de valor, carga emocional (ej: "preocupante", "brutal", "vergonzoso"). Valor = 1. Cuenta total = A_sub.
+3. Cálculo: IS = A_sub / (A_sub + H). (Si A_sub=0 y H=0, IS=0).
+4. El resultado es naturalmente entre 0.0 y 1.0. IS > 0.5 indica predominio sensacionalista.
+
+Noticias a analizar (JSON, cada una con su "id", "titulo" y "descripcion"):
+{articles}
+
+Formato de Salida (JSON estricto, un elemento por noticia con el mismo "id"):
+{{
+  "resultados": [
+    {{
+      "id": "string",
+      "hechos_count": int,
+      "adjetivos_subjetivos": [lista de strings],
+      "explicacion_breve": "string justificando",
+      "indice_sensacionalismo": float (0.0 - 1.0)
+    }}
+  ]
+}}
+"""
+
+# Changes whenever either prompt is edited, so cached scores from older prompts are not reused
+PROMPT_VERSION = hashlib.sha256(
+    (SENSATIONALISM_PROMPT + BATCH_SENSATIONALISM_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
+
+def build_sensationalism_messages(title: str, content: str) -> list[dict]:
+    """Chat messages asking for the sensationalism index of a single article."""
+    return [
+        {"role": "system", "content": "You are a helpful assistant that outputs JSON."},
+        {"role": "user", "content": SENSATIONALISM_PROMPT.format(title=title, description=content)}
+    ]
+
+
+def parse_sensationalism_result(data: Any) -> Optional[Tuple[float, str, Dict]]:
+    """Validates one analysis result object; returns None if it is unusable."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        score = float(data["indice_sensacionalismo"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not 0.0 <= score <= 1.0:
+        return None
+    explanation = data.get("explicacion_breve")
+    if not isinstance(explanation, str):
+        return None
+    metadata = {
+        "hechos_count": data.get("hechos_count"),
+        "adjetivos_subjetivos": data.get("adjetivos_subjetivos")
+    }
+    return score, explanation, metadata
+
+
 class OpenAINewsAnalyzer(NewsAnalyzer):
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        self.client = AsyncOpenAI(api_key=api_key)
+    # Rough completion size used to reserve tokens-per-minute budget
+    EXPECTED_COMPLETION_TOKENS = 200
+    # Returned once rate-limit retries are exhausted: the score stays unset (and
+    # uncached), so a later run or the batch backfill scores the article
+    RATE_LIMITED_RESULT: Tuple[Optional[float], str, Dict] = (None, "Error: rate limited", {})
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        max_concurrency: int = 8,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        batch_size: int = 10,
+    ):
+        # Retries are handled here (with jitter and rate limiting), not by the SDK
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0)
         self.model = model
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._batch_size = batch_size
 
     async def analyze_sensationalism(self, title: str, content: str) -> Tuple[float, str, Dict]:
         try:
-            prompt = SENSATIONALISM_PROMPT.format(title=title, description=content)
+            messages = build_sensationalism_messages(title, content)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that outputs JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0
+            response = await self._create_with_retries(
+                messages=messages,
+                estimated_tokens=self._estimate_tokens(messages[-1]["content"]),
             )
 
             content_str = response.choices[0].message.content
@@ -67,6 +153,102 @@ class OpenAINewsAnalyzer(NewsAnalyzer):
 
             return score, explanation, metadata
 
+        except RateLimitError as e:
+            logger.error(f"Rate limited analyzing sensationalism: {e}")
+            return self.RATE_LIMITED_RESULT
         except Exception as e:
             logger.error(f"Error analyzing sensationalism: {e}")
             return 0.0, f"Error: {str(e)}", {}
+
+    async def analyze_sensationalism_batch(self, items: List[Tuple[str, str]]) -> List[Tuple[float, str, Dict]]:
+        """Scores up to ``batch_size`` articles per request, sharing one instruction preamble.
+
+        Items missing from the response or failing validation are re-scored with
+        single-article requests. A batch that is still rate limited after its
+        retries is not: its items are left unscored instead of multiplying the
+        load while the API throttles.
+        """
+        chunks = [items[i:i + self._batch_size] for i in range(0, len(items), self._batch_size)]
+        results = await asyncio.gather(*(self._analyze_chunk(chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def _analyze_chunk(self, items: List[Tuple[str, str]]) -> List[Tuple[float, str, Dict]]:
+        if len(items) == 1:
+            return [await self.analyze_sensationalism(*items[0])]
+
+        parsed: Dict[str, Tuple[float, str, Dict]] = {}
+        rate_limited = False
+        try:
+            articles = [
+                {"id": str(i), "titulo": title, "descripcion": content}
+                for i, (title, content) in enumerate(items)
+            ]
+            prompt = BATCH_SENSATIONALISM_PROMPT.format(
+                articles=json.dumps(articles, ensure_ascii=False, indent=2)
+            )
+            response = await self._create_with_retries(
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant that outputs JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                estimated_tokens=self._estimate_tokens(prompt, completions=len(items)),
+            )
+            content_str = response.choices[0].message.content or "{}"
+            for item in json.loads(content_str).get("resultados", []):
+                result = parse_sensationalism_result(item) if isinstance(item, dict) and "id" in item else None
+                if result is not None:
+                    parsed[str(item.get("id"))] = result
+        except RateLimitError as e:
+            logger.error(f"Rate limited analyzing sensationalism batch: {e}")
+            rate_limited = True
+        except Exception as e:
+            logger.error(f"Error analyzing sensationalism batch: {e}")
+
+        missing = [i for i in range(len(items)) if str(i) not in parsed]
+        if missing and rate_limited:
+            logger.warning(f"Leaving {len(missing)} of {len(items)} items unscored after rate limiting")
+            parsed.update({str(i): self.RATE_LIMITED_RESULT for i in missing})
+        elif missing:
+            logger.warning(f"Falling back to single-article analysis for {len(missing)} of {len(items)} items")
+            fallbacks = await asyncio.gather(*(self.analyze_sensationalism(*items[i]) for i in missing))
+            parsed.update({str(i): result for i, result in zip(missing, fallbacks)})
+
+        return [parsed[str(i)] for i in range(len(items))]
+
+    async def _create_with_retries(self, messages: list[dict], estimated_tokens: int) -> Any:
+        """Sends a chat completion under the concurrency and rate limits, retrying
+        rate-limit, server and connection errors with jittered exponential backoff."""
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire(estimated_tokens)
+                try:
+                    return await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        response_format={"type": "json_object"},
+                        temperature=0.0
+                    )
+                except (RateLimitError, APIConnectionError, APITimeoutError, APIStatusError) as e:
+                    retryable = not isinstance(e, APIStatusError) or e.status_code == 429 or e.status_code >= 500
+                    if not retryable or attempt >= self._max_retries:
+                        raise
+                    delay = self._backoff_delay(attempt, e)
+                    logger.warning(f"LLM request failed ({e}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        # Honour Retry-After when the API sends it, otherwise use full jitter
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self._backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** attempt))
+
+    def _estimate_tokens(self, prompt: str, completions: int = 1) -> int:
+        return len(prompt) // 3 + self.EXPECTED_COMPLETION_TOKENS * completions
@@ -0,0 +1,183 @@
+"""CPU-only embedding service backed by a locally stored model."""
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+
+from libs.domain.services.embedding_service import EmbeddingService
+
+Encoder = Callable[[list[str]], np.ndarray]
+
+
+class LocalEmbeddingService(EmbeddingService):
+    """Embeds texts with a sentence-embedding model stored on disk, without network access.
+
+    Two backends are supported:
+
+    - ``onnx``: an exported ``model.onnx`` plus ``tokenizer.json`` run with
+      onnxruntime and mean pooling. Needs ``onnxruntime`` and ``tokenizers``.
+    - ``sentence-transformers``: a sentence-transformers model directory run on CPU.
+
+    ``auto`` picks ``onnx`` when the directory contains an ONNX export. The model
+    is loaded on first use, and batches are encoded in a thread pool (both
+    runtimes release the GIL during inference).
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        backend: str = "auto",
+        batch_size: int = 32,
+        max_workers: Optional[int] = None,
+        max_length: int = 128,
+    ):
+        """
+        Initialize the local embedding service.
+
+        Args:
+            model_path: Directory containing the model files.
+            backend: ``onnx``, ``sentence-transformers`` or ``auto``.
+            batch_size: Number of texts encoded per inference call.
+            max_workers: Threads encoding batches in parallel. Defaults to half the CPUs.
+            max_length: Maximum number of tokens per text (ONNX backend).
+        """
+        if backend not in ("auto", "onnx", "sentence-transformers"):
+            raise ValueError(f"Unknown local embedding backend: {backend}")
+        self._model_path = model_path
+        self._backend = backend
+        self._batch_size = batch_size
+        self._max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self._max_length = max_length
+        self._encoder: Optional[Encoder] = None
+        self._load_lock = threading.Lock()
+        self._model_id: Optional[str] = None
+
+    @property
+    def model(self) -> str:
+        """Identifier of the local model, used as the embedding cache key.
+
+        Besides the directory name it carries a digest of the model's full path
+        and its weights file's size and modification time, so two different
+        models that happen to live in directories with the same name, or weights
+        replaced in place, never share cached vectors. The weights are not read.
+        """
+        if self._model_id is None:
+            name = os.path.basename(os.path.normpath(self._model_path))
+            self._model_id = f"local:{name}:{self._fingerprint()[:16]}"
+        return self._model_id
+
+    def generate_embedding(self, text: str) -> list[float]:
+        return self.generate_embeddings([text])[0]
+
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        cleaned = []
+        for text in texts:
+            if not text or not text.strip():
+                raise ValueError("Text cannot be empty")
+            cleaned.append(text.strip())
+        if not cleaned:
+            return []
+
+        encoder = self._get_encoder()
+        batches = [cleaned[i:i + self._batch_size] for i in range(0, len(cleaned), self._batch_size)]
+        if len(batches) == 1 or self._max_workers == 1:
+            vectors = [encoder(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(batches))) as pool:
+                vectors = list(pool.map(encoder, batches))
+        return self._normalize(np.vstack(vectors)).tolist()
+
+    def calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
+        if len(embedding1) != len(embedding2):
+            raise ValueError("Embeddings must have the same dimension")
+        a = np.asarray(embedding1, dtype=np.float64)
+        b = np.asarray(embedding2, dtype=np.float64)
+        norms = np.linalg.norm(a) * np.linalg.norm(b)
+        return float(a @ b / norms) if norms else 0.0
+
+    def _get_encoder(self) -> Encoder:
+        if self._encoder is None:
+            with self._load_lock:
+                if self._encoder is None:
+                    self._encoder = self._load_encoder()
+        return self._encoder
+
+    def _load_encoder(self) -> Encoder:
+        if not os.path.isdir(self._model_path):
+            raise FileNotFoundError(f"Local embedding model not found: {self._model_path}")
+        onnx_path = self._find_onnx_model()
+        if self._backend == "onnx" or (self._backend == "auto" and onnx_path):
+            if not onnx_path:
+                raise FileNotFoundError(f"No model.onnx found in {self._model_path}")
+            return self._load_onnx(onnx_path)
+        return self._load_sentence_transformers()
+
+    def _fingerprint(self) -> str:
+        key = os.path.abspath(self._model_path)
+        for candidate in ("model.onnx", os.path.join("onnx", "model.onnx"), "model.safetensors", "pytorch_model.bin"):
+            path = os.path.join(self._model_path, candidate)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                key += f"\n{candidate}\n{stat.st_size}\n{stat.st_mtime_ns}"
+                break
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _find_onnx_model(self) -> Optional[str]:
+        for candidate in ("model.onnx", os.path.join("onnx", "model.onnx")):
+            path = os.path.join(self._model_path, candidate)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _load_onnx(self, onnx_path: str) -> Encoder:
+        try:
+            import onnxruntime
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError("The onnx backend needs the onnxruntime and tokenizers packages") from e
+
+        tokenizer = Tokenizer.from_file(os.path.join(self._model_path, "tokenizer.json"))
+        tokenizer.enable_truncation(max_length=self._max_length)
+        tokenizer.enable_padding()
+        options = onnxruntime.SessionOptions()
+        # Parallelism comes from the batch thread pool; keep each run single-threaded
+        options.intra_op_num_threads = 1
+        session = onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        input_names = {model_input.name for model_input in session.get_inputs()}
+
+        def encode(batch: list[str]) -> np.ndarray:
+            encodings = tokenizer.encode_batch(batch)
+            input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+            token_embeddings = session.run(None, feeds)[0]
+            # Mean pooling over real (non-padding) tokens
+            mask = attention_mask[:, :, None].astype(np.float32)
+            return (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        return encode
+
+    def _load_sentence_transformers(self) -> Encoder:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError("The sentence-transformers backend needs the sentence-transformers package") from e
+
+        model = SentenceTransformer(self._model_path, device="cpu")
+
+        def encode(batch: list[str]) -> np.ndarray:
+            return model.encode(batch, batch_size=len(batch), convert_to_numpy=True)
+
+        return encode
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        matrix = matrix.astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return matrix / norms
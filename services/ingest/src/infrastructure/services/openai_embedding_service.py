@@ -10,13 +10,27 @@ from libs.domain.services.embedding_service import EmbeddingService
 class OpenAIEmbeddingService(EmbeddingService):
     """OpenAI implementation for generating and comparing text embeddings."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "text-embedding-3-small"):
+    # The API accepts up to 2048 inputs and ~300k tokens per request; stay well below both
+    MAX_BATCH_ITEMS = 512
+    MAX_BATCH_TOKENS = 100_000
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "text-embedding-3-small",
+        max_batch_items: int = MAX_BATCH_ITEMS,
+        max_batch_tokens: int = MAX_BATCH_TOKENS,
+        dimensions: Optional[int] = None,
+    ):
         """
         Initialize the OpenAI embedding service.
         
         Args:
             api_key: OpenAI API key. If not provided, will try to get from OPENAI_API_KEY env var.
             model: Name of the OpenAI embedding model to use. Default is text-embedding-3-small.
+            max_batch_items: Maximum number of texts sent in a single embeddings request.
+            max_batch_tokens: Approximate maximum number of tokens sent in a single request.
+            dimensions: Ask text-embedding-3 models for shortened vectors of this size.
         """
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -24,6 +38,14 @@ class OpenAIEmbeddingService(EmbeddingService):
         
         self._client = OpenAI(api_key=api_key)
         self._model = model
+        self._max_batch_items = max_batch_items
+        self._max_batch_tokens = max_batch_tokens
+        self._dimensions = dimensions
+
+    @property
+    def model(self) -> str:
+        """Name of the OpenAI embedding model in use, including the size if shortened."""
+        return f"{self._model}@{self._dimensions}" if self._dimensions else self._model
 
     def generate_embedding(self, text: str) -> list[float]:
         """
@@ -39,12 +61,70 @@ class OpenAIEmbeddingService(EmbeddingService):
             raise ValueError("Text cannot be empty")
         
         response = self._client.embeddings.create(
-            model=self._model,
             input=text.strip(),
+            **self._request_options(),
         )
         
         return response.data[0].embedding
 
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for many texts, chunking requests by item and token limits.
+        
+        Args:
+            texts: Texts to generate embeddings for.
+            
+        Returns:
+            One embedding per input text, in input order.
+        """
+        cleaned = []
+        for text in texts:
+            if not text or not text.strip():
+                raise ValueError("Text cannot be empty")
+            cleaned.append(text.strip())
+
+        embeddings: list[list[float]] = []
+        for batch in self._batches(cleaned):
+            response = self._client.embeddings.create(
+                input=batch,
+                **self._request_options(),
+            )
+            # The API reports each vector's input index; don't rely on response order
+            ordered = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in ordered)
+
+        return embeddings
+
+    def _request_options(self) -> dict:
+        options = {"model": self._model}
+        if self._dimensions:
+            options["dimensions"] = self._dimensions
+        return options
+
+    def _batches(self, texts: list[str]) -> list[list[str]]:
+        """Splits texts into consecutive batches that respect the request limits."""
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = self._estimate_tokens(text)
+            if current and (
+                len(current) >= self._max_batch_items
+                or current_tokens + tokens > self._max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # Conservative estimate (~3 chars per token for Spanish text) to avoid a tokenizer dependency
+        return len(text) // 3 + 1
+
     def calculate_similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
         """
         Calculate cosine similarity between two embeddings.
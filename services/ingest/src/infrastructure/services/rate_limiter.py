@@ -0,0 +1,62 @@
+"""Token-bucket rate limiting for requests-per-minute and tokens-per-minute quotas."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class TokenBucketRateLimiter:
+    """Async limiter enforcing both a request and a token budget per minute.
+
+    Each bucket refills continuously at its per-minute rate and holds at most one
+    minute of budget, so short bursts are allowed but the sustained rate is capped.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if requests_per_minute <= 0 or (tokens_per_minute is not None and tokens_per_minute <= 0):
+            raise ValueError("Rate limits must be positive")
+        self._request_capacity = float(requests_per_minute)
+        self._token_capacity = float(tokens_per_minute) if tokens_per_minute else None
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity or 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Waits until one request and ``tokens`` tokens fit in the budget, then spends them."""
+        if self._token_capacity is not None:
+            # A single oversized request could otherwise never be admitted
+            tokens = min(tokens, int(self._token_capacity))
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._seconds_until_available(tokens)
+                if wait <= 0:
+                    self._requests -= 1
+                    if self._token_capacity is not None:
+                        self._tokens -= tokens
+                    return
+                await self._sleep(wait)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._requests = min(self._request_capacity, self._requests + elapsed * self._request_capacity / 60.0)
+        if self._token_capacity is not None:
+            self._tokens = min(self._token_capacity, self._tokens + elapsed * self._token_capacity / 60.0)
+
+    def _seconds_until_available(self, tokens: int) -> float:
+        wait = 0.0
+        if self._requests < 1:
+            wait = (1 - self._requests) * 60.0 / self._request_capacity
+        if self._token_capacity is not None and self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60.0 / self._token_capacity)
+        return wait
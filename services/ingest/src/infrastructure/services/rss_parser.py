@@ -1,6 +1,9 @@
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 import feedparser
+import httpx
 
 from libs.domain.entities.article import Article
 from libs.domain.entities.source import Source
@@ -8,14 +11,67 @@ from libs.domain.value_objects.topic_hash import TopicHash
 from uuid import UUID
 
 
+@dataclass(frozen=True)
+class FeedFetchResult:
+    """Result of a (possibly conditional) feed fetch."""
+
+    not_modified: bool
+    entries: list = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 class RSSParser:
-    """Service for parsing RSS feeds."""
+    """Service for fetching and parsing RSS feeds."""
 
-    @staticmethod
-    def parse_feed(url: str) -> list[dict]:
-        """Parses an RSS feed and returns a list of entries."""
-        parsed = feedparser.parse(url)
-        return parsed.entries
+    USER_AGENT = "Pluralia/0.1 (+https://pluralia.info)"
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, timeout: float = 30.0):
+        # A single pooled client is shared by every feed in the run
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.USER_AGENT},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def fetch_feed(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> FeedFetchResult:
+        """Fetches a feed, sending conditional headers when validators are known.
+
+        Returns a result with ``not_modified=True`` and no entries when the server
+        answers 304, so callers can skip the feed entirely.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self._client.get(url, headers=headers)
+        if response.status_code == 304:
+            return FeedFetchResult(not_modified=True, etag=etag, last_modified=last_modified)
+        response.raise_for_status()
+
+        # feedparser is CPU-bound; keep it off the event loop. The headers carry the
+        # Content-Type charset, which non-UTF-8 feeds need to decode correctly
+        parsed = await asyncio.to_thread(
+            feedparser.parse, response.content, response_headers=dict(response.headers)
+        )
+        return FeedFetchResult(
+            not_modified=False,
+            entries=parsed.entries,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP connection pool."""
+        await self._client.aclose()
 
     @staticmethod
     def entry_to_article(entry: dict, source_id: UUID) -> Article:
@@ -39,4 +95,3 @@ class RSSParser:
             description=description,
             published_at=published_at,
         )
-
@@ -0,0 +1,51 @@
+"""SQLite-backed persistent store for LLM analysis results."""
+import json
+from typing import Dict, Optional, Tuple
+
+from services.ingest.src.infrastructure.services.sqlite_lru_store import CacheStats, SqliteLruStore
+
+AnalysisResult = Tuple[float, str, Dict]
+AnalysisCacheStats = CacheStats
+
+
+class SqliteAnalysisCache:
+    """Stores (score, explanation, metadata) results keyed by (model, prompt version, content hash).
+
+    Entries older than ``ttl_seconds`` are treated as misses and purged on write.
+    When the stored results exceed ``max_bytes`` the least recently used entries
+    are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: Optional[float] = None):
+        self._store = SqliteLruStore(
+            path, "analysis_entry", max_bytes, ttl_seconds=ttl_seconds, legacy_table="analysis"
+        )
+
+    def get_many(self, model: str, prompt_version: str, content_hashes: list[str]) -> dict[str, AnalysisResult]:
+        """Returns the fresh cached results for the given hashes; missing or expired hashes are omitted."""
+        found: dict[str, AnalysisResult] = {}
+        for content_hash, payload in self._store.get_many(_namespace(model, prompt_version), content_hashes).items():
+            score, explanation, metadata = json.loads(payload)
+            found[content_hash] = (score, explanation, metadata)
+        return found
+
+    def put_many(self, model: str, prompt_version: str, results: dict[str, AnalysisResult]) -> None:
+        """Stores results by content hash, then drops expired entries and evicts if over budget."""
+        self._store.put_many(
+            _namespace(model, prompt_version),
+            {
+                content_hash: json.dumps(list(result), ensure_ascii=False).encode("utf-8")
+                for content_hash, result in results.items()
+            },
+        )
+
+    def stats(self) -> AnalysisCacheStats:
+        return self._store.stats()
+
+    def close(self) -> None:
+        self._store.close()
+
+
+def _namespace(model: str, prompt_version: str) -> str:
+    # A control character cannot appear in either part, so the pair stays unambiguous
+    return f"{model}\x1f{prompt_version}"
@@ -0,0 +1,36 @@
+"""SQLite-backed persistent store for text embeddings."""
+from array import array
+
+from services.ingest.src.infrastructure.services.sqlite_lru_store import CacheStats, SqliteLruStore
+
+EmbeddingCacheStats = CacheStats
+
+
+class SqliteEmbeddingCache:
+    """Content-addressed embedding store keyed by (model, text hash).
+
+    Vectors are stored as packed float32 blobs. When the stored vectors exceed
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self._store = SqliteLruStore(path, "embedding_entry", max_bytes, legacy_table="embedding")
+
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        """Returns the cached vectors for the given hashes; missing hashes are omitted."""
+        return {
+            text_hash: array("f", blob).tolist()
+            for text_hash, blob in self._store.get_many(model, text_hashes).items()
+        }
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Stores vectors by text hash and evicts old entries if over the size budget."""
+        self._store.put_many(
+            model, {text_hash: array("f", vector).tobytes() for text_hash, vector in vectors.items()}
+        )
+
+    def stats(self) -> EmbeddingCacheStats:
+        return self._store.stats()
+
+    def close(self) -> None:
+        self._store.close()
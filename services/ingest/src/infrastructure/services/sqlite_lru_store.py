@@ -0,0 +1,148 @@
+"""SQLite-backed key/value store with a size budget and optional expiry."""
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counters for the current process plus the on-disk footprint."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SqliteLruStore:
+    """Stores opaque blobs keyed by (namespace, key) in one SQLite table.
+
+    Entries older than ``ttl_seconds`` are treated as misses and purged on write.
+    When the stored values exceed ``max_bytes`` the least recently used entries
+    are evicted. Callers own the encoding of values.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+        legacy_table: Optional[str] = None,
+    ):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Values are read and written from the event loop and worker threads alike
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._table = table
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            if legacy_table is not None:
+                # Files written before the shared layout are unreadable here; start them over
+                self._connection.execute(f"DROP TABLE IF EXISTS {legacy_table}")
+            self._connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_last_access ON {table} (last_access)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_created_at ON {table} (created_at)"
+            )
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, bytes]:
+        """Returns the fresh stored values for the given keys; missing or expired keys are omitted."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        now = time.time()
+        oldest = now - self._ttl_seconds if self._ttl_seconds is not None else float("-inf")
+        with self._lock, self._connection:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM {self._table} "
+                    f"WHERE namespace = ? AND created_at >= ? AND key IN ({placeholders})",
+                    [namespace, oldest, *chunk],
+                ).fetchall()
+                found.update(rows)
+            if found:
+                self._connection.executemany(
+                    f"UPDATE {self._table} SET last_access = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, key) for key in found],
+                )
+            self._hits += len(found)
+            self._misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, namespace: str, values: dict[str, bytes]) -> None:
+        """Stores values by key, then drops expired entries and evicts if over budget."""
+        now = time.time()
+        rows = [(namespace, key, value, len(value), now, now) for key, value in values.items()]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self._table} "
+                "(namespace, key, value, size_bytes, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if self._ttl_seconds is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self._table} WHERE created_at < ?", (now - self._ttl_seconds,)
+                )
+            self._evict()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            entries, size_bytes = self._connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM {self._table}"
+            ).fetchone()
+            return CacheStats(hits=self._hits, misses=self._misses, entries=entries, size_bytes=size_bytes)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """Drops least recently used entries until the store fits in max_bytes."""
+        total = self._connection.execute(
+            f"SELECT COALESCE(SUM(size_bytes), 0) FROM {self._table}"
+        ).fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        freed = 0
+        victims: list[tuple[str, str]] = []
+        for namespace, key, size_bytes in self._connection.execute(
+            f"SELECT namespace, key, size_bytes FROM {self._table} ORDER BY last_access ASC"
+        ):
+            victims.append((namespace, key))
+            freed += size_bytes
+            if freed >= excess:
+                break
+        self._connection.executemany(
+            f"DELETE FROM {self._table} WHERE namespace = ? AND key = ?", victims
+        )
@@ -1,14 +1,25 @@
 import asyncio
+from libs.domain.services.embedding_codec import EmbeddingCodec
 from libs.domain.value_objects.bias import Bias
 from services.ingest.src.application.ingest_news import IngestNews
+from services.ingest.src.application.ingest_scheduler import FeedJob, IngestScheduler
 from services.ingest.src.infrastructure.database.db import init_db, get_session
+from services.ingest.src.infrastructure.database.data_version import bump_data_version
 from services.ingest.src.infrastructure.repositories.sqlmodel_article_repository import SqlModelArticleRepository
 from services.ingest.src.infrastructure.repositories.sqlmodel_news_group_repository import SqlModelNewsGroupRepository
 from services.ingest.src.infrastructure.repositories.sqlmodel_source_repository import SqlModelSourceRepository
+from services.ingest.src.infrastructure.repositories.sqlmodel_unit_of_work import SqlModelUnitOfWork
 import os
 from services.ingest.src.infrastructure.services.rss_parser import RSSParser
 from services.ingest.src.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
-from services.ingest.src.infrastructure.services.llm_client import OpenAINewsAnalyzer
+from services.ingest.src.infrastructure.services.local_embedding_service import LocalEmbeddingService
+from services.ingest.src.infrastructure.services.cached_embedding_service import CachedEmbeddingService
+from services.ingest.src.infrastructure.services.sqlite_embedding_cache import SqliteEmbeddingCache
+from services.ingest.src.infrastructure.services.cached_news_analyzer import CachedNewsAnalyzer
+from services.ingest.src.infrastructure.services.sqlite_analysis_cache import SqliteAnalysisCache
+from services.ingest.src.infrastructure.services.lexicon_news_analyzer import LexiconNewsAnalyzer
+from services.ingest.src.infrastructure.services.llm_client import PROMPT_VERSION, OpenAINewsAnalyzer
+from services.ingest.src.infrastructure.services.rate_limiter import TokenBucketRateLimiter
 
 FEEDS = {
     "El País": {
@@ -54,6 +65,35 @@ FEEDS = {
 }
 
 
+def build_embedding_service() -> tuple[CachedEmbeddingService, SqliteEmbeddingCache]:
+    """Builds the configured embedding backend behind the on-disk cache.
+
+    Returns the service and its cache, which the caller must close.
+    """
+    if os.getenv("EMBEDDING_BACKEND", "openai") == "local":
+        # Offline, CPU-only embeddings; no API key or network needed for grouping
+        base_embedding_service = LocalEmbeddingService(
+            model_path=os.environ["LOCAL_EMBEDDING_MODEL_PATH"],
+            backend=os.getenv("LOCAL_EMBEDDING_RUNTIME", "auto"),
+            batch_size=int(os.getenv("LOCAL_EMBEDDING_BATCH_SIZE", "32")),
+        )
+    else:
+        embedding_dimensions = os.getenv("EMBEDDING_DIMENSIONS")
+        base_embedding_service = OpenAIEmbeddingService(
+            dimensions=int(embedding_dimensions) if embedding_dimensions else None,
+        )
+    embedding_cache = SqliteEmbeddingCache(
+        path=os.getenv("EMBEDDING_CACHE_PATH", ".cache/embeddings.sqlite"),
+        max_bytes=int(os.getenv("EMBEDDING_CACHE_MAX_MB", "256")) * 1024 * 1024,
+    )
+    embedding_service = CachedEmbeddingService(
+        inner=base_embedding_service,
+        cache=embedding_cache,
+        model=base_embedding_service.model,
+    )
+    return embedding_service, embedding_cache
+
+
 async def main():
     """Main entry point for the ingest service."""
     init_db()
@@ -61,15 +101,50 @@ async def main():
     with get_session() as session:
         source_repository = SqlModelSourceRepository(session)
         article_repository = SqlModelArticleRepository(session)
-        news_group_repository = SqlModelNewsGroupRepository(session)
+        use_pgvector = os.getenv("USE_PGVECTOR", "false").lower() == "true"
+        # float32 is the native `embedding` column; lower precisions go to the quantized blob
+        embedding_precision = os.getenv("EMBEDDING_PRECISION", "float32")
+        news_group_repository = SqlModelNewsGroupRepository(
+            session,
+            use_pgvector=use_pgvector,
+            embedding_codec=EmbeddingCodec(embedding_precision) if embedding_precision != "float32" else None,
+        )
         rss_parser = RSSParser()
-        embedding_service = OpenAIEmbeddingService()
+        embedding_service, embedding_cache = build_embedding_service()
 
         # Initialize LLM client for sensationalism analysis
         news_analyzer = None
+        analysis_cache = None
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if openai_api_key:
-            news_analyzer = OpenAINewsAnalyzer(api_key=openai_api_key)
+            openai_news_analyzer = OpenAINewsAnalyzer(
+                api_key=openai_api_key,
+                max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+                batch_size=int(os.getenv("LLM_BATCH_SIZE", "10")),
+                rate_limiter=TokenBucketRateLimiter(
+                    requests_per_minute=float(os.getenv("LLM_REQUESTS_PER_MINUTE", "450")),
+                    tokens_per_minute=float(os.getenv("LLM_TOKENS_PER_MINUTE", "180000")),
+                ),
+            )
+            ttl_days = float(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "30"))
+            analysis_cache = SqliteAnalysisCache(
+                path=os.getenv("ANALYSIS_CACHE_PATH", ".cache/analysis.sqlite"),
+                max_bytes=int(os.getenv("ANALYSIS_CACHE_MAX_MB", "64")) * 1024 * 1024,
+                ttl_seconds=ttl_days * 24 * 3600 if ttl_days > 0 else None,
+            )
+            news_analyzer = CachedNewsAnalyzer(
+                inner=openai_news_analyzer,
+                cache=analysis_cache,
+                model=openai_news_analyzer.model,
+                prompt_version=PROMPT_VERSION,
+            )
+            if os.getenv("SENSATIONALISM_PREFILTER", "false").lower() == "true":
+                # Obvious cases are scored locally; only uncertain ones reach the cache and LLM
+                news_analyzer = LexiconNewsAnalyzer(
+                    fallback=news_analyzer,
+                    neutral_below=float(os.getenv("PREFILTER_NEUTRAL_BELOW", "0.0")),
+                    sensational_above=float(os.getenv("PREFILTER_SENSATIONAL_ABOVE", "0.6")),
+                )
         else:
             print("⚠️ MK: OPENAI_API_KEY not found. Sensationalism analysis will be skipped.")
 
@@ -77,21 +152,78 @@ async def main():
             source_repository=source_repository,
             article_repository=article_repository,
             news_group_repository=news_group_repository,
+            # Feeds share the session; IngestNews commits or rolls back each feed's writes as one
+            unit_of_work=SqlModelUnitOfWork(session),
             rss_parser=rss_parser,
             embedding_service=embedding_service,
             news_analyzer=news_analyzer,
             similarity_threshold=0.7,
+            search_groups_in_repository=use_pgvector,
+            embedding_model=embedding_service.model,
+        )
+
+        scheduler = IngestScheduler(
+            max_concurrency=int(os.getenv("INGEST_MAX_CONCURRENCY", "5")),
+            per_host_concurrency=int(os.getenv("INGEST_PER_HOST_CONCURRENCY", "1")),
+            feed_timeout=float(os.getenv("INGEST_FEED_TIMEOUT", "120")),
         )
+        jobs = [
+            FeedJob(name=name, url=config["url"], bias=config["bias"], limit=10)
+            for name, config in FEEDS.items()
+        ]
 
-        for name, config in FEEDS.items():
-            print(f"Ingesting news from {name}...")
+        async def ingest_feed(job: FeedJob) -> None:
+            print(f"Ingesting news from {job.name}...")
             await ingest_news.execute(
-                source_name=name,
-                source_url=config["url"],
-                bias=config["bias"],
-                limit=10,
+                source_name=job.name,
+                source_url=job.url,
+                bias=job.bias,
+                limit=job.limit,
+            )
+
+        try:
+            results = await scheduler.run(jobs, ingest_feed)
+        finally:
+            await rss_parser.aclose()
+
+        for result in results:
+            if result.ok:
+                print(f"✅ Completed {result.name} in {result.duration:.2f}s")
+            else:
+                print(f"❌ {result.name} {result.status} after {result.duration:.2f}s: {result.error}")
+
+        if any(result.ok for result in results):
+            # Tells the API its cached /news and /groups responses are stale
+            data_version = bump_data_version(session)
+            print(f"🔄 Data version bumped to {data_version}")
+
+        if use_pgvector:
+            # Outside any feed's transaction, so the index survives a failed feed
+            for dimension in news_group_repository.create_missing_vector_indexes():
+                print(f"🧭 Created the pgvector index for {dimension}-dimensional embeddings")
+
+        cache_stats = embedding_service.stats()
+        print(
+            f"📦 Embedding cache: {cache_stats.hits} hits, {cache_stats.misses} misses "
+            f"({cache_stats.hit_rate:.0%}), {cache_stats.entries} entries, "
+            f"{cache_stats.size_bytes / (1024 * 1024):.1f} MB"
+        )
+        embedding_cache.close()
+
+        if analysis_cache is not None:
+            analysis_stats = analysis_cache.stats()
+            print(
+                f"📦 Analysis cache: {analysis_stats.hits} hits, {analysis_stats.misses} misses "
+                f"({analysis_stats.hit_rate:.0%}), {analysis_stats.entries} entries, "
+                f"{analysis_stats.size_bytes / (1024 * 1024):.1f} MB"
+            )
+            analysis_cache.close()
+
+        if isinstance(news_analyzer, LexiconNewsAnalyzer):
+            print(
+                f"🔎 Pre-filter: {news_analyzer.local_count} scored locally, "
+                f"{news_analyzer.escalated_count} escalated ({news_analyzer.escalation_rate:.0%})"
             )
-            print(f"✅ Completed {name}")
 
     print("✅ Ingest completed")
 
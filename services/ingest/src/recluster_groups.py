@@ -0,0 +1,309 @@
+"""Re-cluster the articles of a time range offline and rewrite their groups in bulk.
+
+Ingest groups articles greedily, one at a time, so the result depends on arrival
+order and a story can end up split across several groups. This command loads the
+title embeddings of every article in a range into one matrix, links every pair
+whose cosine similarity reaches the threshold (optionally only pairs published
+close together) and takes the connected components as the new groups:
+
+    python -m services.ingest.src.recluster_groups --days 7 --dry-run
+    python -m services.ingest.src.recluster_groups --since 2025-01-01 --until 2025-02-01
+
+Each cluster keeps the existing group most of its members already belong to;
+clusters without one get a new group, and groups left without articles are
+deleted. Article reassignment, new groups, centroids and deletions are written
+with a handful of bulk statements in one transaction, together with the
+``group_stats`` rows of every touched group. Before/after quality is
+printed either way.
+
+Titles are embedded through the same cached embedding service ingest uses, so
+articles that were already grouped are served from the embedding cache.
+"""
+import argparse
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import bindparam, delete, exists, func, insert, select, text, update
+from sqlmodel import Session
+
+from libs.domain.services.embedding_codec import EmbeddingCodec
+from libs.domain.services.embedding_service import EmbeddingService
+from libs.domain.services.threshold_clustering import (
+    ClusteringQuality,
+    cluster_by_threshold,
+    clustering_quality,
+    plan_group_ids,
+)
+from libs.domain.value_objects.topic_hash import TopicHash
+from services.ingest.src.infrastructure.database.data_version import bump_data_version
+from services.ingest.src.infrastructure.database.group_stats import refresh_group_stats
+from services.ingest.src.infrastructure.database.models import ArticleModel, NewsGroupModel
+
+DEFAULT_THRESHOLD = 0.7
+EMBEDDING_CHUNK_SIZE = 1000
+WRITE_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ReclusterReport:
+    """Outcome of a re-clustering run."""
+
+    before: ClusteringQuality
+    after: ClusteringQuality
+    moved: int
+    created: int
+    deleted: int
+    applied: bool
+
+
+def load_articles(session: Session, since: datetime, until: datetime) -> list[tuple[str, Optional[str], str, datetime]]:
+    """Returns (id, group_id, title, published_at) for articles published in [since, until)."""
+    table = ArticleModel.__table__
+    statement = (
+        select(table.c.id, table.c.group_id, table.c.title, table.c.published_at)
+        .where(table.c.published_at >= since, table.c.published_at < until)
+        .order_by(table.c.published_at, table.c.id)
+    )
+    return [tuple(row) for row in session.execute(statement).all()]
+
+
+def load_outside_members(
+    session: Session,
+    group_ids: list[str],
+    since: datetime,
+    until: datetime,
+    embedding_model: Optional[str] = None,
+) -> dict[str, tuple[int, Optional[np.ndarray]]]:
+    """Returns, per group, how many of its articles lie outside [since, until) and its stored centroid.
+
+    Groups without articles outside the range are omitted. The centroid is None
+    when the group has none, or when it was computed with another embedding model.
+    """
+    article_table = ArticleModel.__table__
+    group_table = NewsGroupModel.__table__
+    outside_range = (
+        article_table.c.published_at.is_(None)
+        | (article_table.c.published_at < since)
+        | (article_table.c.published_at >= until)
+    )
+    members: dict[str, tuple[int, Optional[np.ndarray]]] = {}
+    for start in range(0, len(group_ids), WRITE_CHUNK_SIZE):
+        chunk = group_ids[start:start + WRITE_CHUNK_SIZE]
+        counts = dict(session.execute(
+            select(article_table.c.group_id, func.count())
+            .where(article_table.c.group_id.in_(chunk), outside_range)
+            .group_by(article_table.c.group_id)
+        ).all())
+        if not counts:
+            continue
+        rows = session.execute(
+            select(group_table.c.id, group_table.c.embedding, group_table.c.embedding_blob, group_table.c.embedding_model)
+            .where(group_table.c.id.in_(list(counts)))
+        ).all()
+        for group_id, embedding, blob, model in rows:
+            centroid = embedding if embedding is not None or not blob else EmbeddingCodec.decode(blob)
+            if embedding_model is not None and model not in (None, embedding_model):
+                centroid = None
+            members[group_id] = (counts[group_id], None if centroid is None else np.asarray(centroid, dtype=np.float32))
+    return members
+
+
+def embed_titles(embedding_service: EmbeddingService, titles: list[str], chunk_size: int = EMBEDDING_CHUNK_SIZE) -> np.ndarray:
+    """Embeds titles in chunks into one float32 matrix."""
+    chunks = [
+        np.asarray(embedding_service.generate_embeddings(titles[start:start + chunk_size]), dtype=np.float32)
+        for start in range(0, len(titles), chunk_size)
+    ]
+    return np.vstack(chunks)
+
+
+def recluster(
+    session: Session,
+    embedding_service: EmbeddingService,
+    since: datetime,
+    until: datetime,
+    threshold: float = DEFAULT_THRESHOLD,
+    max_gap_hours: Optional[float] = None,
+    apply: bool = True,
+    embedding_codec: Optional[EmbeddingCodec] = None,
+    use_pgvector: bool = False,
+    embedding_model: Optional[str] = None,
+) -> ReclusterReport:
+    """Re-clusters the articles published in [since, until).
+
+    Args:
+        session: Database session; committed once when ``apply`` is set.
+        embedding_service: Embeds the article titles.
+        since: Start of the range (inclusive).
+        until: End of the range (exclusive).
+        threshold: Minimum cosine similarity that links two articles.
+        max_gap_hours: Only link articles published at most this far apart.
+        apply: Write the new grouping; otherwise only report it.
+        embedding_codec: Also store a quantized copy in ``embedding_blob``, as ingest does.
+        use_pgvector: Keep the pgvector ``embedding_vector`` column in sync.
+        embedding_model: Recorded on every re-clustered group, as ingest does.
+    """
+    articles = load_articles(session, since, until)
+    if not articles:
+        empty = clustering_quality(np.empty((0, 0)), [], threshold)
+        return ReclusterReport(empty, empty, moved=0, created=0, deleted=0, applied=False)
+
+    article_ids = [article[0] for article in articles]
+    current = [article[1] for article in articles]
+    published = np.array([article[3].timestamp() for article in articles])
+    vectors = embed_titles(embedding_service, [article[2] for article in articles])
+
+    labels = cluster_by_threshold(
+        vectors,
+        threshold,
+        timestamps=published,
+        max_gap=max_gap_hours * 3600 if max_gap_hours is not None else None,
+    )
+    plan = plan_group_ids(current, labels)
+
+    # Clusters without a surviving group get a new one, named after their first article
+    new_groups = []
+    for label, group_id in plan.items():
+        if group_id is None:
+            first = int(np.flatnonzero(labels == label)[0])
+            plan[label] = str(uuid.uuid4())
+            new_groups.append({
+                "id": plan[label],
+                "topic_hash": TopicHash.from_title(articles[first][2]).value,
+                "created_at": articles[first][3],
+                "member_count": 0,
+            })
+
+    targets = [plan[label] for label in labels.tolist()]
+    moves = [
+        {"article_id": article_id, "target": target}
+        for article_id, source, target in zip(article_ids, current, targets)
+        if source != target
+    ]
+    abandoned = sorted({group_id for group_id in current if group_id is not None} - set(plan.values()))
+
+    before = clustering_quality(vectors, current, threshold)
+    after = clustering_quality(vectors, targets, threshold)
+    if not apply:
+        return ReclusterReport(before, after, len(moves), len(new_groups), len(abandoned), applied=False)
+
+    group_table = NewsGroupModel.__table__
+    article_table = ArticleModel.__table__
+    if new_groups:
+        session.execute(insert(group_table), new_groups)
+
+    move_statement = (
+        update(article_table)
+        .where(article_table.c.id == bindparam("article_id"))
+        .values(group_id=bindparam("target"))
+    )
+    for start in range(0, len(moves), WRITE_CHUNK_SIZE):
+        session.execute(move_statement, moves[start:start + WRITE_CHUNK_SIZE])
+
+    # Centroids average every member, like member_count counts them. Members outside
+    # the range are not re-embedded, so the group's stored centroid stands in for them
+    outside = load_outside_members(session, list(plan.values()), since, until, embedding_model)
+    sums = np.zeros((len(plan), vectors.shape[1]), dtype=np.float64)
+    np.add.at(sums, labels, vectors)
+    sizes = np.bincount(labels, minlength=len(plan)).astype(np.float64)
+    centroids: dict[str, np.ndarray] = {}
+    centroid_rows = []
+    for label, group_id in plan.items():
+        outside_count, stored = outside.get(group_id, (0, None))
+        if stored is not None and stored.shape == (vectors.shape[1],):
+            sums[label] += outside_count * stored
+            sizes[label] += outside_count
+        centroid = centroids[group_id] = (sums[label] / sizes[label]).astype(np.float32)
+        blob = embedding_codec.encode(centroid) if embedding_codec is not None else None
+        centroid_rows.append({
+            "group_id": group_id,
+            "centroid": centroid.tolist(),
+            "centroid_blob": blob,
+        })
+    centroid_statement = (
+        update(group_table)
+        .where(group_table.c.id == bindparam("group_id"))
+        .values(
+            embedding=bindparam("centroid"),
+            embedding_blob=bindparam("centroid_blob"),
+            embedding_model=embedding_model,
+            embedding_dimension=vectors.shape[1],
+        )
+    )
+    for start in range(0, len(centroid_rows), WRITE_CHUNK_SIZE):
+        session.execute(centroid_statement, centroid_rows[start:start + WRITE_CHUNK_SIZE])
+    if use_pgvector:
+        session.execute(
+            text("UPDATE newsgroup SET embedding_vector = CAST(:embedding AS vector) WHERE id = :id"),
+            [
+                {"embedding": "[" + ",".join(repr(float(v)) for v in centroid) + "]", "id": group_id}
+                for group_id, centroid in centroids.items()
+            ],
+        )
+
+    touched = sorted(set(plan.values()) | set(abandoned))
+    # Emptied groups lose their summary row before the groups themselves go
+    refresh_group_stats(session, touched)
+    member_count = (
+        select(func.count())
+        .select_from(article_table)
+        .where(article_table.c.group_id == group_table.c.id)
+        .scalar_subquery()
+    )
+    orphaned = ~exists().where(article_table.c.group_id == group_table.c.id)
+    deleted = 0
+    for start in range(0, len(touched), WRITE_CHUNK_SIZE):
+        chunk = touched[start:start + WRITE_CHUNK_SIZE]
+        session.execute(update(group_table).where(group_table.c.id.in_(chunk)).values(member_count=member_count))
+        deleted += session.execute(delete(group_table).where(group_table.c.id.in_(chunk), orphaned)).rowcount
+    session.commit()
+    bump_data_version(session)
+    return ReclusterReport(before, after, len(moves), len(new_groups), deleted, applied=True)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=float, default=7, help="re-cluster the last N days (default 7)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="start of the range, overrides --days")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="end of the range (default now)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--max-gap-hours", type=float, help="only link articles published this close together")
+    parser.add_argument("--dry-run", action="store_true", help="report the new grouping without writing it")
+    args = parser.parse_args(argv)
+
+    from services.ingest.src.infrastructure.database.db import get_session
+    from services.ingest.src.main import build_embedding_service
+
+    until = args.until or datetime.utcnow()
+    since = args.since or until - timedelta(days=args.days)
+    embedding_precision = os.getenv("EMBEDDING_PRECISION", "float32")
+    embedding_service, embedding_cache = build_embedding_service()
+    try:
+        with get_session() as session:
+            report = recluster(
+                session,
+                embedding_service,
+                since,
+                until,
+                threshold=args.threshold,
+                max_gap_hours=args.max_gap_hours,
+                apply=not args.dry_run,
+                embedding_codec=EmbeddingCodec(embedding_precision) if embedding_precision != "float32" else None,
+                use_pgvector=os.getenv("USE_PGVECTOR", "false").lower() == "true",
+                embedding_model=embedding_service.model,
+            )
+    finally:
+        embedding_cache.close()
+
+    print(f"Before: {report.before.describe()}")
+    print(f"After:  {report.after.describe()}")
+    verb = "Moved" if report.applied else "Would move"
+    print(f"{verb} {report.moved} articles, {report.created} new groups, {report.deleted} groups removed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Tests for GetGroups use case against an in-memory SQLite database."""
+from datetime import datetime, timedelta
+
+import pytest
+from services.api.src.application.cursor import InvalidCursorError
+from services.api.src.application.get_groups import GetGroups
+from services.api.src.infrastructure.database.models import (
+    ArticleModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
+
+DAY = datetime(2025, 3, 1)
+
+
+@pytest.fixture(autouse=True)
+def groups(session):
+    session.add(SourceModel(id="s1", name="El País", bias="left"))
+    # g1: 4 articles, g2 and g3: 3 each, g4: 1; g3's articles are a week old
+    sizes = {"g1": 4, "g2": 3, "g3": 3, "g4": 1}
+    for group_id, size in sizes.items():
+        session.add(NewsGroupModel(id=group_id, topic_hash=group_id.ljust(16, "0"), created_at=DAY))
+        published = DAY - timedelta(days=7) if group_id == "g3" else DAY
+        for i in range(size):
+            session.add(ArticleModel(
+                id=f"{group_id}-{i}", group_id=group_id, source_id="s1", title=f"{group_id} {i}",
+                link=f"https://example.com/{group_id}/{i}", published_at=published + timedelta(hours=i),
+            ))
+        # Ingest keeps these rows in step with the articles
+        session.add(GroupStatsModel(
+            group_id=group_id, article_count=size, source_count=1, left_count=size, center_count=0,
+            right_count=0, latest_published_at=published + timedelta(hours=size - 1),
+        ))
+    session.add(ArticleModel(id="loose", title="Loose", link="https://example.com/loose", published_at=DAY))
+    session.commit()
+
+
+async def test_execute_ranks_groups_by_article_count(session):
+    result = await GetGroups(session).execute(limit=10, min_articles=2)
+
+    assert [group["id"] for group in result["groups"]] == ["g1", "g2", "g3"]
+    assert len(result["groups"][0]["articles"]) == 4
+    assert result["groups"][0]["articles"][0]["id"] == "g1-3"
+    assert result["groups"][0]["articles"][0]["source"] == "El País"
+    assert result["groups"][0]["created_at"] == DAY.isoformat()
+    assert result["next_cursor"] is None
+
+
+async def test_cursor_pages_through_groups_without_overlap(session):
+    use_case = GetGroups(session)
+
+    first = await use_case.execute(limit=2, min_articles=1)
+    second = await use_case.execute(limit=2, min_articles=1, cursor=first["next_cursor"])
+
+    assert [group["id"] for group in first["groups"]] == ["g1", "g2"]
+    assert [group["id"] for group in second["groups"]] == ["g3", "g4"]
+    assert second["next_cursor"] is None
+
+
+async def test_time_window_counts_only_articles_inside_it(session):
+    result = await GetGroups(session).execute(
+        limit=10, min_articles=2, since=DAY - timedelta(days=1), until=DAY + timedelta(hours=2),
+    )
+
+    # Both groups have two articles in the window, the latest at the same time
+    assert [group["id"] for group in result["groups"]] == ["g2", "g1"]
+    assert [article["id"] for article in result["groups"][1]["articles"]] == ["g1-1", "g1-0"]
+
+
+async def test_ranking_comes_from_the_stats_table(session):
+    session.get(GroupStatsModel, "g4").article_count = 9
+    session.commit()
+
+    result = await GetGroups(session).execute(limit=1)
+
+    # The ranking trusts group_stats; the articles are still read from the page's groups
+    assert result["groups"][0]["id"] == "g4"
+    assert len(result["groups"][0]["articles"]) == 1
+
+
+async def test_undated_articles_come_last_in_their_group(session):
+    session.add(ArticleModel(
+        id="g4-undated", group_id="g4", source_id="s1", title="Undated", link="https://example.com/g4/undated",
+    ))
+    session.commit()
+
+    result = await GetGroups(session).execute(limit=10, min_articles=1)
+
+    g4 = next(group for group in result["groups"] if group["id"] == "g4")
+    assert [article["id"] for article in g4["articles"]] == ["g4-0", "g4-undated"]
+
+
+async def test_invalid_cursor_is_rejected(session):
+    with pytest.raises(InvalidCursorError):
+        await GetGroups(session).execute(cursor="not a cursor")
@@ -1,87 +1,88 @@
-"""Tests for GetNews use case."""
+"""Tests for GetNews use case against an in-memory SQLite database."""
+from datetime import datetime, timedelta
+
 import pytest
-from unittest.mock import AsyncMock
+from services.api.src.application.cursor import InvalidCursorError
 from services.api.src.application.get_news import GetNews
-from tests.factories.source_factory import SourceFactory
-from tests.factories.article_factory import ArticleFactory
-from libs.domain.value_objects.bias import Bias
-
-
-async def test_execute_returns_news_from_all_sources(mock_article_repository, mock_source_repository):
-    source1 = SourceFactory.build(name="El País", bias=Bias.left())
-    source2 = SourceFactory.build(name="ABC", bias=Bias.right())
-    
-    article1 = ArticleFactory.build(title="News 1", source_id=source1.id)
-    article2 = ArticleFactory.build(title="News 2", source_id=source2.id)
-    
-    mock_source_repository.find_all = AsyncMock(return_value=[source1, source2])
-    mock_article_repository.find_by_source_id = AsyncMock(side_effect=[[article1], [article2]])
-    
-    use_case = GetNews(
-        article_repository=mock_article_repository,
-        source_repository=mock_source_repository,
-    )
-    
-    result = await use_case.execute(limit=10)
-    
-    assert len(result) == 2
-    assert result[0]["title"] == "News 1"
-    assert result[0]["source"] == "El País"
-    assert result[0]["bias"] == "left"
-    assert result[1]["title"] == "News 2"
-    assert result[1]["source"] == "ABC"
-    assert result[1]["bias"] == "right"
-    mock_source_repository.find_all.assert_awaited_once()
-    assert mock_article_repository.find_by_source_id.await_count == 2
-
-
-async def test_execute_respects_limit_parameter(mock_article_repository, mock_source_repository):
-    source = SourceFactory.build()
-    all_articles = [ArticleFactory.build(source_id=source.id) for _ in range(5)]
-    limited_articles = all_articles[:3]
-    
-    mock_source_repository.find_all = AsyncMock(return_value=[source])
-    mock_article_repository.find_by_source_id = AsyncMock(return_value=limited_articles)
-    
-    use_case = GetNews(
-        article_repository=mock_article_repository,
-        source_repository=mock_source_repository,
-    )
-    
-    result = await use_case.execute(limit=3)
-    
-    mock_article_repository.find_by_source_id.assert_awaited_once_with(source.id, limit=3)
-    assert len(result) == 3
-
-
-async def test_execute_handles_empty_sources(mock_article_repository, mock_source_repository):
-    mock_source_repository.find_all = AsyncMock(return_value=[])
-    
-    use_case = GetNews(
-        article_repository=mock_article_repository,
-        source_repository=mock_source_repository,
-    )
-    
-    result = await use_case.execute()
-    
-    assert result == []
-    mock_article_repository.find_by_source_id.assert_not_awaited()
-
-
-async def test_execute_handles_articles_without_published_at(mock_article_repository, mock_source_repository):
-    source = SourceFactory.build()
-    article = ArticleFactory.build(source_id=source.id, published_at=None)
-    
-    mock_source_repository.find_all = AsyncMock(return_value=[source])
-    mock_article_repository.find_by_source_id = AsyncMock(return_value=[article])
-    
-    use_case = GetNews(
-        article_repository=mock_article_repository,
-        source_repository=mock_source_repository,
-    )
-    
-    result = await use_case.execute()
-    
-    assert len(result) == 1
-    assert result[0]["published"] is None
+from services.api.src.infrastructure.database.models import ArticleModel, SourceModel
+
+NOW = datetime(2025, 3, 1, 12)
+
+
+@pytest.fixture
+def timeline(session):
+    session.add(SourceModel(id="s1", name="El País", bias="left"))
+    session.add(SourceModel(id="s2", name="ABC", bias="right"))
+    # Sources interleave in time; a2 and a3 share a timestamp
+    published = {"a1": 5, "a2": 3, "a3": 3, "a4": 2, "a5": 1}
+    for i, (article_id, hours_ago) in enumerate(published.items()):
+        session.add(ArticleModel(
+            id=article_id, title=f"News {article_id}", link=f"https://example.com/{article_id}",
+            source_id="s1" if i % 2 == 0 else "s2", published_at=NOW - timedelta(hours=hours_ago),
+        ))
+    session.add(ArticleModel(id="undated", title="Undated", link="https://example.com/undated", source_id="s1"))
+    session.commit()
+
+
+@pytest.mark.usefixtures("timeline")
+async def test_execute_returns_news_from_all_sources_newest_first(session):
+    result = await GetNews(session).execute(limit=10)
+
+    # Undated articles follow the dated ones
+    assert [item["id"] for item in result["news"]] == ["a5", "a4", "a3", "a2", "a1", "undated"]
+    assert result["news"][-1]["published"] is None
+    assert result["news"][0]["source"] == "El País"
+    assert result["news"][0]["bias"] == "left"
+    assert result["news"][1]["source"] == "ABC"
+    assert result["news"][1]["bias"] == "right"
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.usefixtures("timeline")
+async def test_cursor_pages_through_ties_without_overlap(session):
+    use_case = GetNews(session)
+
+    first = await use_case.execute(limit=3)
+    second = await use_case.execute(limit=3, cursor=first["next_cursor"])
+
+    assert [item["id"] for item in first["news"]] == ["a5", "a4", "a3"]
+    assert [item["id"] for item in second["news"]] == ["a2", "a1", "undated"]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.usefixtures("timeline")
+async def test_cursor_pages_into_and_through_the_undated_tail(session):
+    session.add(ArticleModel(id="undated-2", title="Undated 2", link="https://example.com/undated-2", source_id="s2"))
+    session.commit()
+    use_case = GetNews(session)
+
+    first = await use_case.execute(limit=5)
+    second = await use_case.execute(limit=1, cursor=first["next_cursor"])
+    third = await use_case.execute(limit=1, cursor=second["next_cursor"])
+
+    assert [item["id"] for item in first["news"]] == ["a5", "a4", "a3", "a2", "a1"]
+    assert [item["id"] for item in second["news"]] == ["undated-2"]
+    assert [item["id"] for item in third["news"]] == ["undated"]
+    assert third["next_cursor"] is None
+
+
+@pytest.mark.usefixtures("timeline")
+async def test_execute_filters_by_source_and_bias(session):
+    use_case = GetNews(session)
+
+    by_source = await use_case.execute(source_ids=["s2"])
+    by_bias = await use_case.execute(biases=["left"])
+
+    assert [item["id"] for item in by_source["news"]] == ["a4", "a2"]
+    assert [item["id"] for item in by_bias["news"]] == ["a5", "a3", "a1", "undated"]
+
+
+async def test_execute_handles_empty_database(session):
+    result = await GetNews(session).execute()
+
+    assert result == {"news": [], "next_cursor": None}
+
 
+async def test_invalid_cursor_is_rejected(session):
+    with pytest.raises(InvalidCursorError):
+        await GetNews(session).execute(cursor="bm90IGEgZGF0ZQpheA==")
@@ -0,0 +1,392 @@
+"""Tests for IngestNews use case."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from libs.domain.repositories.news_group_repository import NewsGroupRepository
+from libs.domain.repositories.unit_of_work import UnitOfWork
+from libs.domain.services.embedding_service import EmbeddingService
+from libs.domain.value_objects.bias import Bias
+from services.ingest.src.application.ingest_news import IngestNews
+from services.ingest.src.infrastructure.services.rss_parser import FeedFetchResult, RSSParser
+from tests.factories.source_factory import SourceFactory
+
+
+@pytest.fixture
+def mock_news_group_repository():
+    return AsyncMock(spec=NewsGroupRepository)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=UnitOfWork)
+
+
+@pytest.fixture
+def mock_rss_parser():
+    parser = MagicMock(spec=RSSParser)
+    parser.fetch_feed = AsyncMock()
+    return parser
+
+
+@pytest.fixture
+def mock_embedding_service():
+    return MagicMock(spec=EmbeddingService)
+
+
+@pytest.fixture
+def use_case(
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_unit_of_work,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    return IngestNews(
+        source_repository=mock_source_repository,
+        article_repository=mock_article_repository,
+        news_group_repository=mock_news_group_repository,
+        unit_of_work=mock_unit_of_work,
+        rss_parser=mock_rss_parser,
+        embedding_service=mock_embedding_service,
+    )
+
+
+async def test_execute_sends_stored_validators_and_skips_not_modified_feed(
+    use_case, mock_source_repository, mock_article_repository, mock_rss_parser
+):
+    source = SourceFactory.build(etag='"v1"', last_modified="Sat, 17 Oct 2026 08:00:00 GMT")
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(not_modified=True)
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    mock_rss_parser.fetch_feed.assert_awaited_once_with(
+        source.url, etag='"v1"', last_modified="Sat, 17 Oct 2026 08:00:00 GMT"
+    )
+    mock_article_repository.save_many.assert_not_awaited()
+    mock_source_repository.save.assert_not_awaited()
+
+
+async def test_execute_stores_new_validators_after_processing_feed(
+    use_case, mock_source_repository, mock_unit_of_work, mock_rss_parser
+):
+    source = SourceFactory.build()
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(
+        not_modified=False, entries=[], etag='"v2"', last_modified=None
+    )
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    saved_source = mock_source_repository.save.await_args.args[0]
+    assert saved_source.id == source.id
+    assert saved_source.etag == '"v2"'
+    # Staged, then committed by the use case's unit of work
+    assert mock_source_repository.save.await_args.kwargs == {"commit": False}
+    mock_unit_of_work.commit.assert_awaited()
+    mock_unit_of_work.rollback.assert_not_awaited()
+
+
+async def test_execute_embeds_all_new_titles_in_one_batch(
+    use_case,
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    source = SourceFactory.build()
+    entries = [
+        MagicMock(title="Title 1", link="https://example.com/1"),
+        MagicMock(title="Title 2", link="https://example.com/2"),
+        MagicMock(title="Title 2 again", link="https://example.com/2"),
+    ]
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(not_modified=False, entries=entries)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.return_value = [[1.0, 0.0], [0.0, 1.0]]
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    mock_embedding_service.generate_embeddings.assert_called_once_with(["Title 1", "Title 2"])
+    mock_embedding_service.generate_embedding.assert_not_called()
+    mock_article_repository.save_many.assert_awaited_once()
+    assert len(mock_article_repository.save_many.await_args.args[0]) == 2
+
+
+async def test_recent_groups_are_loaded_once_and_new_groups_are_reused(
+    use_case,
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    source = SourceFactory.build()
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+
+    for i in range(2):
+        mock_rss_parser.fetch_feed.return_value = FeedFetchResult(
+            not_modified=False,
+            entries=[MagicMock(title=f"Same story {i}", link=f"https://example.com/{i}")],
+        )
+        await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    mock_news_group_repository.find_recent.assert_awaited_once()
+    assert mock_news_group_repository.save.await_count == 1
+    saved_articles = [a for call in mock_article_repository.save_many.await_args_list for a in call.args[0]]
+    assert saved_articles[0].group_id == saved_articles[1].group_id
+
+
+async def test_failed_feed_is_rolled_back_and_reloads_the_group_index(
+    use_case,
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_unit_of_work,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    source = SourceFactory.build()
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_source_repository.save = AsyncMock(side_effect=[RuntimeError("commit failed"), None])
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(
+        not_modified=False,
+        entries=[MagicMock(title="Story", link="https://example.com/story")],
+    )
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.return_value = [[1.0, 0.0]]
+
+    with pytest.raises(RuntimeError):
+        await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+    mock_unit_of_work.rollback.assert_awaited_once()
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    # The group staged by the failed feed was rolled back, so the index is rebuilt from the database
+    assert mock_news_group_repository.find_recent.await_count == 2
+    assert mock_news_group_repository.save.await_count == 2
+    assert mock_news_group_repository.save.await_args.kwargs == {"commit": False}
+
+
+async def test_repository_search_mode_delegates_matching_to_repository(
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    from tests.factories.news_group_factory import NewsGroupFactory
+    source = SourceFactory.build()
+    group = NewsGroupFactory.build(embedding=[1.0, 0.0])
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(
+        not_modified=False,
+        entries=[MagicMock(title="Story", link="https://example.com/story")],
+    )
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_news_group_repository.find_most_similar = AsyncMock(return_value=[(group, 0.93)])
+    mock_embedding_service.generate_embeddings.return_value = [[1.0, 0.0]]
+    use_case = IngestNews(
+        source_repository=mock_source_repository,
+        article_repository=mock_article_repository,
+        news_group_repository=mock_news_group_repository,
+        unit_of_work=AsyncMock(spec=UnitOfWork),
+        rss_parser=mock_rss_parser,
+        embedding_service=mock_embedding_service,
+        search_groups_in_repository=True,
+    )
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    mock_news_group_repository.find_recent.assert_not_awaited()
+    assert mock_news_group_repository.find_most_similar.await_args.kwargs["k"] == 1
+    assert mock_article_repository.save_many.await_args.args[0][0].group_id == group.id
+    mock_news_group_repository.refresh_stats.assert_awaited_once_with([group.id], commit=False)
+
+
+async def test_execute_filters_known_links_with_a_single_query(
+    use_case,
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    source = SourceFactory.build()
+    entries = [
+        MagicMock(title="Known", link="https://example.com/known"),
+        MagicMock(title="New", link="https://example.com/new"),
+    ]
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(not_modified=False, entries=entries)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_article_repository.find_existing_links = AsyncMock(return_value={"https://example.com/known"})
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.return_value = [[1.0, 0.0]]
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    mock_article_repository.find_existing_links.assert_awaited_once_with(
+        ["https://example.com/known", "https://example.com/new"]
+    )
+    mock_article_repository.find_by_link.assert_not_awaited()
+    mock_embedding_service.generate_embeddings.assert_called_once_with(["New"])
+
+
+async def test_sensationalism_analysis_is_batched_and_concurrent_by_default(
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    import asyncio
+    from libs.domain.services.analysis_service import NewsAnalyzer
+
+    running = 0
+    peak = 0
+    batches = []
+
+    class FakeAnalyzer(NewsAnalyzer):
+        async def analyze_sensationalism(self, title, content):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 0.5, f"explained {title}", {"hechos_count": 1}
+
+        async def analyze_sensationalism_batch(self, items):
+            batches.append(items)
+            return await super().analyze_sensationalism_batch(items)
+
+    analyzer = FakeAnalyzer()
+    source = SourceFactory.build()
+    entries = [MagicMock(title=f"Title {i}", link=f"https://example.com/{i}") for i in range(3)]
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(not_modified=False, entries=entries)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.side_effect = lambda texts: [[1.0, float(i)] for i in range(len(texts))]
+    use_case = IngestNews(
+        source_repository=mock_source_repository,
+        article_repository=mock_article_repository,
+        news_group_repository=mock_news_group_repository,
+        unit_of_work=AsyncMock(spec=UnitOfWork),
+        rss_parser=mock_rss_parser,
+        embedding_service=mock_embedding_service,
+        news_analyzer=analyzer,
+    )
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    assert len(batches) == 1 and [title for title, _ in batches[0]] == ["Title 0", "Title 1", "Title 2"]
+    assert peak == 3
+    saved = mock_article_repository.save_many.await_args.args[0]
+    assert [a.sensationalism_explanation for a in saved] == ["explained Title 0", "explained Title 1", "explained Title 2"]
+    assert all(a.sensationalism_score == 0.5 for a in saved)
+
+
+async def test_matched_group_centroid_moves_in_the_article_transaction(
+    use_case,
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    from datetime import datetime
+    from tests.factories.news_group_factory import NewsGroupFactory
+    source = SourceFactory.build()
+    group = NewsGroupFactory.build(embedding=[1.0, 0.0], member_count=1, created_at=datetime.utcnow())
+    calls = []
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_rss_parser.fetch_feed.return_value = FeedFetchResult(
+        not_modified=False,
+        entries=[MagicMock(title=f"Story {i}", link=f"https://example.com/{i}") for i in range(2)],
+    )
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_article_repository.save_many = AsyncMock(side_effect=lambda articles, commit: calls.append(("save_many", commit)))
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[group])
+    mock_news_group_repository.update_centroids = AsyncMock(
+        side_effect=lambda groups, commit: calls.append(("update", groups[0].member_count, commit))
+    )
+    mock_embedding_service.generate_embeddings.return_value = [[0.8, 0.6], [0.8, 0.6]]
+
+    await use_case.execute(source_name=source.name, source_url=source.url, bias=Bias.left())
+
+    assert calls == [("update", 2, False), ("update", 3, False), ("save_many", False)]
+    moved = mock_news_group_repository.update_centroids.await_args.args[0][0]
+    assert moved.embedding.tolist() == pytest.approx([(1.0 + 0.8 + 0.8) / 3, (0.0 + 0.6 + 0.6) / 3])
+    mock_news_group_repository.save.assert_not_awaited()
+
+
+async def test_concurrent_feeds_never_interleave_their_writes(
+    mock_source_repository,
+    mock_article_repository,
+    mock_news_group_repository,
+    mock_rss_parser,
+    mock_embedding_service,
+):
+    import asyncio
+
+    events = []
+
+    class RecordingUnitOfWork(UnitOfWork):
+        async def commit(self):
+            events.append("commit")
+
+        async def rollback(self):
+            events.append("rollback")
+
+    async def save_many(articles, commit):
+        events.append(f"stage {articles[0].link}")
+        # A later await point inside the write phase must not let another feed commit
+        await asyncio.sleep(0)
+        return len(articles)
+
+    source = SourceFactory.build()
+    mock_source_repository.find_by_name = AsyncMock(return_value=source)
+    mock_rss_parser.entry_to_article = RSSParser.entry_to_article
+    mock_rss_parser.fetch_feed = AsyncMock(side_effect=lambda url, **_: FeedFetchResult(
+        not_modified=False, entries=[MagicMock(title=f"Story {url}", link=url)],
+    ))
+    mock_article_repository.find_existing_links = AsyncMock(return_value=set())
+    mock_article_repository.save_many = AsyncMock(side_effect=save_many)
+    mock_news_group_repository.find_recent = AsyncMock(return_value=[])
+    mock_news_group_repository.find_by_topic_hash = AsyncMock(return_value=None)
+    mock_embedding_service.generate_embeddings.side_effect = lambda texts: [[1.0, 0.0] for _ in texts]
+    use_case = IngestNews(
+        source_repository=mock_source_repository,
+        article_repository=mock_article_repository,
+        news_group_repository=mock_news_group_repository,
+        unit_of_work=RecordingUnitOfWork(),
+        rss_parser=mock_rss_parser,
+        embedding_service=mock_embedding_service,
+    )
+
+    await asyncio.gather(*(
+        use_case.execute(source_name=source.name, source_url=f"https://example.com/{i}", bias=Bias.left())
+        for i in range(2)
+    ))
+
+    # Each feed's staged articles are committed before the other feed stages anything
+    staged = [i for i, event in enumerate(events) if event.startswith("stage")]
+    assert len(staged) == 2
+    assert "commit" in events[staged[0]:staged[1]]
@@ -0,0 +1,83 @@
+"""Tests for IngestScheduler."""
+import asyncio
+
+import pytest
+from libs.domain.value_objects.bias import Bias
+from services.ingest.src.application.ingest_scheduler import FeedJob, IngestScheduler
+
+
+def _job(name: str, url: str) -> FeedJob:
+    return FeedJob(name=name, url=url, bias=Bias.center())
+
+
+async def test_run_returns_one_result_per_job_in_order():
+    jobs = [_job("A", "https://a.example/rss"), _job("B", "https://b.example/rss")]
+
+    async def ingest(job):
+        await asyncio.sleep(0.02 if job.name == "A" else 0)
+
+    results = await IngestScheduler().run(jobs, ingest)
+
+    assert [r.name for r in results] == ["A", "B"]
+    assert all(r.ok for r in results)
+    assert results[0].duration >= 0.02
+
+
+async def test_run_respects_global_concurrency_limit():
+    jobs = [_job(str(i), f"https://host{i}.example/rss") for i in range(6)]
+    running = 0
+    peak = 0
+
+    async def ingest(job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await IngestScheduler(max_concurrency=2, per_host_concurrency=5).run(jobs, ingest)
+
+    assert peak == 2
+
+
+async def test_run_respects_per_host_limit():
+    jobs = [_job(str(i), f"https://same.example/rss/{i}") for i in range(3)]
+    running = 0
+    peak = 0
+
+    async def ingest(job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await IngestScheduler(max_concurrency=5, per_host_concurrency=1).run(jobs, ingest)
+
+    assert peak == 1
+
+
+async def test_run_isolates_failures_and_timeouts():
+    jobs = [
+        _job("boom", "https://a.example/rss"),
+        _job("slow", "https://b.example/rss"),
+        _job("fine", "https://c.example/rss"),
+    ]
+
+    async def ingest(job):
+        if job.name == "boom":
+            raise RuntimeError("feed down")
+        if job.name == "slow":
+            await asyncio.sleep(1)
+
+    results = await IngestScheduler(feed_timeout=0.05).run(jobs, ingest)
+
+    assert results[0].status == "error"
+    assert results[0].error == "feed down"
+    assert results[1].status == "timeout"
+    assert results[2].ok
+
+
+def test_invalid_concurrency_raises_error():
+    with pytest.raises(ValueError):
+        IngestScheduler(max_concurrency=0)
@@ -0,0 +1,28 @@
+"""Unit test fixtures backed by in-memory SQLite databases."""
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+# Importing the models registers their tables on the metadata the fixtures create
+import services.api.src.infrastructure.database.models  # noqa: F401
+from services.ingest.src.infrastructure.database.models import IngestSQLModel
+
+
+def _memory_session(metadata) -> Session:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    metadata.create_all(engine)
+    return Session(engine)
+
+
+@pytest.fixture
+def session():
+    """Session on an empty in-memory database with the API's tables."""
+    with _memory_session(SQLModel.metadata) as session:
+        yield session
+
+
+@pytest.fixture
+def ingest_session():
+    """Session on an empty in-memory database with the ingest service's tables."""
+    with _memory_session(IngestSQLModel.metadata) as session:
+        yield session
@@ -63,3 +63,26 @@ def test_news_group_is_immutable(fake):
     with pytest.raises(FrozenInstanceError):
         group.summary = "New Summary"
 
+
+
+def test_new_group_with_embedding_counts_its_first_member(fake):
+    group = NewsGroup.new(topic_hash=TopicHash.from_title(fake.sentence()), embedding=[1.0, 0.0])
+
+    assert group.member_count == 1
+
+
+def test_add_member_updates_running_centroid(fake):
+    group = NewsGroup.new(topic_hash=TopicHash.from_title(fake.sentence()), embedding=[1.0, 0.0])
+
+    updated = group.add_member([0.0, 1.0]).add_member([0.0, 1.0])
+
+    assert updated.member_count == 3
+    assert updated.embedding.tolist() == pytest.approx([1 / 3, 2 / 3])
+    assert group.member_count == 1 and updated == group
+
+
+def test_add_member_rejects_other_dimensions(fake):
+    group = NewsGroup.new(topic_hash=TopicHash.from_title(fake.sentence()), embedding=[1.0, 0.0])
+
+    with pytest.raises(InvalidDomainError, match="same dimension"):
+        group.add_member([1.0, 0.0, 0.0])
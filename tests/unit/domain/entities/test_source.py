@@ -59,3 +59,14 @@ def test_source_is_immutable(fake):
     with pytest.raises(FrozenInstanceError):
         source.name = "New Name"
 
+
+
+def test_update_feed_validators_returns_new_instance(fake):
+    source = SourceFactory.build()
+
+    updated = source.update_feed_validators(etag='"abc"', last_modified="Sat, 17 Oct 2026 08:00:00 GMT")
+
+    assert updated.id == source.id
+    assert updated.etag == '"abc"'
+    assert updated.last_modified == "Sat, 17 Oct 2026 08:00:00 GMT"
+    assert source.etag is None
@@ -0,0 +1,38 @@
+"""Tests for EmbeddingCodec."""
+import json
+import numpy as np
+import pytest
+from libs.domain.services.embedding_codec import EmbeddingCodec
+
+
+@pytest.fixture
+def vector():
+    return np.random.default_rng(3).normal(size=1536).astype(np.float32)
+
+
+def test_float32_round_trip_is_exact(vector):
+    decoded = EmbeddingCodec("float32").decode(EmbeddingCodec("float32").encode(vector))
+
+    assert decoded.dtype == np.float32
+    assert np.array_equal(decoded, vector)
+
+
+@pytest.mark.parametrize("precision, max_bytes", [("float16", 3100), ("int8", 1550)])
+def test_quantized_round_trip_preserves_direction(vector, precision, max_bytes):
+    blob = EmbeddingCodec(precision).encode(vector.tolist())
+    decoded = EmbeddingCodec.decode(blob)
+
+    cosine = float(decoded @ vector / (np.linalg.norm(decoded) * np.linalg.norm(vector)))
+    assert cosine > 0.999
+    assert len(blob) <= max_bytes < len(json.dumps(vector.astype(float).tolist())) / 10
+
+
+def test_blobs_are_self_describing(vector):
+    blob = EmbeddingCodec("int8").encode(vector)
+
+    assert EmbeddingCodec("float16").decode(blob).shape == (1536,)
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValueError):
+        EmbeddingCodec("float8")
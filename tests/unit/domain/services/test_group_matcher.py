@@ -0,0 +1,131 @@
+"""Tests for GroupMatcher."""
+import numpy as np
+import pytest
+from libs.domain.services.group_matcher import GroupMatcher
+from tests.factories.news_group_factory import NewsGroupFactory
+
+
+def _cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def test_best_match_returns_most_similar_group_above_threshold():
+    near = NewsGroupFactory.build(embedding=[1.0, 0.1, 0.0])
+    far = NewsGroupFactory.build(embedding=[0.0, 1.0, 0.0])
+    matcher = GroupMatcher([far, near])
+
+    group, similarity = matcher.best_match([2.0, 0.0, 0.0], threshold=0.7)
+
+    assert group is near
+    assert similarity == pytest.approx(_cosine([1.0, 0.1, 0.0], [2.0, 0.0, 0.0]), abs=1e-6)
+
+
+def test_best_match_returns_none_below_threshold():
+    matcher = GroupMatcher([NewsGroupFactory.build(embedding=[0.0, 1.0])])
+
+    assert matcher.best_match([1.0, 0.0], threshold=0.7) is None
+
+
+def test_groups_without_embedding_are_ignored():
+    matcher = GroupMatcher([NewsGroupFactory.build(embedding=None)])
+
+    assert len(matcher) == 0
+    assert matcher.best_match([1.0, 0.0], threshold=0.0) is None
+
+
+def test_add_makes_group_matchable():
+    matcher = GroupMatcher([])
+    group = NewsGroupFactory.build(embedding=[0.0, 3.0])
+
+    matcher.add(group)
+
+    assert matcher.best_match([0.0, 1.0], threshold=0.9)[0] is group
+
+
+def test_score_many_matches_brute_force():
+    rng = np.random.default_rng(42)
+    groups = [NewsGroupFactory.build(embedding=rng.normal(size=16).tolist()) for _ in range(20)]
+    queries = rng.normal(size=(5, 16))
+    matcher = GroupMatcher(groups)
+
+    indices, scores = matcher.score_many(queries.tolist())
+
+    for query, index, score in zip(queries, indices, scores):
+        expected = [_cosine(query, g.embedding) for g in groups]
+        assert index == int(np.argmax(expected))
+        assert score == pytest.approx(max(expected), abs=1e-5)
+
+
+def test_score_many_of_no_embeddings_returns_empty_arrays():
+    matcher = GroupMatcher([NewsGroupFactory.build(embedding=[1.0, 0.0])])
+
+    indices, scores = matcher.score_many([])
+
+    assert indices.shape == scores.shape == (0,)
+
+
+def test_many_adds_keep_every_group_matchable():
+    rng = np.random.default_rng(7)
+    groups = [NewsGroupFactory.build(embedding=rng.normal(size=8).tolist()) for _ in range(40)]
+    matcher = GroupMatcher(groups[:3])
+
+    for group in groups[3:]:
+        matcher.add(group)
+
+    assert len(matcher) == 40
+    assert all(matcher.best_match(group.embedding, threshold=0.99)[0] is group for group in groups)
+
+
+def test_query_of_another_dimension_matches_nothing():
+    matcher = GroupMatcher([NewsGroupFactory.build(embedding=[1.0, 0.0])])
+
+    assert matcher.best_match([1.0, 0.0, 0.0], threshold=0.5) is None
+    assert matcher.most_similar([1.0, 0.0, 0.0], threshold=0.5, k=3) == []
+
+
+def test_groups_of_another_dimension_or_model_are_skipped():
+    current = NewsGroupFactory.build(embedding=[1.0, 0.0, 0.0], embedding_model="small")
+    legacy = NewsGroupFactory.build(embedding=[0.9, 0.1, 0.0])
+    resized = NewsGroupFactory.build(embedding=[1.0, 0.0])
+    other_model = NewsGroupFactory.build(embedding=[1.0, 0.0, 0.0], embedding_model="large")
+    matcher = GroupMatcher([resized, other_model, current, legacy], dimension=3, model="small")
+    matcher.add(NewsGroupFactory.build(embedding=[1.0, 0.0, 0.0, 0.0]))
+
+    assert matcher.groups == [current, legacy]
+
+
+def test_remove_created_before_drops_expired_groups():
+    from datetime import datetime, timedelta
+    now = datetime.utcnow()
+    old = NewsGroupFactory.build(embedding=[1.0, 0.0], created_at=now - timedelta(days=2))
+    recent = NewsGroupFactory.build(embedding=[0.0, 1.0], created_at=now)
+    matcher = GroupMatcher([old, recent])
+
+    removed = matcher.remove_created_before(now - timedelta(days=1))
+
+    assert removed == 1
+    assert matcher.groups == [recent]
+    assert matcher.best_match([1.0, 0.0], threshold=0.5) is None
+
+
+def test_most_similar_returns_top_k_above_threshold_in_order():
+    best = NewsGroupFactory.build(embedding=[1.0, 0.0])
+    second = NewsGroupFactory.build(embedding=[1.0, 0.5])
+    unrelated = NewsGroupFactory.build(embedding=[-1.0, 0.0])
+    matcher = GroupMatcher([unrelated, second, best])
+
+    matches = matcher.most_similar([1.0, 0.0], threshold=0.5, k=3)
+
+    assert [group for group, _ in matches] == [best, second]
+    assert matches[0][1] == pytest.approx(1.0)
+
+
+def test_update_replaces_a_group_embedding():
+    group = NewsGroupFactory.build(embedding=[1.0, 0.0])
+    matcher = GroupMatcher([group, NewsGroupFactory.build(embedding=[-1.0, 0.0])])
+
+    matcher.update(group.add_member([0.0, 1.0]).add_member([0.0, 1.0]))
+
+    match, similarity = matcher.best_match([0.0, 1.0], threshold=0.7)
+    assert match.id == group.id and match.member_count == 3
+    assert len(matcher) == 2
@@ -0,0 +1,92 @@
+"""Tests for HnswIndex."""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from libs.domain.services.group_matcher import GroupMatcher
+from libs.domain.services.hnsw_index import HnswIndex
+from tests.factories.news_group_factory import NewsGroupFactory
+
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(1)
+    now = datetime.utcnow()
+    return [
+        NewsGroupFactory.build(embedding=rng.normal(size=32).tolist(), created_at=now - timedelta(hours=i))
+        for i in range(300)
+    ]
+
+
+def test_best_match_agrees_with_brute_force(groups):
+    rng = np.random.default_rng(2)
+    queries = [rng.normal(size=32).tolist() for _ in range(50)]
+    index = HnswIndex(groups)
+    exact = GroupMatcher(groups)
+
+    hits = sum(
+        index.best_match(q, threshold=-1.0)[0] is exact.best_match(q, threshold=-1.0)[0] for q in queries
+    )
+
+    assert hits / len(queries) >= 0.95
+
+
+def test_best_match_respects_threshold(groups):
+    index = HnswIndex(groups[:1])
+
+    assert index.best_match((-np.asarray(groups[0].embedding)).tolist(), threshold=0.5) is None
+
+
+def test_remove_created_before_hides_expired_groups(groups):
+    index = HnswIndex(groups)
+    cutoff = datetime.utcnow() - timedelta(hours=99, minutes=30)
+
+    removed = index.remove_created_before(cutoff)
+
+    assert removed == 200
+    assert len(index) == 100
+    for group in groups[150:160]:
+        match, _ = index.best_match(group.embedding, threshold=-1.0)
+        assert match.created_at >= cutoff
+
+
+def test_save_and_load_roundtrip(groups, tmp_path):
+    index = HnswIndex(groups)
+    path = str(tmp_path / "index.npz")
+
+    index.save(path)
+    loaded = HnswIndex.load(path)
+
+    assert len(loaded) == len(index)
+    for group in groups[:20]:
+        match = loaded.best_match(group.embedding, threshold=0.99)[0]
+        assert match.id == group.id
+        # Raw centroids come back, not the unit vectors the graph searches
+        assert np.allclose(match.embedding, group.embedding, atol=1e-6)
+
+
+def test_incremental_add_is_searchable(groups):
+    index = HnswIndex(groups[:10])
+
+    index.add(groups[50])
+
+    assert index.best_match(groups[50].embedding, threshold=0.99)[0] is groups[50]
+
+
+def test_update_moves_a_group_vector(groups):
+    index = HnswIndex(groups)
+    target = groups[10]
+    moved = groups[200].embedding
+
+    index.update(target.add_member(moved).add_member(moved).add_member(moved))
+
+    match, _ = index.best_match(moved, threshold=0.0)
+    assert match.id in {target.id, groups[200].id}
+    assert len(index) == len(groups)
+
+
+def test_groups_and_queries_of_another_dimension_are_skipped(groups):
+    index = HnswIndex(groups[:10] + [NewsGroupFactory.build(embedding=[1.0, 0.0])], dimension=32)
+
+    assert len(index) == 10
+    assert index.most_similar([1.0, 0.0], threshold=0.0, k=3) == []
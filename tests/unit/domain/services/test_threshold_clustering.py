@@ -0,0 +1,66 @@
+"""Tests for the threshold-graph clustering used by the offline re-clustering job."""
+import numpy as np
+import pytest
+from libs.domain.services.threshold_clustering import (
+    cluster_by_threshold,
+    clustering_quality,
+    connected_components,
+    plan_group_ids,
+)
+
+
+def _unit(*vectors):
+    array = np.asarray(vectors, dtype=np.float32)
+    return array / np.linalg.norm(array, axis=1, keepdims=True)
+
+
+def test_connected_components_follows_chains():
+    labels = connected_components(7, np.array([0, 5, 1, 3]), np.array([1, 6, 2, 1]))
+
+    assert labels.tolist() == [0, 0, 0, 0, 1, 2, 2]
+
+
+def test_connected_components_without_edges_labels_every_node():
+    assert connected_components(3, np.array([]), np.array([])).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 512])
+def test_clustering_is_transitive_and_independent_of_block_size(block_size):
+    # 20 degrees apart (cosine 0.94); the ends of the chain are 60 degrees apart
+    angles = np.radians([0, 60, 20, 40, 120])
+    vectors = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+    labels = cluster_by_threshold(vectors, 0.9, block_size=block_size)
+
+    assert labels[0] == labels[1] == labels[2] == labels[3] != labels[4]
+
+
+def test_time_window_keeps_distant_duplicates_apart():
+    vectors = _unit([1, 0], [1, 0.01], [1, 0.02])
+    timestamps = np.array([100.0, 0.0, 50_000.0])
+
+    labels = cluster_by_threshold(vectors, 0.9, timestamps=timestamps, max_gap=3600, block_size=2)
+
+    assert labels[0] == labels[1] != labels[2]
+
+
+def test_plan_keeps_majority_groups_and_leaves_others_new():
+    labels = np.array([0, 0, 0, 1, 1, 2])
+    current = ["g1", "g1", "g2", "g1", None, None]
+
+    plan = plan_group_ids(current, labels)
+
+    # The largest cluster claims g1 first; the second cannot reuse it
+    assert plan == {0: "g1", 1: None, 2: None}
+
+
+def test_quality_counts_duplicates_and_singletons():
+    vectors = _unit([1, 0], [1, 0.1], [0, 1])
+
+    split = clustering_quality(vectors, ["a", "b", None], threshold=0.9)
+    merged = clustering_quality(vectors, ["a", "a", None], threshold=0.9)
+
+    assert (split.groups, split.singletons, split.duplicate_pairs) == (3, 3, 1)
+    assert (merged.groups, merged.largest, merged.duplicate_pairs) == (2, 2, 0)
+    assert merged.cohesion > 0.99
+    assert "2 groups" in merged.describe()
@@ -0,0 +1 @@
+"""Repository implementation unit tests."""
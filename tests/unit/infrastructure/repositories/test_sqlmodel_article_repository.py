@@ -0,0 +1,62 @@
+"""Tests for SqlModelArticleRepository against an in-memory SQLite database."""
+import pytest
+from sqlmodel import select
+from services.api.src.infrastructure.database.models import ArticleModel, SourceModel
+from services.api.src.infrastructure.repositories.sqlmodel_article_repository import SqlModelArticleRepository
+from tests.factories.article_factory import ArticleFactory
+from tests.factories.source_factory import SourceFactory
+
+
+@pytest.fixture
+def source(session):
+    source = SourceFactory.build()
+    session.add(SourceModel(id=str(source.id), name=source.name, url=source.url, bias=source.bias.value))
+    session.commit()
+    return source
+
+
+async def test_save_many_inserts_all_articles(session, source):
+    repository = SqlModelArticleRepository(session)
+    articles = [ArticleFactory.build(source_id=source.id) for _ in range(3)]
+
+    inserted = await repository.save_many(articles)
+
+    assert inserted == 3
+    assert len(session.exec(select(ArticleModel)).all()) == 3
+
+
+async def test_save_many_skips_existing_links(session, source):
+    repository = SqlModelArticleRepository(session)
+    existing = ArticleFactory.build(source_id=source.id)
+    await repository.save_many([existing])
+    duplicate = ArticleFactory.build(source_id=source.id, link=existing.link)
+    fresh = ArticleFactory.build(source_id=source.id)
+
+    inserted = await repository.save_many([duplicate, fresh])
+
+    assert inserted == 1
+    links = sorted(model.link for model in session.exec(select(ArticleModel)).all())
+    assert links == sorted([existing.link, fresh.link])
+
+
+async def test_save_many_with_no_articles_is_a_no_op(session):
+    assert await SqlModelArticleRepository(session).save_many([]) == 0
+
+
+async def test_find_existing_links_returns_only_stored_links(session, source):
+    repository = SqlModelArticleRepository(session)
+    stored = ArticleFactory.build(source_id=source.id)
+    await repository.save_many([stored])
+
+    existing = await repository.find_existing_links([stored.link, "https://example.com/unknown"])
+
+    assert existing == {stored.link}
+
+
+async def test_save_many_without_commit_joins_the_open_transaction(session, source):
+    repository = SqlModelArticleRepository(session)
+
+    await repository.save_many([ArticleFactory.build(source_id=source.id)], commit=False)
+    session.rollback()
+
+    assert session.exec(select(ArticleModel)).all() == []
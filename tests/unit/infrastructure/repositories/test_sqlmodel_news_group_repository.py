@@ -0,0 +1,27 @@
+"""Tests for the ingest SqlModelNewsGroupRepository against an in-memory SQLite database."""
+import numpy as np
+from libs.domain.entities.news_group import NewsGroup
+from libs.domain.services.embedding_codec import EmbeddingCodec
+from libs.domain.value_objects.topic_hash import TopicHash
+from services.ingest.src.infrastructure.database.models import NewsGroupModel
+from services.ingest.src.infrastructure.repositories.sqlmodel_news_group_repository import (
+    SqlModelNewsGroupRepository,
+)
+
+
+async def test_quantized_copy_does_not_drift_the_running_centroid(ingest_session):
+    repository = SqlModelNewsGroupRepository(ingest_session, embedding_codec=EmbeddingCodec("int8"))
+    rng = np.random.default_rng(3)
+    members = rng.normal(size=(30, 64)).astype(np.float32)
+    group = NewsGroup.new(topic_hash=TopicHash.from_title("story"), embedding=members[0])
+    await repository.save(group)
+
+    for member in members[1:]:
+        group = (await repository.find_by_id(group.id)).add_member(member)
+        await repository.update_centroids([group])
+
+    stored = await repository.find_by_id(group.id)
+    assert stored.member_count == 30
+    # Each update starts from the float32 centroid, not from the int8 copy
+    np.testing.assert_allclose(stored.embedding, members.mean(axis=0), atol=1e-5)
+    assert ingest_session.get(NewsGroupModel, str(group.id)).embedding_blob is not None
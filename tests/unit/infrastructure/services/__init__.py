@@ -0,0 +1 @@
+"""Infrastructure services unit tests."""
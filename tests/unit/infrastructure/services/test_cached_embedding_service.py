@@ -0,0 +1,72 @@
+"""Tests for CachedEmbeddingService."""
+import pytest
+from unittest.mock import MagicMock
+from libs.domain.services.embedding_service import EmbeddingService
+from services.ingest.src.infrastructure.services.cached_embedding_service import CachedEmbeddingService
+from services.ingest.src.infrastructure.services.sqlite_embedding_cache import SqliteEmbeddingCache
+
+
+@pytest.fixture
+def inner():
+    inner = MagicMock(spec=EmbeddingService)
+    inner.generate_embeddings.side_effect = lambda texts: [[float(len(t)), 0.5] for t in texts]
+    return inner
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SqliteEmbeddingCache(str(tmp_path / "embeddings.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_cache_hits_skip_inner_service(inner, cache):
+    service = CachedEmbeddingService(inner=inner, cache=cache, model="m")
+
+    first = service.generate_embeddings(["uno", "dos"])
+    second = service.generate_embeddings(["dos", "uno"])
+
+    assert second == [first[1], first[0]]
+    inner.generate_embeddings.assert_called_once_with(["uno", "dos"])
+    stats = service.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+
+
+def test_repeated_and_whitespace_variants_are_embedded_once(inner, cache):
+    service = CachedEmbeddingService(inner=inner, cache=cache, model="m")
+
+    result = service.generate_embeddings(["Hola  mundo", "Hola mundo ", "Hola mundo"])
+
+    inner.generate_embeddings.assert_called_once_with(["Hola  mundo"])
+    assert result[0] == result[1] == result[2]
+
+
+def test_cache_is_keyed_by_model(inner, cache):
+    CachedEmbeddingService(inner=inner, cache=cache, model="a").generate_embedding("texto")
+    CachedEmbeddingService(inner=inner, cache=cache, model="b").generate_embedding("texto")
+
+    assert inner.generate_embeddings.call_count == 2
+
+
+def test_cache_persists_across_instances(inner, tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    first = SqliteEmbeddingCache(path)
+    CachedEmbeddingService(inner=inner, cache=first, model="m").generate_embedding("texto")
+    first.close()
+
+    second = SqliteEmbeddingCache(path)
+    CachedEmbeddingService(inner=inner, cache=second, model="m").generate_embedding("texto")
+    second.close()
+
+    inner.generate_embeddings.assert_called_once()
+
+
+def test_eviction_keeps_store_within_size_budget(inner, tmp_path):
+    # Each vector is 2 float32 values = 8 bytes
+    cache = SqliteEmbeddingCache(str(tmp_path / "embeddings.sqlite"), max_bytes=16)
+    service = CachedEmbeddingService(inner=inner, cache=cache, model="m")
+
+    service.generate_embeddings(["a", "b", "c"])
+
+    assert cache.stats().size_bytes <= 16
+    cache.close()
@@ -0,0 +1,73 @@
+"""Tests for CachedNewsAnalyzer and SqliteAnalysisCache."""
+import time
+import pytest
+from unittest.mock import AsyncMock
+from libs.domain.services.analysis_service import NewsAnalyzer
+from services.ingest.src.infrastructure.services.cached_news_analyzer import CachedNewsAnalyzer
+from services.ingest.src.infrastructure.services.sqlite_analysis_cache import SqliteAnalysisCache
+
+
+@pytest.fixture
+def inner():
+    inner = AsyncMock(spec=NewsAnalyzer)
+    inner.analyze_sensationalism_batch.side_effect = lambda items: [
+        (0.5, f"explained {title}", {"hechos_count": len(content)}) for title, content in items
+    ]
+    return inner
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SqliteAnalysisCache(str(tmp_path / "analysis.sqlite"))
+    yield cache
+    cache.close()
+
+
+async def test_cached_results_skip_inner_analyzer(inner, cache):
+    analyzer = CachedNewsAnalyzer(inner=inner, cache=cache, model="m", prompt_version="v1")
+
+    first = await analyzer.analyze_sensationalism_batch([("A", "uno"), ("B", "dos"), ("A", "uno")])
+    second = await analyzer.analyze_sensationalism("B", "dos")
+
+    assert first[0] == first[2]
+    assert second == (0.5, "explained B", {"hechos_count": 3})
+    inner.analyze_sensationalism_batch.assert_awaited_once_with([("A", "uno"), ("B", "dos")])
+    assert analyzer.stats().entries == 2
+
+
+async def test_prompt_version_is_part_of_the_key(inner, cache):
+    await CachedNewsAnalyzer(inner=inner, cache=cache, model="m", prompt_version="v1").analyze_sensationalism("A", "x")
+    await CachedNewsAnalyzer(inner=inner, cache=cache, model="m", prompt_version="v2").analyze_sensationalism("A", "x")
+
+    assert inner.analyze_sensationalism_batch.await_count == 2
+
+
+async def test_failed_analyses_are_not_cached(inner, cache):
+    inner.analyze_sensationalism_batch.side_effect = lambda items: [(0.0, "Error: boom", {}) for _ in items]
+    analyzer = CachedNewsAnalyzer(inner=inner, cache=cache, model="m", prompt_version="v1")
+
+    await analyzer.analyze_sensationalism("A", "x")
+    await analyzer.analyze_sensationalism("A", "x")
+
+    assert inner.analyze_sensationalism_batch.await_count == 2
+
+
+def test_expired_entries_are_misses_and_purged(tmp_path):
+    cache = SqliteAnalysisCache(str(tmp_path / "analysis.sqlite"), ttl_seconds=60)
+    cache.put_many("m", "v1", {"old": (0.1, "a", {"k": 1})})
+    cache._store._connection.execute("UPDATE analysis_entry SET created_at = ?", (time.time() - 120,))
+
+    assert cache.get_many("m", "v1", ["old"]) == {}
+    cache.put_many("m", "v1", {"new": (0.2, "b", {"k": 2})})
+
+    assert cache.stats().entries == 1
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted_over_budget(tmp_path):
+    cache = SqliteAnalysisCache(str(tmp_path / "analysis.sqlite"), max_bytes=60)
+    cache.put_many("m", "v1", {"a": (0.1, "x" * 20, {"k": 1})})
+    cache.put_many("m", "v1", {"b": (0.2, "y" * 20, {"k": 2})})
+
+    assert set(cache.get_many("m", "v1", ["a", "b"])) == {"b"}
+    cache.close()
@@ -0,0 +1,51 @@
+"""Tests for the local sensationalism pre-filter."""
+import pytest
+from unittest.mock import AsyncMock
+from libs.domain.services.analysis_service import NewsAnalyzer
+from services.ingest.src.infrastructure.services.lexicon_news_analyzer import LexiconNewsAnalyzer, score_text
+
+NEUTRAL = (
+    "El Gobierno aprueba el presupuesto de 2025",
+    "El Consejo de Ministros aprobó este martes un gasto de 450.000 millones, según fuentes de Hacienda.",
+)
+SENSATIONAL = ("La brutal y vergonzosa humillación", "Un escándalo escalofriante e intolerable.")
+AMBIGUOUS = ("Una decisión polémica", "El pleno vota hoy la reforma del reglamento de la cámara baja.")
+
+
+@pytest.fixture
+def fallback():
+    fallback = AsyncMock(spec=NewsAnalyzer)
+    fallback.analyze_sensationalism_batch.side_effect = lambda items: [(0.3, "llm", {"hechos_count": 2}) for _ in items]
+    return fallback
+
+
+def test_score_text_follows_the_is_formula():
+    estimate = score_text(*SENSATIONAL)
+
+    assert estimate.adjectives == ["brutal", "vergonzosa", "escalofriante", "intolerable"]
+    assert estimate.score == pytest.approx(4 / (4 + estimate.facts))
+
+
+def test_accents_and_inflections_are_matched():
+    assert score_text("Cifras PREOCUPANTES y tragicas", "").adjectives == ["preocupantes", "tragicas"]
+
+
+async def test_only_uncertain_articles_are_escalated(fallback):
+    analyzer = LexiconNewsAnalyzer(fallback=fallback)
+
+    results = await analyzer.analyze_sensationalism_batch([NEUTRAL, AMBIGUOUS, SENSATIONAL])
+
+    fallback.analyze_sensationalism_batch.assert_awaited_once_with([AMBIGUOUS])
+    assert results[0][0] == 0.0 and results[0][2]["analyzer"] == "lexicon"
+    assert results[1] == (0.3, "llm", {"hechos_count": 2})
+    assert results[2][0] >= 0.6
+    assert (analyzer.local_count, analyzer.escalated_count) == (2, 1)
+
+
+async def test_short_neutral_texts_are_escalated(fallback):
+    analyzer = LexiconNewsAnalyzer(fallback=fallback)
+
+    await analyzer.analyze_sensationalism("Última hora", "")
+
+    fallback.analyze_sensationalism_batch.assert_awaited_once()
+    assert analyzer.escalation_rate == 1.0
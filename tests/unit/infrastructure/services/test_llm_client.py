@@ -0,0 +1,89 @@
+"""Tests for OpenAINewsAnalyzer."""
+import json
+import httpx
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from openai import BadRequestError, RateLimitError
+from services.ingest.src.infrastructure.services.llm_client import OpenAINewsAnalyzer
+
+
+def _completion(payload: dict):
+    message = SimpleNamespace(content=json.dumps(payload))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _error(cls, status: int):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return cls("error", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = OpenAINewsAnalyzer(api_key="test-key", backoff_base=0.0)
+    analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock())))
+    return analyzer
+
+
+async def test_rate_limited_requests_are_retried(analyzer):
+    analyzer.client.chat.completions.create.side_effect = [
+        _error(RateLimitError, 429),
+        _completion({"indice_sensacionalismo": 0.25, "explicacion_breve": "ok", "hechos_count": 3}),
+    ]
+
+    score, explanation, metadata = await analyzer.analyze_sensationalism("Titulo", "Descripcion")
+
+    assert score == 0.25
+    assert explanation == "ok"
+    assert metadata["hechos_count"] == 3
+    assert analyzer.client.chat.completions.create.await_count == 2
+
+
+async def test_client_errors_are_not_retried(analyzer):
+    analyzer.client.chat.completions.create.side_effect = _error(BadRequestError, 400)
+
+    score, explanation, _ = await analyzer.analyze_sensationalism("Titulo", "Descripcion")
+
+    assert score == 0.0
+    assert explanation.startswith("Error:")
+    assert analyzer.client.chat.completions.create.await_count == 1
+
+
+async def test_batch_scores_several_articles_in_one_request(analyzer):
+    analyzer.client.chat.completions.create.return_value = _completion({"resultados": [
+        {"id": "1", "indice_sensacionalismo": 0.8, "explicacion_breve": "b", "hechos_count": 1},
+        {"id": "0", "indice_sensacionalismo": 0.1, "explicacion_breve": "a", "hechos_count": 4},
+    ]})
+
+    results = await analyzer.analyze_sensationalism_batch([("T0", "D0"), ("T1", "D1")])
+
+    assert [(score, explanation) for score, explanation, _ in results] == [(0.1, "a"), (0.8, "b")]
+    assert results[0][2]["hechos_count"] == 4
+    assert analyzer.client.chat.completions.create.await_count == 1
+
+
+async def test_batch_falls_back_to_single_requests_for_invalid_items(analyzer):
+    analyzer.client.chat.completions.create.side_effect = [
+        _completion({"resultados": [
+            {"id": "0", "indice_sensacionalismo": 0.3, "explicacion_breve": "a"},
+            {"id": "1", "indice_sensacionalismo": 7, "explicacion_breve": "out of range"},
+        ]}),
+        _completion({"indice_sensacionalismo": 0.6, "explicacion_breve": "single", "hechos_count": 2}),
+    ]
+
+    results = await analyzer.analyze_sensationalism_batch([("T0", "D0"), ("T1", "D1")])
+
+    assert [(score, explanation) for score, explanation, _ in results] == [(0.3, "a"), (0.6, "single")]
+    assert analyzer.client.chat.completions.create.await_count == 2
+
+
+async def test_rate_limited_batch_is_left_unscored_without_single_fallbacks(analyzer):
+    analyzer._max_retries = 1
+    analyzer.client.chat.completions.create.side_effect = _error(RateLimitError, 429)
+
+    results = await analyzer.analyze_sensationalism_batch([("T0", "D0"), ("T1", "D1"), ("T2", "D2")])
+
+    assert [score for score, _, _ in results] == [None, None, None]
+    assert all(metadata == {} for _, _, metadata in results)
+    # The initial attempt and its retry; no per-article requests on top
+    assert analyzer.client.chat.completions.create.await_count == 2
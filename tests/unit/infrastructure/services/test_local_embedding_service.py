@@ -0,0 +1,71 @@
+"""Tests for LocalEmbeddingService (model runtimes are replaced by a fake encoder)."""
+import threading
+import numpy as np
+import pytest
+from services.ingest.src.infrastructure.services.local_embedding_service import LocalEmbeddingService
+
+
+def _fake_encoder(calls):
+    def encode(batch):
+        calls.append((threading.get_ident(), list(batch)))
+        return np.asarray([[float(len(text)), 1.0, 0.0] for text in batch])
+    return encode
+
+
+def test_model_is_loaded_lazily_and_once(tmp_path, monkeypatch):
+    loads = []
+    service = LocalEmbeddingService(str(tmp_path), batch_size=2)
+    monkeypatch.setattr(service, "_load_encoder", lambda: loads.append(1) or _fake_encoder([]))
+
+    assert loads == []
+    service.generate_embeddings(["uno"])
+    service.generate_embeddings(["dos"])
+
+    assert loads == [1]
+
+
+def test_batches_keep_input_order_and_are_normalized(tmp_path, monkeypatch):
+    calls = []
+    service = LocalEmbeddingService(str(tmp_path), batch_size=2, max_workers=3)
+    monkeypatch.setattr(service, "_load_encoder", lambda: _fake_encoder(calls))
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    vectors = np.asarray(service.generate_embeddings(texts))
+
+    assert sorted(batch for _, batch in calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert list(np.argsort(vectors[:, 0])) == [0, 1, 2, 3, 4]
+    assert service.calculate_similarity(vectors[0].tolist(), vectors[0].tolist()) == pytest.approx(1.0)
+
+
+def test_empty_text_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LocalEmbeddingService(str(tmp_path)).generate_embeddings(["ok", "  "])
+
+
+def test_missing_model_directory_fails_on_first_use(tmp_path):
+    service = LocalEmbeddingService(str(tmp_path / "missing"))
+
+    with pytest.raises(FileNotFoundError):
+        service.generate_embedding("hola")
+
+
+def test_model_id_tells_same_named_directories_apart(tmp_path):
+    first, second = tmp_path / "a" / "minilm", tmp_path / "b" / "minilm"
+    first.mkdir(parents=True)
+    second.mkdir(parents=True)
+    (first / "model.onnx").write_bytes(b"weights v1")
+    (second / "model.onnx").write_bytes(b"weights v2")
+
+    assert LocalEmbeddingService(str(first)).model.startswith("local:minilm:")
+    assert LocalEmbeddingService(str(first)).model != LocalEmbeddingService(str(second)).model
+
+
+def test_model_id_changes_when_weights_are_replaced(tmp_path):
+    weights = tmp_path / "model.onnx"
+    weights.write_bytes(b"weights v1")
+    before = LocalEmbeddingService(str(tmp_path)).model
+
+    weights.write_bytes(b"retrained weights")
+
+    assert LocalEmbeddingService(str(tmp_path)).model != before
@@ -0,0 +1,56 @@
+"""Tests for OpenAIEmbeddingService."""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from services.ingest.src.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+
+
+def _fake_create(model, input, **options):
+    # Return vectors out of order to check the service reorders by index
+    data = [SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+@pytest.fixture
+def service():
+    service = OpenAIEmbeddingService(api_key="test-key", max_batch_items=2, max_batch_tokens=1000)
+    service._client = MagicMock()
+    service._client.embeddings.create.side_effect = _fake_create
+    return service
+
+
+def test_generate_embeddings_returns_vectors_in_input_order(service):
+    result = service.generate_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+def test_generate_embeddings_chunks_by_item_limit(service):
+    service.generate_embeddings(["a", "b", "c", "d", "e"])
+
+    batches = [call.kwargs["input"] for call in service._client.embeddings.create.call_args_list]
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_generate_embeddings_chunks_by_token_limit(service):
+    long_text = "x" * 2400
+
+    service.generate_embeddings([long_text, long_text])
+
+    assert service._client.embeddings.create.call_count == 2
+
+
+def test_generate_embeddings_rejects_empty_text(service):
+    with pytest.raises(ValueError, match="Text cannot be empty"):
+        service.generate_embeddings(["ok", "  "])
+
+
+def test_dimensions_are_requested_and_part_of_the_model_key():
+    service = OpenAIEmbeddingService(api_key="test-key", dimensions=256)
+    service._client = MagicMock()
+    service._client.embeddings.create.side_effect = _fake_create
+
+    service.generate_embeddings(["a"])
+
+    assert service._client.embeddings.create.call_args.kwargs["dimensions"] == 256
+    assert service.model == "text-embedding-3-small@256"
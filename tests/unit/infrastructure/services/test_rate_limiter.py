@@ -0,0 +1,54 @@
+"""Tests for TokenBucketRateLimiter."""
+import pytest
+from services.ingest.src.infrastructure.services.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+async def test_requests_within_budget_do_not_wait():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(requests_per_minute=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+async def test_request_over_budget_waits_for_refill():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep)
+    for _ in range(60):
+        await limiter.acquire()
+
+    await limiter.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+async def test_token_budget_is_enforced():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(
+        requests_per_minute=1000, tokens_per_minute=600, clock=clock, sleep=clock.sleep
+    )
+    await limiter.acquire(tokens=600)
+
+    await limiter.acquire(tokens=300)
+
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+
+
+def test_invalid_limits_raise_error():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(requests_per_minute=0)
@@ -0,0 +1,25 @@
+"""Tests for the Float32Vector column type."""
+import numpy as np
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+from libs.infrastructure.database.types import Float32Vector
+
+
+def test_vectors_round_trip_as_float32_views():
+    metadata = MetaData()
+    table = Table("vectors", metadata, Column("id", Integer, primary_key=True), Column("embedding", Float32Vector))
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(table), [
+            {"id": 1, "embedding": [0.5, -1.25, 3.0]},
+            {"id": 2, "embedding": np.array([1.0, 2.0], dtype=np.float64)},
+            {"id": 3, "embedding": None},
+        ])
+        stored = connection.exec_driver_sql("SELECT embedding FROM vectors WHERE id = 1").scalar()
+        rows = dict(connection.execute(select(table.c.id, table.c.embedding)).all())
+
+    assert stored == np.array([0.5, -1.25, 3.0], dtype="<f4").tobytes()
+    assert rows[1].dtype == np.float32 and rows[1].tolist() == [0.5, -1.25, 3.0]
+    assert rows[2].tolist() == [1.0, 2.0]
+    assert rows[3] is None
@@ -0,0 +1,66 @@
+"""Tests for the incremental group_stats refresh."""
+from datetime import datetime, timedelta
+
+from services.ingest.src.infrastructure.database.group_stats import refresh_group_stats
+from services.ingest.src.infrastructure.database.models import (
+    ArticleModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
+
+DAY = datetime(2025, 3, 1)
+
+
+def _article(article_id, group_id, source_id, hours, score=None):
+    return ArticleModel(
+        id=article_id, group_id=group_id, source_id=source_id, title=article_id,
+        link=f"https://example.com/{article_id}", published_at=DAY + timedelta(hours=hours),
+        sensationalism_score=score,
+    )
+
+
+def _seed(session):
+    session.add(SourceModel(id="s1", name="Left", url="https://left.example.com/rss", bias="left"))
+    session.add(SourceModel(id="s2", name="Right", url="https://right.example.com/rss", bias="right"))
+    session.add(NewsGroupModel(id="g1", topic_hash="g1".ljust(16, "0"), created_at=DAY))
+    session.add(NewsGroupModel(id="g2", topic_hash="g2".ljust(16, "0"), created_at=DAY))
+    session.add(_article("a1", "g1", "s1", 1, score=0.2))
+    session.add(_article("a2", "g2", "s2", 2))
+    session.commit()
+
+
+def test_rows_are_inserted_then_updated_in_place(ingest_session):
+    _seed(ingest_session)
+    refresh_group_stats(ingest_session, ["g1"])
+    ingest_session.commit()
+
+    stats = ingest_session.get(GroupStatsModel, "g1")
+    assert (stats.article_count, stats.source_count, stats.left_count, stats.right_count) == (1, 1, 1, 0)
+    assert stats.latest_published_at == DAY + timedelta(hours=1)
+    # Only the requested groups are touched
+    assert ingest_session.get(GroupStatsModel, "g2") is None
+
+    ingest_session.add(_article("a3", "g1", "s2", 5, score=0.6))
+    ingest_session.commit()
+    refresh_group_stats(ingest_session, ["g1"])
+    ingest_session.commit()
+
+    ingest_session.refresh(stats)
+    assert (stats.article_count, stats.source_count, stats.left_count, stats.right_count) == (2, 2, 1, 1)
+    assert stats.latest_published_at == DAY + timedelta(hours=5)
+    assert abs(stats.sensationalism_mean - 0.4) < 1e-9
+
+
+def test_groups_left_without_articles_lose_their_row(ingest_session):
+    _seed(ingest_session)
+    refresh_group_stats(ingest_session, ["g1", "g2"])
+    ingest_session.commit()
+
+    ingest_session.get(ArticleModel, "a2").group_id = "g1"
+    ingest_session.commit()
+    refresh_group_stats(ingest_session, ["g1", "g2"])
+    ingest_session.commit()
+
+    assert ingest_session.get(GroupStatsModel, "g1").article_count == 2
+    assert ingest_session.get(GroupStatsModel, "g2") is None
@@ -0,0 +1,105 @@
+"""Tests for the versioned response cache behind the API routes."""
+import json
+from datetime import datetime
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from services.api.src.infrastructure.api.response_cache import (
+    InMemoryCacheBackend,
+    ResponseCache,
+    dumps,
+)
+
+
+def _client(cache, calls):
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request, limit: int = 10):
+        async def compute():
+            calls.append(limit)
+            if limit < 0:
+                raise HTTPException(status_code=400, detail="negative limit")
+            return {"items": list(range(limit)), "title": "Año"}
+
+        return await cache.respond(request, compute)
+
+    return TestClient(app)
+
+
+def test_responses_are_cached_per_query_and_data_version():
+    version = {"value": "1"}
+    calls = []
+    cache = ResponseCache(InMemoryCacheBackend(), lambda: version["value"], version_check_interval=0)
+    client = _client(cache, calls)
+
+    first = client.get("/items?limit=2")
+    second = client.get("/items?limit=2")
+    client.get("/items?limit=3")
+    version["value"] = "2"
+    after_ingest = client.get("/items?limit=2")
+
+    assert first.json() == {"items": [0, 1], "title": "Año"}
+    assert second.content == first.content and second.headers["etag"] == first.headers["etag"]
+    assert calls == [2, 3, 2]
+    assert after_ingest.headers["etag"] != first.headers["etag"]
+
+
+def test_matching_if_none_match_gets_an_empty_304():
+    cache = ResponseCache(InMemoryCacheBackend(), lambda: "1")
+    client = _client(cache, [])
+    etag = client.get("/items").headers["etag"]
+
+    revalidated = client.get("/items", headers={"If-None-Match": f'W/{etag}, "other"'})
+    stale = client.get("/items", headers={"If-None-Match": '"1-0000000000000000"'})
+
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert stale.status_code == 200
+
+
+def test_errors_are_not_cached():
+    calls = []
+    client = _client(ResponseCache(InMemoryCacheBackend(), lambda: "1"), calls)
+
+    assert client.get("/items?limit=-1").status_code == 400
+    assert client.get("/items?limit=-1").status_code == 400
+    assert calls == [-1, -1]
+
+
+def test_in_memory_backend_expires_and_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("expired", b"x", ttl=0)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+
+    assert backend.get("expired") is None
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (b"1", None, b"3")
+
+
+def test_dumps_writes_compact_utf8_and_stringifies_unknown_types():
+    payload = {"title": "Año", "when": datetime(2025, 3, 1)}
+
+    encoded = dumps(payload)
+
+    assert "Año".encode() in encoded
+    assert json.loads(encoded)["when"].startswith("2025-03-01")
+
+
+def test_large_bodies_are_served_precompressed_to_clients_that_accept_them():
+    calls = []
+    client = _client(ResponseCache(InMemoryCacheBackend(), lambda: "1"), calls)
+
+    raw = client.get("/items?limit=500", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/items?limit=500", headers={"Accept-Encoding": "gzip"})
+    refused = client.get("/items?limit=500", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert calls == [500]
+    assert "content-encoding" not in raw.headers and "content-encoding" not in refused.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    # Each representation has its own validator
+    assert compressed.headers["etag"] != raw.headers["etag"]
+    assert compressed.json() == raw.json() and len(raw.content) > 1024
@@ -0,0 +1,88 @@
+"""Offline round trip of the sensationalism Batch API backfill."""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+from services.ingest.src import backfill_sensationalism as backfill
+from services.ingest.src.infrastructure.database.models import (
+    ArticleModel,
+    DataVersionModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
+
+
+def _result(custom_id, score, status_code=200):
+    content = json.dumps({"indice_sensacionalismo": score, "explicacion_breve": "e", "hechos_count": 1})
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": {"choices": [{"message": {"content": content}}]}},
+        "error": None,
+    }
+
+
+@pytest.fixture
+def articles(ingest_session):
+    ingest_session.add(SourceModel(id="s1", name="Source", url="https://example.com/rss", bias="left"))
+    ingest_session.add(NewsGroupModel(id="g1", topic_hash="g1".ljust(16, "0"), created_at=datetime(2025, 3, 1)))
+    for i in range(5):
+        ingest_session.add(ArticleModel(
+            id=f"a{i}", title=f"Title {i}", link=f"https://example.com/{i}", source_id="s1",
+            group_id="g1" if i in (0, 1) else None, sensationalism_score=0.9 if i == 4 else None,
+        ))
+    ingest_session.commit()
+
+
+@pytest.mark.usefixtures("articles")
+def test_prepare_and_apply_round_trip(ingest_session, tmp_path):
+    requests_path, results_path = tmp_path / "requests.jsonl", tmp_path / "results.jsonl"
+
+    written, paths = backfill.write_batch_requests(ingest_session, str(requests_path), page_size=2)
+
+    requests = [json.loads(line) for line in requests_path.read_text().splitlines()]
+    assert (written, paths) == (4, [str(requests_path)])
+    assert [request["custom_id"] for request in requests] == ["a0", "a1", "a2", "a3"]
+
+    results = [_result(request["custom_id"], 0.1 * i) for i, request in enumerate(requests[:3])]
+    results.append({"custom_id": "a3", "response": None, "error": {"code": "server_error"}})
+    results_path.write_text("\n".join(json.dumps(result) for result in results))
+
+    assert backfill.apply_batch_results(ingest_session, str(results_path)) == (3, 1)
+    # Already scored articles are left alone, so a second apply is harmless
+    assert backfill.apply_batch_results(ingest_session, str(results_path)) == (0, 1)
+    scores = {a.id: a.sensationalism_score for a in ingest_session.exec(select(ArticleModel)).all()}
+    assert scores == {"a0": 0.0, "a1": 0.1, "a2": 0.2, "a3": None, "a4": 0.9}
+    # The touched group's stats and the data version follow the new scores
+    assert abs(ingest_session.get(GroupStatsModel, "g1").sensationalism_mean - 0.05) < 1e-9
+    assert ingest_session.get(DataVersionModel, 1).version == 1
+
+
+@pytest.mark.usefixtures("articles")
+def test_prepare_splits_requests_across_files(ingest_session, tmp_path):
+    requests_path = tmp_path / "requests.jsonl"
+
+    written, paths = backfill.write_batch_requests(ingest_session, str(requests_path), max_requests_per_file=3)
+
+    assert written == 4
+    assert paths == [str(requests_path), str(tmp_path / "requests.1.jsonl")]
+    custom_ids = [[json.loads(line)["custom_id"] for line in Path(path).read_text().splitlines()] for path in paths]
+    assert custom_ids == [["a0", "a1", "a2"], ["a3"]]
+
+
+def test_unusable_result_lines_are_skipped_not_fatal():
+    lines = [
+        json.dumps(_result("a0", 0.3)),
+        json.dumps({k: v for k, v in _result("a1", 0.3).items() if k != "custom_id"}),
+        "not json",
+        json.dumps(["a", "list"]),
+        json.dumps(_result("a2", 0.3, status_code=500)),
+        "",
+    ]
+
+    rows, skipped = backfill.parse_batch_results(lines)
+
+    assert [row["article_id"] for row in rows] == ["a0"]
+    assert skipped == 4
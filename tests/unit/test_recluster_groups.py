@@ -0,0 +1,105 @@
+"""Offline round trip of the re-clustering job.
+
+Titles are embedded by a fake service that maps each story to its own direction.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlmodel import select
+from services.ingest.src import recluster_groups
+from services.ingest.src.infrastructure.database.models import (
+    ArticleModel,
+    GroupStatsModel,
+    NewsGroupModel,
+    SourceModel,
+)
+
+DAY = datetime(2025, 3, 1)
+
+
+class StoryEmbeddings:
+    def generate_embeddings(self, texts):
+        return [
+            [1.0, 0.0, 0.0] if t.startswith("budget") else [0.0, 1.0, 0.0] if t.startswith("storm") else [0.0, 0.0, 1.0]
+            for t in texts
+        ]
+
+
+@pytest.fixture
+def split_stories(ingest_session):
+    ingest_session.add(SourceModel(id="s1", name="Source", url="https://example.com/rss", bias="left"))
+    for group_id in ("g1", "g2", "g3"):
+        ingest_session.add(NewsGroupModel(id=group_id, topic_hash=group_id.ljust(16, "0"), member_count=1, created_at=DAY))
+    # The budget story was split across g1 and g2; g3 mixes a storm and an unrelated article
+    articles = [
+        ("a1", "g1", "budget passes"), ("a2", "g1", "budget approved"), ("a3", "g2", "budget vote"),
+        ("a4", "g3", "storm hits coast"), ("a5", "g3", "football final"), ("a6", "g2", "storm damage"),
+        ("old", "g2", "budget history"),
+    ]
+    for i, (article_id, group_id, title) in enumerate(articles):
+        published = DAY - timedelta(days=30) if article_id == "old" else DAY + timedelta(hours=i)
+        ingest_session.add(ArticleModel(
+            id=article_id, group_id=group_id, title=title, source_id="s1",
+            link=f"https://example.com/{article_id}", published_at=published,
+        ))
+    ingest_session.commit()
+
+
+def _recluster(session, apply=True):
+    return recluster_groups.recluster(
+        session, StoryEmbeddings(), since=DAY, until=DAY + timedelta(days=1), apply=apply,
+    )
+
+
+@pytest.mark.usefixtures("split_stories")
+def test_apply_merges_split_stories_and_splits_mixed_groups(ingest_session):
+    report = _recluster(ingest_session)
+
+    assert (report.before.groups, report.after.groups) == (3, 3)
+    assert report.after.duplicate_pairs == 0
+    assignments = {a.id: a.group_id for a in ingest_session.exec(select(ArticleModel)).all()}
+    # Budget keeps g1, storm keeps g3 and the unrelated article gets a new group
+    assert assignments["a1"] == assignments["a2"] == assignments["a3"] == "g1"
+    assert assignments["a4"] == assignments["a6"] == "g3"
+    assert assignments["a5"] not in {"g1", "g2", "g3"}
+    # g2 still holds an article outside the range, so it is kept
+    assert assignments["old"] == "g2"
+    groups = {g.id: g.member_count for g in ingest_session.exec(select(NewsGroupModel)).all()}
+    assert groups == {"g1": 3, "g2": 1, "g3": 2, assignments["a5"]: 1}
+    assert (report.moved, report.created, report.deleted) == (3, 1, 0)
+    # Summary rows of every touched group are rebuilt in the same transaction
+    stats = {s.group_id: [s.article_count, s.left_count] for s in ingest_session.exec(select(GroupStatsModel)).all()}
+    assert stats == {group_id: [count, count] for group_id, count in groups.items()}
+
+
+@pytest.mark.usefixtures("split_stories")
+def test_dry_run_leaves_the_database_untouched(ingest_session):
+    report = _recluster(ingest_session, apply=False)
+
+    assert report.moved == 3
+    assert ingest_session.get(ArticleModel, "a3").group_id == "g2"
+    assert sorted(g.id for g in ingest_session.exec(select(NewsGroupModel)).all()) == ["g1", "g2", "g3"]
+
+
+def test_centroids_blend_in_members_outside_the_range(ingest_session):
+    ingest_session.add(SourceModel(id="s1", name="Source", url="https://example.com/rss", bias="left"))
+    # g1's stored centroid stands for its one article from last month
+    ingest_session.add(NewsGroupModel(
+        id="g1", topic_hash="g1".ljust(16, "0"), member_count=1, created_at=DAY, embedding=[0.0, 0.0, 1.0],
+    ))
+    titles = {"old": "archive piece", "a1": "budget passes", "a2": "budget approved", "a3": "budget vote"}
+    for i, (article_id, title) in enumerate(titles.items()):
+        published = DAY - timedelta(days=30) if article_id == "old" else DAY + timedelta(hours=i)
+        ingest_session.add(ArticleModel(
+            id=article_id, group_id="g1", title=title, source_id="s1",
+            link=f"https://example.com/{article_id}", published_at=published,
+        ))
+    ingest_session.commit()
+
+    _recluster(ingest_session)
+
+    group = ingest_session.get(NewsGroupModel, "g1")
+    ingest_session.refresh(group)
+    assert group.member_count == 4
+    assert np.allclose(group.embedding, [0.75, 0.0, 0.25])